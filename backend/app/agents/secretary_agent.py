@@ -6,7 +6,10 @@ This is the primary agent that handles user interactions and orchestrates tasks.
 
 from __future__ import annotations
 
+from typing import Optional
+
 from google.adk import Agent
+from google.adk.agents.llm_agent import BeforeModelCallback
 
 from app.agents.prompts.secretary_prompt import SECRETARY_SYSTEM_PROMPT
 from app.interfaces.agent_task_repository import IAgentTaskRepository
@@ -41,6 +44,7 @@ def create_secretary_agent(
     memory_repo: IMemoryRepository,
     agent_task_repo: IAgentTaskRepository,
     user_id: str,
+    before_model_callback: Optional[BeforeModelCallback] = None,
 ) -> Agent:
     """
     Create the main Secretary Agent with all tools.
@@ -51,6 +55,8 @@ def create_secretary_agent(
         memory_repo: Memory repository
         agent_task_repo: Agent task repository
         user_id: User ID
+        before_model_callback: Called with each model request before it is sent
+            (e.g. ContextCompactor)
 
     Returns:
         Configured ADK Agent instance
@@ -84,6 +90,7 @@ def create_secretary_agent(
         model=model,
         instruction=SECRETARY_SYSTEM_PROMPT,
         tools=tools,
+        before_model_callback=before_model_callback,
     )
 
     return agent
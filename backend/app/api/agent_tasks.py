@@ -7,10 +7,11 @@ Endpoints for managing autonomous agent actions.
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from app.api.deps import CurrentUser, AgentTaskRepo
+from app.api.deps import CurrentUser, AgentTaskRepo, PageCursor
 from app.core.exceptions import NotFoundError
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.models.agent_task import AgentTask, AgentTaskCreate, AgentTaskUpdate
 from app.models.enums import AgentTaskStatus
 
@@ -47,17 +48,24 @@ async def get_agent_task(
 async def list_agent_tasks(
     user: CurrentUser,
     repo: AgentTaskRepo,
+    response: Response,
+    after: PageCursor,
     status: Optional[AgentTaskStatus] = Query(None, description="Filter by status"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
 ):
-    """List agent tasks with optional filters."""
-    return await repo.list(
+    """List agent tasks with optional filters (cursor in X-Next-Cursor header)."""
+    agent_tasks = await repo.list(
         user.id,
         status=status,
         limit=limit,
         offset=offset,
+        after=after,
     )
+    cursor = next_cursor(agent_tasks, limit, key=lambda task: (task.trigger_time, task.id))
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return agent_tasks
 
 
 @router.patch("/{task_id}", response_model=AgentTask)
@@ -7,12 +7,13 @@ Endpoints for storing and retrieving user input captures.
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app.api.deps import (
     CurrentUser,
     CaptureRepo,
     LLMProvider,
+    PageCursor,
     TaskRepo,
     ProjectRepo,
     MemoryRepo,
@@ -23,6 +24,7 @@ from app.api.deps import (
     ChatRepo,
 )
 from app.core.exceptions import NotFoundError
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.models.capture import Capture, CaptureCreate
 from app.services.agent_service import AgentService
 
@@ -100,17 +102,24 @@ async def get_capture(
 async def list_captures(
     user: CurrentUser,
     repo: CaptureRepo,
+    response: Response,
+    after: PageCursor,
     processed: Optional[bool] = Query(None, description="Filter by processed status"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
 ):
-    """List captures with optional filters."""
-    return await repo.list(
+    """List captures with optional filters (cursor in X-Next-Cursor header)."""
+    captures = await repo.list(
         user.id,
         processed=processed,
         limit=limit,
         offset=offset,
+        after=after,
     )
+    cursor = next_cursor(captures, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return captures
 
 
 @router.post("/{capture_id}/process", response_model=Capture)
@@ -5,9 +5,10 @@ Main interface for user interaction with the secretary agent.
 """
 
 import json
+from datetime import datetime
 from typing import AsyncGenerator
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 
 from app.api.deps import (
@@ -19,8 +20,10 @@ from app.api.deps import (
     AgentTaskRepo,
     CaptureRepo,
     ChatRepo,
+    PageCursor,
 )
 from app.core.exceptions import LLMError
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.models.chat import ChatRequest, ChatResponse
 from app.services.agent_service import AgentService
 
@@ -185,8 +188,11 @@ async def get_history(
     agent_task_repo: AgentTaskRepo,
     capture_repo: CaptureRepo,
     chat_repo: ChatRepo,
+    response: Response,
+    after: PageCursor,
+    limit: int = Query(500, ge=1, le=1000),
 ):
-    """Get message history for a specific session."""
+    """Get message history for a specific session (cursor in X-Next-Cursor header)."""
     agent_service = AgentService(
         llm_provider=llm_provider,
         task_repo=task_repo,
@@ -196,5 +202,20 @@ async def get_history(
         capture_repo=capture_repo,
         chat_repo=chat_repo,
     )
-    return await agent_service.get_session_messages(user.id, session_id)
+    messages = await agent_service.get_session_messages(
+        user.id,
+        session_id,
+        limit=limit,
+        after=after,
+    )
+    # Only persisted history carries ids; in-memory ADK history is not paged
+    if messages and "id" in messages[-1]:
+        cursor = next_cursor(
+            messages,
+            limit,
+            key=lambda msg: (datetime.fromisoformat(msg["created_at"]), msg["id"]),
+        )
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+    return messages
 
@@ -8,9 +8,17 @@ infrastructure implementations based on environment configuration.
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, status
 
 from app.core.config import Settings, get_settings
+from app.core.exceptions import ValidationError
+from app.core.pagination import decode_cursor
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.infrastructure.snapshot_cache import (
+    CachedProjectRepository,
+    CachedTaskRepository,
+    SnapshotCache,
+)
 from app.interfaces.auth_provider import IAuthProvider, User
 from app.interfaces.task_repository import ITaskRepository
 from app.interfaces.project_repository import IProjectRepository
@@ -21,6 +29,8 @@ from app.interfaces.chat_session_repository import IChatSessionRepository
 from app.interfaces.llm_provider import ILLMProvider
 from app.interfaces.speech_provider import ISpeechToTextProvider
 from app.interfaces.storage_provider import IStorageProvider
+from app.interfaces.today_plan_repository import ITodayPlanRepository
+from app.services.schedule_cache import ScheduleCache
 
 
 # ===========================================
@@ -28,6 +38,32 @@ from app.interfaces.storage_provider import IStorageProvider
 # ===========================================
 
 
+@lru_cache()
+def get_snapshot_cache() -> SnapshotCache:
+    """Get the process-wide task/project snapshot cache."""
+    # The stored data version also sees writes from other workers and scripts
+    return SnapshotCache(
+        max_users=get_settings().SNAPSHOT_CACHE_MAX_USERS,
+        data_version=get_today_plan_repository().get_data_version,
+    )
+
+
+@lru_cache()
+def get_schedule_cache() -> ScheduleCache:
+    """Get the process-wide built schedule cache."""
+    settings = get_settings()
+    # Invalidation relies on the snapshot cache's data versions
+    max_entries = settings.SCHEDULE_CACHE_MAX_ENTRIES if settings.SNAPSHOT_CACHE_MAX_USERS > 0 else 0
+    return ScheduleCache(get_snapshot_cache().version, max_entries=max_entries)
+
+
+@lru_cache()
+def get_compute_executor() -> ComputeExecutor:
+    """Get the process-wide executor for CPU-bound work (scheduling, KPIs)."""
+    settings = get_settings()
+    return ComputeExecutor(settings.COMPUTE_EXECUTOR, max_workers=settings.COMPUTE_MAX_WORKERS)
+
+
 @lru_cache()
 def get_task_repository() -> ITaskRepository:
     """Get task repository instance."""
@@ -37,7 +73,10 @@ def get_task_repository() -> ITaskRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.task_repository import SqliteTaskRepository
-        return SqliteTaskRepository()
+        repo = SqliteTaskRepository()
+    if settings.SNAPSHOT_CACHE_MAX_USERS > 0:
+        return CachedTaskRepository(repo, get_snapshot_cache())
+    return repo
 
 
 @lru_cache()
@@ -48,7 +87,10 @@ def get_project_repository() -> IProjectRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.project_repository import SqliteProjectRepository
-        return SqliteProjectRepository()
+        repo = SqliteProjectRepository()
+    if settings.SNAPSHOT_CACHE_MAX_USERS > 0:
+        return CachedProjectRepository(repo, get_snapshot_cache())
+    return repo
 
 
 @lru_cache()
@@ -95,6 +137,17 @@ def get_chat_session_repository() -> IChatSessionRepository:
         return SqliteChatSessionRepository()
 
 
+@lru_cache()
+def get_today_plan_repository() -> ITodayPlanRepository:
+    """Get precomputed today plan repository instance."""
+    settings = get_settings()
+    if settings.is_gcp:
+        raise NotImplementedError("Today plan repository not implemented for GCP")
+    else:
+        from app.infrastructure.local.today_plan_repository import SqliteTodayPlanRepository
+        return SqliteTodayPlanRepository()
+
+
 # ===========================================
 # Provider Dependencies
 # ===========================================
@@ -109,6 +162,7 @@ def get_llm_provider() -> ILLMProvider:
     - gemini-api: Gemini API (API Key, works in local/gcp)
     - vertex-ai: Vertex AI (GCP only, service account)
     - litellm: LiteLLM (Bedrock, OpenAI, etc.)
+    - fake: Offline scripted/echo model (no API key)
     """
     settings = get_settings()
 
@@ -129,6 +183,10 @@ def get_llm_provider() -> ILLMProvider:
         from app.infrastructure.local.litellm_provider import LiteLLMProvider
         return LiteLLMProvider(settings.LITELLM_MODEL)
 
+    elif settings.LLM_PROVIDER == "fake":
+        from app.infrastructure.local.fake_llm_provider import FakeLLMProvider
+        return FakeLLMProvider(delay_ms=settings.FAKE_LLM_DELAY_MS)
+
     else:
         raise ValueError(f"Unknown LLM_PROVIDER: {settings.LLM_PROVIDER}")
 
@@ -214,6 +272,29 @@ async def get_current_user(
         )
 
 
+# ===========================================
+# Pagination
+# ===========================================
+
+
+def get_page_cursor(
+    after: Annotated[
+        str | None,
+        Query(description="Cursor from the X-Next-Cursor header of the previous page"),
+    ] = None,
+) -> str | None:
+    """Validate the keyset pagination cursor."""
+    if after is not None:
+        try:
+            decode_cursor(after)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=e.message,
+            )
+    return after
+
+
 # ===========================================
 # Type Aliases for Dependency Injection
 # ===========================================
@@ -224,7 +305,11 @@ AgentTaskRepo = Annotated[IAgentTaskRepository, Depends(get_agent_task_repositor
 MemoryRepo = Annotated[IMemoryRepository, Depends(get_memory_repository)]
 CaptureRepo = Annotated[ICaptureRepository, Depends(get_capture_repository)]
 ChatRepo = Annotated[IChatSessionRepository, Depends(get_chat_session_repository)]
+TodayPlanRepo = Annotated[ITodayPlanRepository, Depends(get_today_plan_repository)]
+ScheduleCacheDep = Annotated[ScheduleCache, Depends(get_schedule_cache)]
+Compute = Annotated[ComputeExecutor, Depends(get_compute_executor)]
 LLMProvider = Annotated[ILLMProvider, Depends(get_llm_provider)]
 StorageProvider = Annotated[IStorageProvider, Depends(get_storage_provider)]
 SpeechProvider = Annotated[ISpeechToTextProvider, Depends(get_speech_provider)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
+PageCursor = Annotated[str | None, Depends(get_page_cursor)]
@@ -7,10 +7,11 @@ Endpoints for managing AI memories (user facts, project context, work rules).
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from app.api.deps import CurrentUser, MemoryRepo
+from app.api.deps import CurrentUser, MemoryRepo, PageCursor
 from app.core.exceptions import NotFoundError
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from app.models.memory import Memory, MemoryCreate, MemorySearchResult
 from app.models.enums import MemoryScope, MemoryType
 
@@ -47,21 +48,28 @@ async def get_memory(
 async def list_memories(
     user: CurrentUser,
     repo: MemoryRepo,
+    response: Response,
+    after: PageCursor,
     scope: Optional[MemoryScope] = Query(None, description="Filter by scope"),
     memory_type: Optional[MemoryType] = Query(None, description="Filter by type"),
     project_id: Optional[UUID] = Query(None, description="Filter by project ID"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
 ):
-    """List memories with optional filters."""
-    return await repo.list(
+    """List memories with optional filters (cursor in X-Next-Cursor header)."""
+    memories = await repo.list(
         user.id,
         scope=scope,
         memory_type=memory_type,
         project_id=project_id,
         limit=limit,
         offset=offset,
+        after=after,
     )
+    cursor = next_cursor(memories, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return memories
 
 
 @router.get("/search", response_model=list[MemorySearchResult])
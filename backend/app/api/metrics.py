@@ -0,0 +1,28 @@
+"""
+Metrics API endpoint.
+
+Exposes in-process cache and performance counters.
+"""
+
+from fastapi import APIRouter
+
+from app.api.deps import get_compute_executor, get_schedule_cache, get_snapshot_cache
+from app.services.agent_service import AgentService
+
+router = APIRouter()
+
+
+@router.get("")
+async def get_metrics():
+    """
+    Get in-process performance counters.
+
+    Returns:
+        dict: Counters grouped by component
+    """
+    return {
+        "snapshot_cache": get_snapshot_cache().stats(),
+        "schedule_cache": get_schedule_cache().stats(),
+        "compute_executor": get_compute_executor().stats(),
+        "agent": AgentService.cache_stats(),
+    }
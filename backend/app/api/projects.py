@@ -9,7 +9,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.deps import CurrentUser, ProjectRepo, TaskRepo
+from app.api.deps import Compute, CurrentUser, ProjectRepo, TaskRepo
 from app.core.exceptions import NotFoundError
 from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectWithTaskCount
 from app.models.project_kpi import ProjectKpiTemplate
@@ -41,11 +41,10 @@ async def get_project(
     user: CurrentUser,
     repo: ProjectRepo,
     task_repo: TaskRepo,
+    compute: Compute,
 ):
     """Get a project by ID with task counts."""
-    # Use list_with_task_count to get task statistics
-    all_projects = await repo.list_with_task_count(user.id)
-    project = next((p for p in all_projects if p.id == project_id), None)
+    project = await repo.get_with_task_count(user.id, project_id)
 
     if not project:
         raise HTTPException(
@@ -54,7 +53,7 @@ async def get_project(
         )
 
     # Apply KPI calculations
-    return await apply_project_kpis(user.id, project, task_repo)
+    return await apply_project_kpis(user.id, project, task_repo, compute)
 
 
 @router.get("", response_model=list[ProjectWithTaskCount])
@@ -62,11 +61,12 @@ async def list_projects(
     user: CurrentUser,
     repo: ProjectRepo,
     task_repo: TaskRepo,
+    compute: Compute,
     status: Optional[str] = Query(None, description="Filter by status"),
 ):
     """List projects with task counts."""
     projects = await repo.list_with_task_count(user.id, status=status)
-    return [await apply_project_kpis(user.id, project, task_repo) for project in projects]
+    return [await apply_project_kpis(user.id, project, task_repo, compute) for project in projects]
 
 
 @router.patch("/{project_id}", response_model=Project)
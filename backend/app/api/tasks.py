@@ -5,19 +5,47 @@ CRUD operations for tasks and task breakdown.
 """
 
 from datetime import date
+from functools import partial
 import json
-from typing import Optional
+from typing import Awaitable, Callable, Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from app.api.deps import CurrentUser, LLMProvider, MemoryRepo, ProjectRepo, TaskRepo
-from app.core.exceptions import LLMValidationError, NotFoundError
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse
+
+from app.api.deps import (
+    Compute,
+    CurrentUser,
+    LLMProvider,
+    MemoryRepo,
+    PageCursor,
+    ProjectRepo,
+    ScheduleCacheDep,
+    TaskRepo,
+    TodayPlanRepo,
+)
+from app.core.config import get_settings
+from app.core.exceptions import LLMValidationError, NotFoundError, ValidationError
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.interfaces.today_plan_repository import ITodayPlanRepository
 from app.models.breakdown import BreakdownRequest, BreakdownResponse
 from app.models.schedule import ScheduleResponse, TodayTasksResponse
-from app.models.task import Task, TaskCreate, TaskUpdate
+from app.models.task import (
+    Task,
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkDeleteResponse,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskSummary,
+    TaskUpdate,
+)
 from app.services.planner_service import PlannerService
-from app.services.scheduler_service import SchedulerService
+from app.services.schedule_cache import ScheduleCache, ScheduleParams
+from app.services.schedule_inputs import load_all_tasks, load_project_priorities
+from app.services.scheduler_service import ScheduleRun, SchedulerService
+from app.services.today_plan_service import TODAY_PLAN_MAX_DAYS
 
 router = APIRouter()
 
@@ -79,10 +107,158 @@ def apply_capacity_buffer(
     return max(0.0, base_hours - buffer_hours), adjusted_weekday
 
 
-async def load_project_priorities(project_repo: ProjectRepo, user_id: str) -> dict[UUID, int]:
-    """Load project priorities for scheduling."""
-    projects = await project_repo.list(user_id, limit=1000)
-    return {project.id: project.priority for project in projects}
+# Loads the tasks and project priorities a schedule is built from
+ScheduleInputsLoader = Callable[[], Awaitable[tuple[list[Task], dict[UUID, int]]]]
+
+
+async def get_cached_schedule(
+    schedule_cache: ScheduleCache,
+    scheduler_service: SchedulerService,
+    repo: TaskRepo,
+    project_repo: ProjectRepo,
+    user_id: str,
+    params: ScheduleParams,
+    days_only: bool = False,
+    compute: Optional[ComputeExecutor] = None,
+    load_inputs: Optional[ScheduleInputsLoader] = None,
+) -> ScheduleResponse:
+    """
+    Get the user's schedule for params, building it only if not cached.
+
+    Args:
+        schedule_cache: Built schedule cache
+        scheduler_service: Scheduler used on a cache miss
+        repo: Task repository
+        project_repo: Project repository
+        user_id: Owner user ID
+        params: Scheduling parameters
+        days_only: Only the schedule days up to the horizon are read
+        compute: Executor for the build (None = build on the event loop)
+        load_inputs: Loads the build inputs on a cache miss (default: from
+            the repositories)
+
+    Returns:
+        Schedule
+    """
+    async def build() -> ScheduleRun | ScheduleResponse:
+        if load_inputs is not None:
+            tasks, project_priorities = await load_inputs()
+        else:
+            tasks = await load_all_tasks(repo, user_id)
+            project_priorities = await load_project_priorities(project_repo, user_id)
+        capacity_by_weekday = list(params.capacity_by_weekday) if params.capacity_by_weekday else None
+        if compute is not None and not compute.shares_memory:
+            # Runs carry per-day checkpoints; shipping them to and from
+            # worker processes costs more than resuming saves
+            return await compute.run(
+                scheduler_service.build_schedule,
+                tasks,
+                project_priorities=project_priorities,
+                start_date=params.start_date,
+                capacity_hours=params.capacity_hours,
+                capacity_by_weekday=capacity_by_weekday,
+                max_days=params.horizon_days,
+            )
+        # After a write, resume from the schedule built before it
+        build_run = partial(
+            scheduler_service.build_schedule_run,
+            tasks,
+            project_priorities=project_priorities,
+            start_date=params.start_date,
+            capacity_hours=params.capacity_hours,
+            capacity_by_weekday=capacity_by_weekday,
+            max_days=params.horizon_days,
+            previous=schedule_cache.previous_run(user_id, params),
+        )
+        return build_run() if compute is None else await compute.run(build_run)
+
+    return await schedule_cache.get_or_build(user_id, params, build, days_only=days_only)
+
+
+async def get_today_view(
+    schedule_cache: ScheduleCache,
+    scheduler_service: SchedulerService,
+    repo: TaskRepo,
+    project_repo: ProjectRepo,
+    user_id: str,
+    params: ScheduleParams,
+    compute: ComputeExecutor,
+) -> TodayTasksResponse:
+    """
+    Get the user's tasks for the first day of a (cached) schedule.
+
+    The tasks and project priorities are loaded once, whether or not the
+    schedule has to be built.
+
+    Args:
+        schedule_cache: Built schedule cache
+        scheduler_service: Scheduler used on a cache miss
+        repo: Task repository
+        project_repo: Project repository
+        user_id: Owner user ID
+        params: Scheduling parameters; the view is for params.start_date
+        compute: Executor for the build and the view
+
+    Returns:
+        Today's tasks and top 3
+    """
+    loaded: Optional[tuple[list[Task], dict[UUID, int]]] = None
+
+    async def load_inputs() -> tuple[list[Task], dict[UUID, int]]:
+        nonlocal loaded
+        if loaded is None:
+            loaded = (
+                await load_all_tasks(repo, user_id),
+                await load_project_priorities(project_repo, user_id),
+            )
+        return loaded
+
+    schedule = await get_cached_schedule(
+        schedule_cache,
+        scheduler_service,
+        repo,
+        project_repo,
+        user_id,
+        params,
+        days_only=True,
+        compute=compute,
+        load_inputs=load_inputs,
+    )
+    tasks, project_priorities = await load_inputs()
+    return await compute.run(
+        scheduler_service.get_today_tasks,
+        schedule,
+        tasks,
+        project_priorities=project_priorities,
+        today=params.start_date,
+    )
+
+
+async def get_precomputed_today(
+    today_plans: ITodayPlanRepository,
+    user_id: str,
+    today: date,
+    capacity_hours: Optional[float],
+    buffer_hours: Optional[float],
+    capacity_by_weekday: Optional[str],
+    max_days: int = TODAY_PLAN_MAX_DAYS,
+) -> Optional[TodayTasksResponse]:
+    """
+    Get the user's precomputed today view, if the request can use it.
+
+    Plans are computed nightly with default capacity and horizon, so only
+    requests without capacity overrides are served from them.
+
+    Returns:
+        Current plan, or None to compute on demand
+    """
+    if not get_settings().TODAY_PLANS_ENABLED:
+        return None
+    if capacity_hours is not None or buffer_hours is not None or capacity_by_weekday is not None:
+        return None
+    if max_days != TODAY_PLAN_MAX_DAYS:
+        return None
+    return await today_plans.get_current(user_id, today)
 
 
 @router.post("", response_model=Task, status_code=status.HTTP_201_CREATED)
@@ -95,10 +271,63 @@ async def create_task(
     return await repo.create(user.id, task)
 
 
+@router.post("/bulk", response_model=list[Task], status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    request: TaskBulkCreate,
+    user: CurrentUser,
+    repo: TaskRepo,
+):
+    """
+    Create multiple tasks in one transaction.
+
+    Tasks may depend on siblings in the same request via batch_dependency_indexes.
+    """
+    try:
+        return await repo.create_many(user.id, request.tasks)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+
+
+@router.patch("/bulk", response_model=list[Task])
+async def update_tasks_bulk(
+    request: TaskBulkUpdate,
+    user: CurrentUser,
+    repo: TaskRepo,
+):
+    """Update multiple tasks in one transaction (all or nothing)."""
+    updates = {
+        item.id: TaskUpdate(**item.model_dump(exclude={"id"}, exclude_unset=True))
+        for item in request.updates
+    }
+    try:
+        return await repo.update_many(user.id, updates)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+
+@router.post("/bulk/delete", response_model=TaskBulkDeleteResponse)
+async def delete_tasks_bulk(
+    request: TaskBulkDelete,
+    user: CurrentUser,
+    repo: TaskRepo,
+):
+    """Delete multiple tasks in one transaction."""
+    deleted_count = await repo.delete_many(user.id, request.task_ids)
+    return TaskBulkDeleteResponse(deleted_count=deleted_count)
+
+
 @router.get("", response_model=list[Task])
 async def list_tasks(
     user: CurrentUser,
     repo: TaskRepo,
+    response: Response,
+    after: PageCursor,
     project_id: Optional[UUID] = Query(None, description="Filter by project ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     include_done: bool = Query(False, description="Include completed tasks"),
@@ -106,16 +335,50 @@ async def list_tasks(
     exclude_meetings: bool = Query(False, description="会議を除外"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (e.g. id,title,status)",
+    ),
 ):
-    """List tasks with optional filters."""
-    tasks = await repo.list(
-        user.id,
-        project_id=project_id,
-        status=status,
-        include_done=include_done,
-        limit=limit,
-        offset=offset,
-    )
+    """
+    List tasks with optional filters (cursor in X-Next-Cursor header).
+
+    With ``fields``, only the requested columns are read and each item
+    contains just those fields.
+    """
+    requested = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+    tasks: Sequence[Task | TaskSummary]
+    if requested:
+        # Meeting filters need is_fixed_time even when it is not returned
+        load_fields = [*requested, "is_fixed_time"] if only_meetings or exclude_meetings else requested
+        try:
+            tasks = await repo.list_summaries(
+                user.id,
+                load_fields,
+                project_id=project_id,
+                status=status,
+                include_done=include_done,
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
+        except ValidationError as e:
+            # "status" is shadowed by the query parameter here
+            raise HTTPException(status_code=422, detail=str(e))
+    else:
+        tasks = await repo.list(
+            user.id,
+            project_id=project_id,
+            status=status,
+            include_done=include_done,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+    # Cursor comes from the unfiltered page so meeting filters don't skip rows
+    cursor = next_cursor(tasks, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
 
     # Apply meeting filters in-memory (simple KISS approach)
     if only_meetings:
@@ -123,6 +386,12 @@ async def list_tasks(
     elif exclude_meetings:
         tasks = [t for t in tasks if not t.is_fixed_time]
 
+    if requested:
+        include = set(requested)
+        return JSONResponse(
+            content=[task.model_dump(mode="json", include=include) for task in tasks],
+            headers={NEXT_CURSOR_HEADER: cursor} if cursor else None,
+        )
     return tasks
 
 
@@ -131,6 +400,8 @@ async def get_task_schedule(
     user: CurrentUser,
     repo: TaskRepo,
     project_repo: ProjectRepo,
+    schedule_cache: ScheduleCacheDep,
+    compute: Compute,
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     start_date: Optional[date] = Query(None, description="Schedule start date"),
     capacity_hours: Optional[float] = Query(None, description="Daily capacity in hours (default: 8)"),
@@ -142,8 +413,6 @@ async def get_task_schedule(
     max_days: int = Query(60, ge=1, le=365, description="Maximum days to schedule"),
 ):
     """Build a multi-day schedule for tasks."""
-    tasks = await repo.list(user.id, include_done=True, limit=1000)
-    project_priorities = await load_project_priorities(project_repo, user.id)
     parsed_weekly = parse_capacity_by_weekday(capacity_by_weekday)
     effective_capacity, effective_weekly = apply_capacity_buffer(
         scheduler_service,
@@ -151,13 +420,14 @@ async def get_task_schedule(
         buffer_hours,
         parsed_weekly,
     )
-    return scheduler_service.build_schedule(
-        tasks,
-        project_priorities=project_priorities,
-        start_date=start_date,
-        capacity_hours=effective_capacity,
-        capacity_by_weekday=effective_weekly,
-        max_days=max_days,
+    params = ScheduleParams.create(
+        start_date or date.today(),
+        effective_capacity,
+        effective_weekly,
+        max_days,
+    )
+    return await get_cached_schedule(
+        schedule_cache, scheduler_service, repo, project_repo, user.id, params, compute=compute
     )
 
 
@@ -166,6 +436,9 @@ async def get_today_tasks(
     user: CurrentUser,
     repo: TaskRepo,
     project_repo: ProjectRepo,
+    schedule_cache: ScheduleCacheDep,
+    compute: Compute,
+    today_plans: TodayPlanRepo,
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     target_date: Optional[date] = Query(None, description="Target date (default: today)"),
     capacity_hours: Optional[float] = Query(None, description="Daily capacity in hours (default: 8)"),
@@ -174,11 +447,17 @@ async def get_today_tasks(
         None,
         description="JSON array of 7 daily capacity values (Sun..Sat)",
     ),
-    max_days: int = Query(30, ge=1, le=365, description="Maximum days to schedule"),
+    max_days: int = Query(
+        TODAY_PLAN_MAX_DAYS, ge=1, le=365, description="Maximum days to schedule"
+    ),
 ):
     """Get today's tasks derived from the schedule."""
-    tasks = await repo.list(user.id, include_done=True, limit=1000)
-    project_priorities = await load_project_priorities(project_repo, user.id)
+    today = target_date or date.today()
+    plan = await get_precomputed_today(
+        today_plans, user.id, today, capacity_hours, buffer_hours, capacity_by_weekday, max_days
+    )
+    if plan is not None:
+        return plan
     parsed_weekly = parse_capacity_by_weekday(capacity_by_weekday)
     effective_capacity, effective_weekly = apply_capacity_buffer(
         scheduler_service,
@@ -186,19 +465,10 @@ async def get_today_tasks(
         buffer_hours,
         parsed_weekly,
     )
-    schedule = scheduler_service.build_schedule(
-        tasks,
-        project_priorities=project_priorities,
-        start_date=target_date,
-        capacity_hours=effective_capacity,
-        capacity_by_weekday=effective_weekly,
-        max_days=max_days,
-    )
-    return scheduler_service.get_today_tasks(
-        schedule,
-        tasks,
-        project_priorities=project_priorities,
-        today=target_date or date.today(),
+    # Only the target day is read back
+    params = ScheduleParams.create(today, effective_capacity, effective_weekly, max_days, until=today)
+    return await get_today_view(
+        schedule_cache, scheduler_service, repo, project_repo, user.id, params, compute
     )
 
 
@@ -10,9 +10,19 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from datetime import date
-from app.api.deps import CurrentUser, ProjectRepo, TaskRepo
+from app.api.deps import (
+    Compute,
+    CurrentUser,
+    ProjectRepo,
+    ScheduleCacheDep,
+    TaskRepo,
+    TodayPlanRepo,
+)
+from app.api.tasks import get_precomputed_today, get_today_view
 from app.models.task import Task
+from app.services.schedule_cache import ScheduleParams
 from app.services.scheduler_service import SchedulerService
+from app.services.today_plan_service import TODAY_PLAN_MAX_DAYS
 
 router = APIRouter()
 
@@ -94,6 +104,9 @@ async def get_top3_tasks(
     user: CurrentUser,
     task_repo: TaskRepo,
     project_repo: ProjectRepo,
+    schedule_cache: ScheduleCacheDep,
+    compute: Compute,
+    today_plans: TodayPlanRepo,
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     capacity_hours: Optional[float] = Query(None, description="Daily capacity in hours (default: 8)"),
     buffer_hours: Optional[float] = Query(None, description="Daily buffer hours"),
@@ -120,29 +133,25 @@ async def get_top3_tasks(
     Returns:
         Top3Response: Top 3 tasks with capacity information
     """
-    tasks = await task_repo.list(user.id, include_done=True, limit=1000)
-    project_priorities = {project.id: project.priority for project in await project_repo.list(user.id, limit=1000)}
-    parsed_weekly = parse_capacity_by_weekday(capacity_by_weekday)
-    effective_capacity, effective_weekly = apply_capacity_buffer(
-        capacity_hours,
-        buffer_hours,
-        parsed_weekly,
+    today = date.today()
+    today_result = await get_precomputed_today(
+        today_plans, user.id, today, capacity_hours, buffer_hours, capacity_by_weekday
     )
+    if today_result is None:
+        parsed_weekly = parse_capacity_by_weekday(capacity_by_weekday)
+        effective_capacity, effective_weekly = apply_capacity_buffer(
+            capacity_hours,
+            buffer_hours,
+            parsed_weekly,
+        )
 
-    schedule = scheduler_service.build_schedule(
-        tasks,
-        project_priorities=project_priorities,
-        start_date=date.today(),
-        capacity_hours=effective_capacity,
-        capacity_by_weekday=effective_weekly,
-        max_days=30,
-    )
-    today_result = scheduler_service.get_today_tasks(
-        schedule,
-        tasks,
-        project_priorities=project_priorities,
-        today=date.today(),
-    )
+        # Only today's allocations are read back
+        params = ScheduleParams.create(
+            today, effective_capacity, effective_weekly, TODAY_PLAN_MAX_DAYS, until=today
+        )
+        today_result = await get_today_view(
+            schedule_cache, scheduler_service, task_repo, project_repo, user.id, params, compute
+        )
 
     top3_tasks = [task for task in today_result.today_tasks if task.id in set(today_result.top3_ids)]
     capacity_info = None
@@ -32,14 +32,45 @@ class Settings(BaseSettings):
     # ===========================================
     DATABASE_URL: str = "sqlite+aiosqlite:///./secretary.db"
 
+    # Connection pool (shared process-wide engine)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_ECHO: bool = False
+
+    # SQLite pragmas applied on every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 20000  # Negative cache_size => KiB
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+
+    # Per-user task/project snapshot cache (0 = disabled)
+    SNAPSHOT_CACHE_MAX_USERS: int = 256
+    # Built schedule cache (0 = disabled; also disabled with the snapshot cache)
+    SCHEDULE_CACHE_MAX_ENTRIES: int = 512
+
+    # ===========================================
+    # Compute (scheduling, KPIs)
+    # ===========================================
+    # Where CPU-bound request work runs: "thread" | "process" | "inline" (on the event loop)
+    COMPUTE_EXECUTOR: Literal["thread", "process", "inline"] = "thread"
+    # Maximum concurrent compute calls; further calls queue
+    COMPUTE_MAX_WORKERS: int = 2
+    # Worker processes of the nightly today plan precompute job (0 = CPU count)
+    TODAY_PLAN_WORKERS: int = 0
+    # Serve precomputed today plans from /api/tasks/today and /api/today/top3
+    TODAY_PLANS_ENABLED: bool = True
+
     # ===========================================
     # LLM Configuration
     # ===========================================
-    # LLM Provider: "gemini-api" | "vertex-ai" | "litellm"
+    # LLM Provider: "gemini-api" | "vertex-ai" | "litellm" | "fake"
     # - gemini-api: Gemini API (API Key, works in local/gcp)
     # - vertex-ai: Vertex AI (GCP only, service account)
     # - litellm: LiteLLM (Bedrock, OpenAI, etc.)
-    LLM_PROVIDER: Literal["gemini-api", "vertex-ai", "litellm"] = "gemini-api"
+    # - fake: Offline echo model that streams its replies (development, tests)
+    LLM_PROVIDER: Literal["gemini-api", "vertex-ai", "litellm", "fake"] = "gemini-api"
 
     # Gemini model name (for gemini-api and vertex-ai)
     GEMINI_MODEL: str = "gemini-2.0-flash"
@@ -50,6 +81,35 @@ class Settings(BaseSettings):
     # Google API Key (for gemini-api provider)
     GOOGLE_API_KEY: str = ""
 
+    # Simulated latency before each streamed delta of the fake provider
+    FAKE_LLM_DELAY_MS: float = 20
+
+    # Stream model output token by token (ADK SSE mode) when the provider supports it
+    CHAT_TOKEN_STREAMING: bool = True
+    # Chat streaming: buffered text is sent once it reaches this many characters
+    # (1 = one event per model text delta, no coalescing)
+    CHAT_STREAM_FLUSH_CHARS: int = 64
+    # ...or once the oldest buffered text has waited this long (0 = no time limit)
+    CHAT_STREAM_FLUSH_MS: float = 40
+
+    # Where agent conversation state lives: "memory" (per process) | "sqlite"
+    # (shared database; required with more than one worker process)
+    AGENT_SESSION_STORE: Literal["memory", "sqlite"] = "memory"
+    # Per-user agent runners (agent + in-memory chat sessions) kept in memory
+    AGENT_RUNNER_CACHE_MAX_USERS: int = 64
+    # Runners and session index entries unused for this long are dropped (0 = never)
+    AGENT_RUNNER_IDLE_TTL_SECONDS: float = 1800
+    # Session metadata fallback index: users, and newest sessions per user
+    AGENT_SESSION_INDEX_MAX_USERS: int = 1024
+    AGENT_SESSION_INDEX_MAX_SESSIONS: int = 100
+    # Stored messages replayed into a session whose runner was evicted
+    AGENT_REHYDRATE_MAX_MESSAGES: int = 50
+    # Estimated history tokens per model call above which older turns are folded
+    # into the session's stored running summary (0 = always send full history)
+    CHAT_CONTEXT_TOKEN_BUDGET: int = 6000
+    # Most recent turns always sent verbatim
+    CHAT_CONTEXT_KEEP_TURNS: int = 6
+
     # ===========================================
     # Google Cloud
     # ===========================================
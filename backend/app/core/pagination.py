@@ -0,0 +1,82 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe token that encodes the sort key and ID of the
+last item on a page, i.e. ``(created_at, id)``. The next page continues
+strictly after that position, so deep pages cost the same as the first page
+(no growing OFFSET scans).
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from app.core.exceptions import ValidationError
+
+T = TypeVar("T")
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, item_id: UUID | str) -> str:
+    """
+    Encode a keyset position into an opaque cursor.
+
+    Args:
+        sort_value: Sort key of the last item (e.g. created_at)
+        item_id: ID of the last item (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_value.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode an opaque cursor into its keyset position.
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+
+    Returns:
+        (sort_value, item_id)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_raw, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_raw), str(item_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValidationError(f"Invalid cursor: {cursor}") from e
+
+
+def next_cursor(
+    items: Sequence[T],
+    limit: int,
+    key: Optional[Callable[[T], tuple[datetime, Any]]] = None,
+) -> Optional[str]:
+    """
+    Build the cursor for the page after ``items``.
+
+    Args:
+        items: Items of the current page (in page order)
+        limit: Requested page size
+        key: Returns (sort_value, id) for an item (default: created_at, id)
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if key is None:
+        return encode_cursor(last.created_at, last.id)
+    sort_value, item_id = key(last)
+    return encode_cursor(sort_value, item_id)
@@ -0,0 +1,161 @@
+"""
+Executor for CPU-bound request work.
+
+Runs scheduling and KPI computation off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Literal, Optional, TypeVar
+
+T = TypeVar("T")
+
+ExecutorMode = Literal["thread", "process", "inline"]
+
+
+class ComputeExecutor:
+    """
+    Runs CPU-bound calls off the event loop with bounded concurrency.
+
+    "thread" shares memory with the caller; "process" runs on spawned
+    workers, so arguments and results must be picklable and compact;
+    "inline" runs on the loop. Callers beyond max_workers wait (queue depth).
+    """
+
+    def __init__(self, mode: ExecutorMode = "thread", max_workers: int = 2):
+        """
+        Initialize executor.
+
+        Args:
+            mode: "thread", "process" or "inline"
+            max_workers: Maximum number of calls running at once
+        """
+        if mode not in ("thread", "process", "inline"):
+            raise ValueError(f"Unknown compute executor mode: {mode}")
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    @property
+    def shares_memory(self) -> bool:
+        """Whether calls see the caller's objects (not copies)."""
+        return self.mode != "process"
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                # fork would copy the event loop and the database engine's threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="compute",
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to one event loop (tests run several)
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run fn(*args, **kwargs) off the event loop.
+
+        In process mode, fn and its arguments must be picklable (module-level
+        functions or methods of plain objects).
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            fn's return value (exceptions are re-raised)
+        """
+        self.submitted += 1
+        call = partial(fn, *args, **kwargs)
+        if self.mode == "inline":
+            return self._call_inline(call)
+
+        semaphore = self._get_semaphore()
+        queued_at = time.perf_counter()
+        if semaphore.locked():
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            try:
+                await semaphore.acquire()
+            finally:
+                self.queue_depth -= 1
+        else:
+            await semaphore.acquire()
+        started_at = time.perf_counter()
+        self._wait_seconds += started_at - queued_at
+        self.running += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        except BaseException:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            self.running -= 1
+            self._run_seconds += time.perf_counter() - started_at
+            semaphore.release()
+
+    def _call_inline(self, call: Callable[[], T]) -> T:
+        started_at = time.perf_counter()
+        try:
+            result = call()
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self._run_seconds += time.perf_counter() - started_at
+        self.completed += 1
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool (it is re-created on the next call)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return executor counters."""
+        finished = self.completed + self.failed
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self._wait_seconds * 1000 / finished, 3) if finished else 0.0,
+            "avg_run_ms": round(self._run_seconds * 1000 / finished, 3) if finished else 0.0,
+        }
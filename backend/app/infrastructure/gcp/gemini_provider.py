@@ -56,3 +56,6 @@ class VertexAIProvider(ILLMProvider):
         """Gemini models support function calling."""
         return True
 
+    def supports_streaming(self) -> bool:
+        """Vertex AI streams responses (generate_content_stream)."""
+        return True
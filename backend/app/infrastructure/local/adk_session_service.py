@@ -0,0 +1,295 @@
+"""
+SQLite implementation of the ADK session service, shared by all worker processes.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from typing import Any, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from google.adk.sessions.state import State
+from sqlalchemy import Result, and_, delete, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.local.database import (
+    AdkEventORM,
+    AdkSessionORM,
+    AdkStateORM,
+    get_session_factory,
+)
+from app.infrastructure.local.returning import upsert_returning
+
+# adk_states.user_id of app-scoped state
+_APP_SCOPE = ""
+
+# Key/value pairs per json_set call (SQLite allows 127 function arguments)
+_JSON_SET_PAIRS = 60
+
+
+def _split_state(
+    state: Optional[dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Split a state (delta) into app, user and session scopes, dropping temp keys."""
+    app_state: dict[str, Any] = {}
+    user_state: dict[str, Any] = {}
+    session_state: dict[str, Any] = {}
+    for key, value in (state or {}).items():
+        if key.startswith(State.APP_PREFIX):
+            app_state[key.removeprefix(State.APP_PREFIX)] = value
+        elif key.startswith(State.USER_PREFIX):
+            user_state[key.removeprefix(State.USER_PREFIX)] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session_state[key] = value
+    return app_state, user_state, session_state
+
+
+def _json_update(column: Any, delta: dict[str, Any]) -> Any:
+    """
+    Build a SQL expression applying delta to a JSON object column like dict.update.
+
+    Top-level keys are replaced as a whole (json_patch would deep-merge
+    nested objects and delete keys set to None). Concurrent writers of
+    different keys never overwrite each other.
+
+    Raises:
+        ValueError: If a key contains a double quote (not addressable in a JSON path)
+    """
+    arguments: list[Any] = []
+    for key, value in delta.items():
+        if '"' in key:
+            raise ValueError(f"State key {key!r} must not contain a double quote")
+        arguments += [f'$."{key}"', func.json(json.dumps(value))]
+
+    expression = column
+    step = 2 * _JSON_SET_PAIRS
+    for start in range(0, len(arguments), step):
+        expression = func.json_set(expression, *arguments[start : start + step])
+    return expression
+
+
+class SqliteAdkSessionService(BaseSessionService):
+    """
+    ADK session service persisting sessions and events in SQLite.
+
+    Events are append-only rows and loads are indexed range scans. "app:"
+    and "user:" state is stored once per app and per user, and "temp:" state
+    is never persisted. The runner reloads the session on every invocation.
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or get_session_factory()
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        """Create a session (an existing session with the same ID is kept)."""
+        session_id = session_id.strip() if session_id and session_id.strip() else str(uuid.uuid4())
+        app_state, user_state, session_state = _split_state(state)
+        now = time.time()
+        async with self._session_factory() as db:
+            # Another worker may create the same session concurrently
+            await db.execute(
+                sqlite_insert(AdkSessionORM)
+                .values(
+                    app_name=app_name,
+                    user_id=user_id,
+                    session_id=session_id,
+                    state=json.dumps(session_state),
+                    create_time=now,
+                    update_time=now,
+                )
+                .on_conflict_do_nothing()
+            )
+            await self._merge_scoped_state(db, app_name, user_id, app_state, user_state)
+            await db.commit()
+
+        session = await self.get_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        assert session is not None, "session row missing right after insert"
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        """Load a session with its events and merged app/user state."""
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(AdkSessionORM.state, AdkSessionORM.update_time).where(
+                    and_(
+                        AdkSessionORM.app_name == app_name,
+                        AdkSessionORM.user_id == user_id,
+                        AdkSessionORM.session_id == session_id,
+                    )
+                )
+            )
+            row = result.one_or_none()
+            if row is None:
+                return None
+
+            query = select(AdkEventORM.payload).where(
+                and_(
+                    AdkEventORM.app_name == app_name,
+                    AdkEventORM.user_id == user_id,
+                    AdkEventORM.session_id == session_id,
+                )
+            )
+            if config and config.after_timestamp:
+                query = query.where(AdkEventORM.timestamp >= config.after_timestamp)
+            if config and config.num_recent_events:
+                query = query.order_by(AdkEventORM.seq.desc()).limit(config.num_recent_events)
+                payloads = list(reversed((await db.execute(query)).scalars().all()))
+            else:
+                payloads = (await db.execute(query.order_by(AdkEventORM.seq))).scalars().all()
+
+            state = json.loads(row.state)
+            state.update(await self._load_scoped_state(db, app_name, user_id))
+
+        return Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state=state,
+            events=[Event.model_validate_json(payload) for payload in payloads],
+            last_update_time=row.update_time,
+        )
+
+    async def list_sessions(self, *, app_name: str, user_id: str) -> ListSessionsResponse:
+        """List a user's sessions (recently updated first, without events)."""
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(AdkSessionORM.session_id, AdkSessionORM.state, AdkSessionORM.update_time)
+                .where(and_(AdkSessionORM.app_name == app_name, AdkSessionORM.user_id == user_id))
+                .order_by(AdkSessionORM.update_time.desc())
+            )
+            rows = result.all()
+            scoped_state = await self._load_scoped_state(db, app_name, user_id)
+
+        return ListSessionsResponse(
+            sessions=[
+                Session(
+                    app_name=app_name,
+                    user_id=user_id,
+                    id=row.session_id,
+                    state={**json.loads(row.state), **scoped_state},
+                    last_update_time=row.update_time,
+                )
+                for row in rows
+            ]
+        )
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """Delete a session and its events."""
+        async with self._session_factory() as db:
+            await db.execute(
+                delete(AdkEventORM).where(
+                    and_(
+                        AdkEventORM.app_name == app_name,
+                        AdkEventORM.user_id == user_id,
+                        AdkEventORM.session_id == session_id,
+                    )
+                )
+            )
+            await db.execute(
+                delete(AdkSessionORM).where(
+                    and_(
+                        AdkSessionORM.app_name == app_name,
+                        AdkSessionORM.user_id == user_id,
+                        AdkSessionORM.session_id == session_id,
+                    )
+                )
+            )
+            await db.commit()
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        """Append an event: one INSERT, plus in-SQL updates of its state delta."""
+        if event.partial:
+            return event
+
+        delta = event.actions.state_delta if event.actions else None
+        app_state, user_state, session_state = _split_state(delta)
+        values: dict[str, Any] = {"update_time": event.timestamp}
+        if session_state:
+            values["state"] = _json_update(AdkSessionORM.state, session_state)
+
+        async with self._session_factory() as db:
+            await db.execute(
+                insert(AdkEventORM).values(
+                    app_name=session.app_name,
+                    user_id=session.user_id,
+                    session_id=session.id,
+                    timestamp=event.timestamp,
+                    payload=event.model_dump_json(exclude_none=True),
+                )
+            )
+            await db.execute(
+                update(AdkSessionORM)
+                .where(
+                    and_(
+                        AdkSessionORM.app_name == session.app_name,
+                        AdkSessionORM.user_id == session.user_id,
+                        AdkSessionORM.session_id == session.id,
+                    )
+                )
+                .values(**values)
+            )
+            await self._merge_scoped_state(
+                db, session.app_name, session.user_id, app_state, user_state
+            )
+            await db.commit()
+
+        # The in-memory session only changes once the event is stored
+        await super().append_event(session=session, event=event)
+        session.last_update_time = event.timestamp
+        return event
+
+    async def _load_scoped_state(
+        self, db: AsyncSession, app_name: str, user_id: str
+    ) -> dict[str, Any]:
+        """App and user state, with their key prefixes."""
+        result: Result[Any] = await db.execute(
+            select(AdkStateORM.user_id, AdkStateORM.state).where(
+                and_(
+                    AdkStateORM.app_name == app_name,
+                    AdkStateORM.user_id.in_([_APP_SCOPE, user_id]),
+                )
+            )
+        )
+        state: dict[str, Any] = {}
+        for scope, raw in result.all():
+            prefix = State.APP_PREFIX if scope == _APP_SCOPE else State.USER_PREFIX
+            state.update({prefix + key: value for key, value in json.loads(raw).items()})
+        return state
+
+    async def _merge_scoped_state(
+        self,
+        db: AsyncSession,
+        app_name: str,
+        user_id: str,
+        app_state: dict[str, Any],
+        user_state: dict[str, Any],
+    ) -> None:
+        for scope, delta in ((_APP_SCOPE, app_state), (user_id, user_state)):
+            if not delta:
+                continue
+            await upsert_returning(
+                db,
+                AdkStateORM,
+                values={"app_name": app_name, "user_id": scope, "state": json.dumps(delta)},
+                conflict_columns=[AdkStateORM.app_name, AdkStateORM.user_id],
+                set_={"state": _json_update(AdkStateORM.state, delta)},
+            )
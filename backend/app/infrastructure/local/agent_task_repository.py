@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, case, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -17,6 +17,11 @@ from app.interfaces.agent_task_repository import IAgentTaskRepository
 from app.models.agent_task import AgentTask, AgentTaskCreate, AgentTaskUpdate, AgentTaskPayload
 from app.models.enums import AgentTaskStatus, ActionType
 from app.infrastructure.local.database import AgentTaskORM, get_session_factory
+from app.infrastructure.local.pagination import apply_keyset
+from app.infrastructure.local.returning import insert_returning, update_returning
+
+# Failed attempts before an agent task is marked FAILED
+MAX_RETRIES = 3
 
 
 class SqliteAgentTaskRepository(IAgentTaskRepository):
@@ -45,17 +50,17 @@ class SqliteAgentTaskRepository(IAgentTaskRepository):
     async def create(self, user_id: str, task: AgentTaskCreate) -> AgentTask:
         """Create a new agent task."""
         async with self._session_factory() as session:
-            orm = AgentTaskORM(
+            row = await insert_returning(
+                session,
+                AgentTaskORM,
                 id=str(uuid4()),
                 user_id=user_id,
                 trigger_time=task.trigger_time,
                 action_type=task.action_type.value,
                 payload=task.payload.model_dump_json() if task.payload else None,
             )
-            session.add(orm)
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def get(self, user_id: str, task_id: UUID) -> Optional[AgentTask]:
         """Get an agent task by ID."""
@@ -74,15 +79,18 @@ class SqliteAgentTaskRepository(IAgentTaskRepository):
         status: Optional[AgentTaskStatus] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[AgentTask]:
-        """List agent tasks with optional filters."""
+        """List agent tasks with optional filters (by trigger_time, keyset-paginated)."""
         async with self._session_factory() as session:
             query = select(AgentTaskORM).where(AgentTaskORM.user_id == user_id)
 
             if status:
                 query = query.where(AgentTaskORM.status == status.value)
 
-            query = query.order_by(AgentTaskORM.trigger_time.asc())
+            query = apply_keyset(
+                query, AgentTaskORM.trigger_time, AgentTaskORM.id, after, descending=False
+            )
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
@@ -114,86 +122,80 @@ class SqliteAgentTaskRepository(IAgentTaskRepository):
         self, user_id: str, task_id: UUID, update: AgentTaskUpdate
     ) -> AgentTask:
         """Update an agent task."""
+        values = {"updated_at": datetime.utcnow()}
+        if update.trigger_time:
+            values["trigger_time"] = update.trigger_time
+        if update.status:
+            values["status"] = update.status.value
+        if update.payload:
+            values["payload"] = update.payload.model_dump_json()
+
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(AgentTaskORM).where(
-                    and_(AgentTaskORM.id == str(task_id), AgentTaskORM.user_id == user_id)
-                )
+            row = await update_returning(
+                session,
+                AgentTaskORM,
+                [AgentTaskORM.id == str(task_id), AgentTaskORM.user_id == user_id],
+                **values,
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
+            if row is None:
                 raise NotFoundError(f"AgentTask {task_id} not found")
 
-            if update.trigger_time:
-                orm.trigger_time = update.trigger_time
-            if update.status:
-                orm.status = update.status.value
-            if update.payload:
-                orm.payload = update.payload.model_dump_json()
-
-            orm.updated_at = datetime.utcnow()
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def mark_completed(self, task_id: UUID) -> AgentTask:
         """Mark an agent task as completed."""
+        now = datetime.utcnow()
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(AgentTaskORM).where(AgentTaskORM.id == str(task_id))
+            row = await update_returning(
+                session,
+                AgentTaskORM,
+                [AgentTaskORM.id == str(task_id)],
+                status=AgentTaskStatus.COMPLETED.value,
+                executed_at=now,
+                updated_at=now,
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
+            if row is None:
                 raise NotFoundError(f"AgentTask {task_id} not found")
 
-            orm.status = AgentTaskStatus.COMPLETED.value
-            orm.executed_at = datetime.utcnow()
-            orm.updated_at = datetime.utcnow()
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def mark_failed(self, task_id: UUID, error: str) -> AgentTask:
         """Mark an agent task as failed."""
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(AgentTaskORM).where(AgentTaskORM.id == str(task_id))
+            # SET expressions see the previous row values
+            row = await update_returning(
+                session,
+                AgentTaskORM,
+                [AgentTaskORM.id == str(task_id)],
+                retry_count=AgentTaskORM.retry_count + 1,
+                last_error=error,
+                status=case(
+                    (AgentTaskORM.retry_count + 1 >= MAX_RETRIES, AgentTaskStatus.FAILED.value),
+                    else_=AgentTaskORM.status,
+                ),
+                updated_at=datetime.utcnow(),
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
+            if row is None:
                 raise NotFoundError(f"AgentTask {task_id} not found")
 
-            orm.retry_count += 1
-            orm.last_error = error
-            if orm.retry_count >= 3:
-                orm.status = AgentTaskStatus.FAILED.value
-            orm.updated_at = datetime.utcnow()
-
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def cancel(self, user_id: str, task_id: UUID) -> bool:
         """Cancel an agent task."""
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(AgentTaskORM).where(
-                    and_(
-                        AgentTaskORM.id == str(task_id),
-                        AgentTaskORM.user_id == user_id,
-                        AgentTaskORM.status == AgentTaskStatus.PENDING.value,
-                    )
-                )
+            row = await update_returning(
+                session,
+                AgentTaskORM,
+                [
+                    AgentTaskORM.id == str(task_id),
+                    AgentTaskORM.user_id == user_id,
+                    AgentTaskORM.status == AgentTaskStatus.PENDING.value,
+                ],
+                status=AgentTaskStatus.CANCELLED.value,
+                updated_at=datetime.utcnow(),
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
-                return False
-
-            orm.status = AgentTaskStatus.CANCELLED.value
-            orm.updated_at = datetime.utcnow()
             await session.commit()
-            return True
+            return row is not None
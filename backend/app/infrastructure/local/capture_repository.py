@@ -9,6 +9,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import select, and_
+from sqlalchemy import delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -16,6 +17,8 @@ from app.interfaces.capture_repository import ICaptureRepository
 from app.models.capture import Capture, CaptureCreate
 from app.models.enums import ContentType
 from app.infrastructure.local.database import CaptureORM, get_session_factory
+from app.infrastructure.local.pagination import apply_keyset
+from app.infrastructure.local.returning import insert_returning, update_returning
 
 
 class SqliteCaptureRepository(ICaptureRepository):
@@ -41,7 +44,9 @@ class SqliteCaptureRepository(ICaptureRepository):
     async def create(self, user_id: str, capture: CaptureCreate) -> Capture:
         """Create a new capture."""
         async with self._session_factory() as session:
-            orm = CaptureORM(
+            row = await insert_returning(
+                session,
+                CaptureORM,
                 id=str(uuid4()),
                 user_id=user_id,
                 content_type=capture.content_type.value,
@@ -50,10 +55,8 @@ class SqliteCaptureRepository(ICaptureRepository):
                 transcription=capture.transcription,
                 image_analysis=capture.image_analysis,
             )
-            session.add(orm)
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def get(self, user_id: str, capture_id: UUID) -> Optional[Capture]:
         """Get a capture by ID."""
@@ -72,15 +75,16 @@ class SqliteCaptureRepository(ICaptureRepository):
         processed: Optional[bool] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[Capture]:
-        """List captures with optional filters."""
+        """List captures with optional filters (newest first, keyset-paginated)."""
         async with self._session_factory() as session:
             query = select(CaptureORM).where(CaptureORM.user_id == user_id)
 
             if processed is not None:
                 query = query.where(CaptureORM.processed == processed)
 
-            query = query.order_by(CaptureORM.created_at.desc())
+            query = apply_keyset(query, CaptureORM.created_at, CaptureORM.id, after)
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
@@ -89,34 +93,25 @@ class SqliteCaptureRepository(ICaptureRepository):
     async def mark_processed(self, user_id: str, capture_id: UUID) -> Capture:
         """Mark a capture as processed."""
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(CaptureORM).where(
-                    and_(CaptureORM.id == str(capture_id), CaptureORM.user_id == user_id)
-                )
+            row = await update_returning(
+                session,
+                CaptureORM,
+                [CaptureORM.id == str(capture_id), CaptureORM.user_id == user_id],
+                processed=True,
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
+            if row is None:
                 raise NotFoundError(f"Capture {capture_id} not found")
 
-            orm.processed = True
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def delete(self, user_id: str, capture_id: UUID) -> bool:
         """Delete a capture."""
         async with self._session_factory() as session:
             result = await session.execute(
-                select(CaptureORM).where(
+                sql_delete(CaptureORM).where(
                     and_(CaptureORM.id == str(capture_id), CaptureORM.user_id == user_id)
                 )
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
-                return False
-
-            await session.delete(orm)
             await session.commit()
-            return True
+            return bool(result.rowcount)
@@ -8,11 +8,17 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, case, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import NotFoundError
 from app.interfaces.chat_session_repository import IChatSessionRepository
-from app.models.chat_session import ChatSession, ChatMessage
+from app.models.chat_session import ChatSession, ChatMessage, ChatSessionSummary
 from app.infrastructure.local.database import ChatSessionORM, ChatMessageORM, get_session_factory
+from app.infrastructure.local.pagination import apply_keyset
+from app.infrastructure.local.returning import insert_returning, upsert_returning
+
+DEFAULT_TITLE = "New Chat"
 
 
 class SqliteChatSessionRepository(IChatSessionRepository):
@@ -26,7 +32,7 @@ class SqliteChatSessionRepository(IChatSessionRepository):
         return ChatSession(
             session_id=orm.session_id,
             user_id=orm.user_id,
-            title=orm.title or "New Chat",
+            title=orm.title or DEFAULT_TITLE,
             created_at=orm.created_at,
             updated_at=orm.updated_at,
         )
@@ -42,39 +48,53 @@ class SqliteChatSessionRepository(IChatSessionRepository):
             created_at=orm.created_at,
         )
 
+    async def _upsert_session(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        session_id: str,
+        title: Optional[str],
+    ):
+        """Create the session row or bump updated_at (and fill a default title)."""
+        now = datetime.utcnow()
+        set_ = {"updated_at": now}
+        if title:
+            set_["title"] = case(
+                (
+                    or_(ChatSessionORM.title.is_(None), ChatSessionORM.title == DEFAULT_TITLE),
+                    title,
+                ),
+                else_=ChatSessionORM.title,
+            )
+        row = await upsert_returning(
+            session,
+            ChatSessionORM,
+            values={
+                "session_id": session_id,
+                "user_id": user_id,
+                "title": title or DEFAULT_TITLE,
+                "created_at": now,
+                "updated_at": now,
+            },
+            conflict_columns=[ChatSessionORM.session_id],
+            set_=set_,
+            where=ChatSessionORM.user_id == user_id,
+        )
+        if row is None:
+            raise NotFoundError(f"Chat session {session_id} not found")
+        return row
+
     async def touch_session(
         self,
         user_id: str,
         session_id: str,
         title: Optional[str] = None,
     ) -> ChatSession:
-        """Create or update a chat session."""
+        """Create or update a chat session (single upsert)."""
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(ChatSessionORM).where(
-                    and_(
-                        ChatSessionORM.session_id == session_id,
-                        ChatSessionORM.user_id == user_id,
-                    )
-                )
-            )
-            orm = result.scalar_one_or_none()
-
-            if orm:
-                orm.updated_at = datetime.utcnow()
-                if title and (not orm.title or orm.title == "New Chat"):
-                    orm.title = title
-            else:
-                orm = ChatSessionORM(
-                    session_id=session_id,
-                    user_id=user_id,
-                    title=title or "New Chat",
-                )
-                session.add(orm)
-
+            row = await self._upsert_session(session, user_id, session_id, title)
             await session.commit()
-            await session.refresh(orm)
-            return self._session_orm_to_model(orm)
+            return self._session_orm_to_model(row)
 
     async def list_sessions(
         self,
@@ -102,40 +122,19 @@ class SqliteChatSessionRepository(IChatSessionRepository):
         content: str,
         title: Optional[str] = None,
     ) -> ChatMessage:
-        """Add a message to a session."""
+        """Add a message to a session (session upsert + message insert)."""
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(ChatSessionORM).where(
-                    and_(
-                        ChatSessionORM.session_id == session_id,
-                        ChatSessionORM.user_id == user_id,
-                    )
-                )
-            )
-            session_orm = result.scalar_one_or_none()
-            if session_orm:
-                session_orm.updated_at = datetime.utcnow()
-                if title and (not session_orm.title or session_orm.title == "New Chat"):
-                    session_orm.title = title
-            else:
-                session_orm = ChatSessionORM(
-                    session_id=session_id,
-                    user_id=user_id,
-                    title=title or "New Chat",
-                )
-                session.add(session_orm)
-
-            message_orm = ChatMessageORM(
+            await self._upsert_session(session, user_id, session_id, title)
+            row = await insert_returning(
+                session,
+                ChatMessageORM,
                 session_id=session_id,
                 user_id=user_id,
                 role=role,
                 content=content or "",
             )
-            session.add(message_orm)
-
             await session.commit()
-            await session.refresh(message_orm)
-            return self._message_orm_to_model(message_orm)
+            return self._message_orm_to_model(row)
 
     async def list_messages(
         self,
@@ -143,8 +142,30 @@ class SqliteChatSessionRepository(IChatSessionRepository):
         session_id: str,
         limit: int = 500,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[ChatMessage]:
-        """List messages for a session."""
+        """List messages for a session (chronological, keyset-paginated)."""
+        async with self._session_factory() as session:
+            query = select(ChatMessageORM).where(
+                and_(
+                    ChatMessageORM.session_id == session_id,
+                    ChatMessageORM.user_id == user_id,
+                )
+            )
+            query = apply_keyset(
+                query, ChatMessageORM.created_at, ChatMessageORM.id, after, descending=False
+            )
+            query = query.limit(limit).offset(offset)
+            result = await session.execute(query)
+            return [self._message_orm_to_model(orm) for orm in result.scalars().all()]
+
+    async def list_recent_messages(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int,
+    ) -> list[ChatMessage]:
+        """List the latest messages of a session (backward index scan, then reversed)."""
         async with self._session_factory() as session:
             query = (
                 select(ChatMessageORM)
@@ -154,9 +175,50 @@ class SqliteChatSessionRepository(IChatSessionRepository):
                         ChatMessageORM.user_id == user_id,
                     )
                 )
-                .order_by(ChatMessageORM.created_at.asc())
+                .order_by(ChatMessageORM.created_at.desc(), ChatMessageORM.id.desc())
                 .limit(limit)
-                .offset(offset)
             )
             result = await session.execute(query)
-            return [self._message_orm_to_model(orm) for orm in result.scalars().all()]
+            return [self._message_orm_to_model(orm) for orm in reversed(result.scalars().all())]
+
+    async def get_summary(self, user_id: str, session_id: str) -> Optional[ChatSessionSummary]:
+        """Get the running summary of a session (primary-key read)."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ChatSessionORM.summary, ChatSessionORM.summarized_until).where(
+                    and_(
+                        ChatSessionORM.session_id == session_id,
+                        ChatSessionORM.user_id == user_id,
+                    )
+                )
+            )
+            row = result.one_or_none()
+            if row is None or not row.summary:
+                return None
+            return ChatSessionSummary(
+                session_id=session_id,
+                summary=row.summary,
+                summarized_until=row.summarized_until or 0.0,
+            )
+
+    async def save_summary(
+        self,
+        user_id: str,
+        session_id: str,
+        summary: str,
+        summarized_until: float,
+    ) -> None:
+        """Store the running summary unless a wider one is stored already."""
+        async with self._session_factory() as session:
+            await session.execute(
+                update(ChatSessionORM)
+                .where(
+                    and_(
+                        ChatSessionORM.session_id == session_id,
+                        ChatSessionORM.user_id == user_id,
+                        ChatSessionORM.summarized_until <= summarized_until,
+                    )
+                )
+                .values(summary=summary, summarized_until=summarized_until)
+            )
+            await session.commit()
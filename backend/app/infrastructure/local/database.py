@@ -11,17 +11,21 @@ from uuid import uuid4
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     JSON,
-    create_engine,
+    event,
+    make_url,
 )
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import get_settings
 
@@ -41,6 +45,16 @@ class TaskORM(Base):
     """Task ORM model."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # SqliteTaskRepository.list(status=...) / GET /api/tasks?status=...: status
+        # equality, newest first
+        Index("ix_tasks_user_status_created", "user_id", "status", "created_at"),
+        # SqliteTaskRepository.list without a status (default status != 'DONE', or
+        # include_done), newest first
+        Index("ix_tasks_user_created", "user_id", "created_at"),
+        # Project-scoped listing / KPI aggregation
+        Index("ix_tasks_user_project_created", "user_id", "project_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     user_id = Column(String(255), nullable=False, index=True)
@@ -93,6 +107,10 @@ class AgentTaskORM(Base):
     """AgentTask ORM model."""
 
     __tablename__ = "agent_tasks"
+    __table_args__ = (
+        # SqliteAgentTaskRepository.get_pending / list
+        Index("ix_agent_tasks_user_status_trigger", "user_id", "status", "trigger_time"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     user_id = Column(String(255), nullable=False, index=True)
@@ -111,6 +129,10 @@ class MemoryORM(Base):
     """Memory ORM model."""
 
     __tablename__ = "memories"
+    __table_args__ = (
+        # SqliteMemoryRepository.list (newest first)
+        Index("ix_memories_user_created", "user_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     user_id = Column(String(255), nullable=False, index=True)
@@ -128,6 +150,10 @@ class CaptureORM(Base):
     """Capture ORM model."""
 
     __tablename__ = "captures"
+    __table_args__ = (
+        # SqliteCaptureRepository.list (newest first)
+        Index("ix_captures_user_created", "user_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     user_id = Column(String(255), nullable=False, index=True)
@@ -144,10 +170,17 @@ class ChatSessionORM(Base):
     """Chat session ORM model."""
 
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # SqliteChatSessionRepository.list_sessions (recently updated first)
+        Index("ix_chat_sessions_user_updated", "user_id", "updated_at"),
+    )
 
     session_id = Column(String(100), primary_key=True)
     user_id = Column(String(255), nullable=False, index=True)
     title = Column(String(200), nullable=True)
+    # Running summary of the older turns (AgentService context compaction)
+    summary = Column(Text, nullable=True)
+    summarized_until = Column(Float, nullable=False, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -156,6 +189,11 @@ class ChatMessageORM(Base):
     """Chat message ORM model."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # SqliteChatSessionRepository.list_messages (chronological) and
+        # list_recent_messages (backward)
+        Index("ix_chat_messages_session_user_created", "session_id", "user_id", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     session_id = Column(String(100), ForeignKey("chat_sessions.session_id"), index=True)
@@ -165,21 +203,164 @@ class ChatMessageORM(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
+class UserDataVersionORM(Base):
+    """Per-user data version, bumped by triggers on every task/project write."""
+
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(String(255), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class TodayPlanORM(Base):
+    """Precomputed today view (schedule allocations and Top 3) per user and day."""
+
+    __tablename__ = "today_plans"
+
+    user_id = Column(String(255), primary_key=True)
+    plan_date = Column(Date, primary_key=True)
+    # user_data_versions.version the plan was computed from (missing row = 0)
+    data_version = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)  # TodayTasksResponse JSON
+    computed_at = Column(DateTime, default=datetime.utcnow)
+
+
+class AdkSessionORM(Base):
+    """ADK agent session, shared by all worker processes."""
+
+    __tablename__ = "adk_sessions"
+    __table_args__ = (
+        # SqliteAdkSessionService.list_sessions (recently updated first)
+        Index("ix_adk_sessions_app_user_updated", "app_name", "user_id", "update_time"),
+    )
+
+    app_name = Column(String(128), primary_key=True)
+    user_id = Column(String(255), primary_key=True)
+    session_id = Column(String(128), primary_key=True)
+    state = Column(Text, nullable=False, default="{}")  # Session-scoped state JSON
+    create_time = Column(Float, nullable=False)
+    update_time = Column(Float, nullable=False)
+
+
+class AdkEventORM(Base):
+    """ADK session event (append-only)."""
+
+    __tablename__ = "adk_events"
+    __table_args__ = (
+        # SqliteAdkSessionService.get_session (events in append order)
+        Index("ix_adk_events_session_seq", "app_name", "user_id", "session_id", "seq"),
+    )
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    app_name = Column(String(128), nullable=False)
+    user_id = Column(String(255), nullable=False)
+    session_id = Column(String(128), nullable=False)
+    timestamp = Column(Float, nullable=False)
+    payload = Column(Text, nullable=False)  # Event JSON
+
+
+class AdkStateORM(Base):
+    """ADK app-scoped (user_id "") and user-scoped state."""
+
+    __tablename__ = "adk_states"
+
+    app_name = Column(String(128), primary_key=True)
+    user_id = Column(String(255), primary_key=True)
+    state = Column(Text, nullable=False, default="{}")
+
+
 # ===========================================
 # Database Session Management
 # ===========================================
 
+# Process-wide engine and session factory.
+# Every repository shares one engine (and therefore one connection pool)
+# instead of creating its own. The FastAPI lifespan owns its lifecycle.
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[sessionmaker] = None
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return _is_sqlite(url) and make_url(url).database in (None, "", ":memory:")
+
 
-def get_engine():
-    """Get async engine instance."""
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune each new SQLite connection (WAL, busy timeout, caches)."""
     settings = get_settings()
-    return create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def create_engine_from_settings(url: Optional[str] = None) -> AsyncEngine:
+    """
+    Create a new async engine configured from settings.
+
+    Prefer get_engine() in application code; this is exposed for scripts
+    and tests that need an isolated engine.
+
+    Args:
+        url: Optional database URL (defaults to settings.DATABASE_URL)
+
+    Returns:
+        Configured AsyncEngine
+    """
+    settings = get_settings()
+    url = url or settings.DATABASE_URL
+
+    engine_kwargs: dict = {"echo": settings.DB_ECHO}
+    if _is_memory_sqlite(url):
+        # A single shared connection keeps the in-memory database alive.
+        engine_kwargs["poolclass"] = StaticPool
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        engine_kwargs["pool_size"] = settings.DB_POOL_SIZE
+        engine_kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+        engine_kwargs["pool_timeout"] = settings.DB_POOL_TIMEOUT
+        engine_kwargs["pool_pre_ping"] = not _is_sqlite(url)
+
+    engine = create_async_engine(url, **engine_kwargs)
+
+    if _is_sqlite(url):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    """Get the shared async engine instance (created lazily)."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine_from_settings()
+    return _engine
 
 
 def get_session_factory():
-    """Get async session factory."""
-    engine = get_engine()
-    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    """Get the shared async session factory."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections of the shared engine (call on shutdown)."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
 
 
 async def init_db():
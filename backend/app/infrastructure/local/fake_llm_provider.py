@@ -0,0 +1,110 @@
+"""
+Fake LLM provider for offline development and tests.
+
+Streams scripted replies (or an echo) through ADK like the real providers, without an API key.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai.types import Content, FinishReason, Part
+from pydantic import Field
+
+from app.interfaces.llm_provider import ILLMProvider
+
+
+class FakeStreamingLlm(BaseLlm):
+    """ADK model that replies with scripted text, in chunks when streaming."""
+
+    model: str = "fake-streaming"
+    # Replies in call order; once used up, the last user message is echoed
+    replies: list[str] = Field(default_factory=list)
+    # Characters per partial response
+    chunk_chars: int = 4
+    # Delay before each partial response (simulated token latency)
+    delay_ms: float = 0.0
+    calls: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """Yield the next reply: partial chunks when streaming, then the full text."""
+        text = self._next_reply(llm_request)
+        self.calls += 1
+
+        # Generation takes as long either way; only streaming shows it early
+        for start in range(0, len(text), self.chunk_chars):
+            if self.delay_ms:
+                await asyncio.sleep(self.delay_ms / 1000)
+            if stream:
+                yield LlmResponse(
+                    content=Content(
+                        role="model", parts=[Part(text=text[start : start + self.chunk_chars])]
+                    ),
+                    partial=True,
+                )
+
+        yield LlmResponse(
+            content=Content(role="model", parts=[Part(text=text)]),
+            finish_reason=FinishReason.STOP,
+        )
+
+    def _next_reply(self, llm_request: LlmRequest) -> str:
+        if self.calls < len(self.replies):
+            return self.replies[self.calls]
+        for content in reversed(llm_request.contents):
+            if content.role != "user":
+                continue
+            texts = [part.text for part in content.parts or [] if part.text]
+            if texts:
+                return f"了解しました: {' '.join(texts)}"
+        return "了解しました。"
+
+
+class FakeLLMProvider(ILLMProvider):
+    """Offline provider backed by FakeStreamingLlm."""
+
+    def __init__(
+        self,
+        replies: list[str] | None = None,
+        chunk_chars: int = 4,
+        delay_ms: float = 0.0,
+    ):
+        """
+        Initialize fake provider.
+
+        Args:
+            replies: Scripted replies in call order (then echo)
+            chunk_chars: Characters per streamed delta
+            delay_ms: Simulated latency before each delta
+        """
+        self._model = FakeStreamingLlm(
+            replies=list(replies or []),
+            chunk_chars=max(1, chunk_chars),
+            delay_ms=delay_ms,
+        )
+
+    def get_model(self) -> FakeStreamingLlm:
+        """Get the fake ADK model."""
+        return self._model
+
+    def get_model_name(self) -> str:
+        """Get human-readable model name."""
+        return "Fake (offline streaming)"
+
+    def supports_vision(self) -> bool:
+        """Images are accepted and ignored."""
+        return True
+
+    def supports_function_calling(self) -> bool:
+        """The fake model never calls tools."""
+        return False
+
+    def supports_streaming(self) -> bool:
+        """The fake model streams partial responses."""
+        return True
@@ -50,3 +50,6 @@ class GeminiAPIProvider(ILLMProvider):
         """Gemini models support function calling."""
         return True
 
+    def supports_streaming(self) -> bool:
+        """Gemini API streams responses (generate_content_stream)."""
+        return True
@@ -4,9 +4,7 @@ LiteLLM provider implementation for local development.
 Supports Bedrock, OpenAI, and other providers via LiteLLM.
 """
 
-from typing import Any
-
-from litellm import LiteLLM
+from google.adk.models.lite_llm import LiteLlm
 
 from app.core.config import get_settings
 from app.interfaces.llm_provider import ILLMProvider
@@ -24,14 +22,14 @@ class LiteLLMProvider(ILLMProvider):
         """
         self._model_name = model_name
         self._settings = get_settings()
-        self._litellm = LiteLLM(model=model_name)
+        self._litellm = LiteLlm(model=model_name)
 
-    def get_model(self) -> LiteLLM:
+    def get_model(self) -> LiteLlm:
         """
-        Get LiteLLM instance for ADK.
+        Get ADK LiteLlm model for the agent.
 
         Returns:
-            LiteLLM wrapper instance
+            LiteLlm wrapper instance
         """
         return self._litellm
 
@@ -57,3 +55,10 @@ class LiteLLMProvider(ILLMProvider):
         """
         return True
 
+    def supports_streaming(self) -> bool:
+        """
+        Check if model supports streaming.
+
+        LiteLlm streams with litellm's stream=True for every backend.
+        """
+        return True
@@ -11,6 +11,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import select, and_
+from sqlalchemy import delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -18,6 +19,8 @@ from app.interfaces.memory_repository import IMemoryRepository
 from app.models.memory import Memory, MemoryCreate, MemorySearchResult
 from app.models.enums import MemoryScope, MemoryType
 from app.infrastructure.local.database import MemoryORM, get_session_factory
+from app.infrastructure.local.pagination import apply_keyset
+from app.infrastructure.local.returning import insert_returning
 
 
 class SqliteMemoryRepository(IMemoryRepository):
@@ -45,7 +48,9 @@ class SqliteMemoryRepository(IMemoryRepository):
     async def create(self, user_id: str, memory: MemoryCreate) -> Memory:
         """Create a new memory."""
         async with self._session_factory() as session:
-            orm = MemoryORM(
+            row = await insert_returning(
+                session,
+                MemoryORM,
                 id=str(uuid4()),
                 user_id=user_id,
                 scope=memory.scope.value,
@@ -55,10 +60,8 @@ class SqliteMemoryRepository(IMemoryRepository):
                 tags=json.dumps(memory.tags) if memory.tags else None,
                 source=memory.source,
             )
-            session.add(orm)
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def get(self, user_id: str, memory_id: UUID) -> Optional[Memory]:
         """Get a memory by ID."""
@@ -79,8 +82,9 @@ class SqliteMemoryRepository(IMemoryRepository):
         project_id: Optional[UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[Memory]:
-        """List memories with optional filters."""
+        """List memories with optional filters (newest first, keyset-paginated)."""
         async with self._session_factory() as session:
             query = select(MemoryORM).where(MemoryORM.user_id == user_id)
 
@@ -91,7 +95,7 @@ class SqliteMemoryRepository(IMemoryRepository):
             if project_id:
                 query = query.where(MemoryORM.project_id == str(project_id))
 
-            query = query.order_by(MemoryORM.created_at.desc())
+            query = apply_keyset(query, MemoryORM.created_at, MemoryORM.id, after)
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
@@ -145,18 +149,12 @@ class SqliteMemoryRepository(IMemoryRepository):
         """Delete a memory."""
         async with self._session_factory() as session:
             result = await session.execute(
-                select(MemoryORM).where(
+                sql_delete(MemoryORM).where(
                     and_(MemoryORM.id == str(memory_id), MemoryORM.user_id == user_id)
                 )
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
-                return False
-
-            await session.delete(orm)
             await session.commit()
-            return True
+            return bool(result.rowcount)
 
     async def get_user_memories(
         self,
@@ -1,45 +1,306 @@
 """
 Database schema migration helpers.
 
-This module provides utilities for managing SQLite database schema migrations.
+This module provides a small versioned migration runner for SQLite.
+
+Each migration has a monotonically increasing version number. Applied
+versions are recorded in the ``schema_version`` table, so once the database
+is current, startup only costs a single ``SELECT MAX(version)``.
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
-from app.infrastructure.local.database import get_engine
+from app.core.logger import setup_logger
+from app.infrastructure.local.database import (
+    AdkEventORM,
+    AdkSessionORM,
+    AdkStateORM,
+    TodayPlanORM,
+    UserDataVersionORM,
+    get_engine,
+)
 
+logger = setup_logger(__name__)
 
-async def run_migrations():
-    """
-    Run all pending migrations.
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+@dataclass(frozen=True)
+class IndexDefinition:
+    """Index definition tied to the query path it serves."""
+
+    name: str
+    table: str
+    columns: tuple[str, ...]
+    query_path: str
+
+    def create_sql(self) -> str:
+        cols = ", ".join(self.columns)
+        return f"CREATE INDEX IF NOT EXISTS {self.name} ON {self.table}({cols})"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A single ordered schema migration step."""
+
+    version: int
+    description: str
+    apply: Callable[[AsyncConnection], Awaitable[None]] | None = None
+    indexes: tuple[IndexDefinition, ...] = field(default_factory=tuple)
+
+    async def run(self, conn: AsyncConnection) -> None:
+        if self.apply is not None:
+            await self.apply(conn)
+        for index in self.indexes:
+            await conn.execute(text(index.create_sql()))
+
+
+# ===========================================
+# Migration Steps
+# ===========================================
+
+
+async def _add_meeting_columns(conn: AsyncConnection) -> None:
+    """Add fixed-time/meeting columns to tasks (pre-versioning databases)."""
+    result = await conn.execute(text("PRAGMA table_info(tasks)"))
+    columns = {row[1] for row in result}
+
+    if "start_time" not in columns:
+        await conn.execute(text("ALTER TABLE tasks ADD COLUMN start_time DATETIME"))
+
+    if "end_time" not in columns:
+        await conn.execute(text("ALTER TABLE tasks ADD COLUMN end_time DATETIME"))
+
+    if "is_fixed_time" not in columns:
+        await conn.execute(text("ALTER TABLE tasks ADD COLUMN is_fixed_time BOOLEAN DEFAULT 0"))
+        await conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_tasks_is_fixed_time ON tasks(is_fixed_time)")
+        )
+
+    if "location" not in columns:
+        await conn.execute(text("ALTER TABLE tasks ADD COLUMN location VARCHAR(500)"))
+
+    if "attendees" not in columns:
+        await conn.execute(text("ALTER TABLE tasks ADD COLUMN attendees JSON"))
+
+    if "meeting_notes" not in columns:
+        await conn.execute(text("ALTER TABLE tasks ADD COLUMN meeting_notes TEXT"))
+
+
+QUERY_PATH_INDEXES: tuple[IndexDefinition, ...] = (
+    IndexDefinition(
+        name="ix_tasks_user_status_created",
+        table="tasks",
+        columns=("user_id", "status", "created_at"),
+        query_path="SqliteTaskRepository.list(status=...) (status equality, created_at DESC)",
+    ),
+    IndexDefinition(
+        name="ix_tasks_user_created",
+        table="tasks",
+        columns=("user_id", "created_at"),
+        query_path="SqliteTaskRepository.list (no status: open or include_done, created_at DESC)",
+    ),
+    IndexDefinition(
+        name="ix_tasks_user_project_created",
+        table="tasks",
+        columns=("user_id", "project_id", "created_at"),
+        query_path="SqliteTaskRepository.list (project filter) / project KPIs",
+    ),
+    IndexDefinition(
+        name="ix_agent_tasks_user_status_trigger",
+        table="agent_tasks",
+        columns=("user_id", "status", "trigger_time"),
+        query_path="SqliteAgentTaskRepository.get_pending / list",
+    ),
+    IndexDefinition(
+        name="ix_memories_user_created",
+        table="memories",
+        columns=("user_id", "created_at"),
+        query_path="SqliteMemoryRepository.list",
+    ),
+    IndexDefinition(
+        name="ix_captures_user_created",
+        table="captures",
+        columns=("user_id", "created_at"),
+        query_path="SqliteCaptureRepository.list",
+    ),
+    IndexDefinition(
+        name="ix_chat_sessions_user_updated",
+        table="chat_sessions",
+        columns=("user_id", "updated_at"),
+        query_path="SqliteChatSessionRepository.list_sessions",
+    ),
+    IndexDefinition(
+        name="ix_chat_messages_session_user_created",
+        table="chat_messages",
+        columns=("session_id", "user_id", "created_at"),
+        query_path="SqliteChatSessionRepository.list_messages",
+    ),
+)
+
+
+async def _analyze(conn: AsyncConnection) -> None:
+    """Refresh planner statistics so the new indexes are picked up."""
+    await conn.execute(text("ANALYZE"))
 
-    This function checks the current database schema and applies any missing
-    columns or indexes to bring the database up to date.
+
+# Tables whose writes change a user's schedule inputs
+DATA_VERSION_TABLES = ("tasks", "projects")
+
+
+def _data_version_trigger_sql(table: str, event: str) -> str:
+    row = "OLD" if event == "DELETE" else "NEW"
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_data_version "
+        f"AFTER {event} ON {table} BEGIN "
+        "INSERT INTO user_data_versions (user_id, version) "
+        f"VALUES ({row}.user_id, 1) "
+        "ON CONFLICT(user_id) DO UPDATE SET version = version + 1; "
+        "END"
+    )
+
+
+async def _add_today_plans(conn: AsyncConnection) -> None:
+    """Add precomputed today plans and per-user data versions bumped by triggers."""
+    await conn.run_sync(
+        lambda sync_conn: UserDataVersionORM.metadata.create_all(
+            sync_conn,
+            tables=[UserDataVersionORM.__table__, TodayPlanORM.__table__],
+        )
+    )
+    # Triggers see every write, including other processes and scripts
+    for table in DATA_VERSION_TABLES:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            await conn.execute(text(_data_version_trigger_sql(table, event)))
+
+
+async def _add_adk_sessions(conn: AsyncConnection) -> None:
+    """Add the persistent ADK session store (sessions, events, scoped state)."""
+    await conn.run_sync(
+        lambda sync_conn: AdkSessionORM.metadata.create_all(
+            sync_conn,
+            tables=[AdkSessionORM.__table__, AdkEventORM.__table__, AdkStateORM.__table__],
+        )
+    )
+
+
+async def _add_session_summaries(conn: AsyncConnection) -> None:
+    """Add running conversation summaries to chat sessions."""
+    result = await conn.execute(text("PRAGMA table_info(chat_sessions)"))
+    columns = {row[1] for row in result}
+
+    if "summary" not in columns:
+        await conn.execute(text("ALTER TABLE chat_sessions ADD COLUMN summary TEXT"))
+
+    if "summarized_until" not in columns:
+        await conn.execute(
+            text("ALTER TABLE chat_sessions ADD COLUMN summarized_until REAL NOT NULL DEFAULT 0")
+        )
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="Add meeting/fixed-time columns to tasks",
+        apply=_add_meeting_columns,
+    ),
+    Migration(
+        version=2,
+        description="Add composite indexes for list query paths",
+        indexes=QUERY_PATH_INDEXES,
+    ),
+    Migration(
+        version=3,
+        description="Collect planner statistics",
+        apply=_analyze,
+    ),
+    Migration(
+        version=4,
+        description="Add today plans and data version triggers",
+        apply=_add_today_plans,
+    ),
+    Migration(
+        version=5,
+        description="Add persistent ADK session store",
+        apply=_add_adk_sessions,
+    ),
+    Migration(
+        version=6,
+        description="Add running summaries to chat sessions",
+        apply=_add_session_summaries,
+    ),
+]
+
+LATEST_VERSION = max(migration.version for migration in MIGRATIONS)
+
+
+# ===========================================
+# Runner
+# ===========================================
+
+
+async def _ensure_version_table(conn: AsyncConnection) -> None:
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ("
+            "version INTEGER PRIMARY KEY, "
+            "description TEXT NOT NULL, "
+            "applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+    )
+
+
+async def get_schema_version(conn: AsyncConnection) -> int:
+    """Return the highest applied migration version (0 if none)."""
+    await _ensure_version_table(conn)
+    result = await conn.execute(text(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}"))
+    return result.scalar() or 0
+
+
+async def run_migrations(
+    migrations: list[Migration] | None = None,
+    engine: AsyncEngine | None = None,
+) -> int:
     """
-    engine = get_engine()
+    Run all pending migrations.
 
-    async with engine.begin() as conn:
-        # Check existing columns
-        result = await conn.execute(text("PRAGMA table_info(tasks)"))
-        columns = {row[1] for row in result}
+    Migrations are applied in version order, each in its own transaction
+    together with its ``schema_version`` row. If the database is already at
+    the latest version, no schema inspection is performed.
 
-        # Add new columns if they don't exist
-        if "start_time" not in columns:
-            await conn.execute(text("ALTER TABLE tasks ADD COLUMN start_time DATETIME"))
+    Args:
+        migrations: Optional migration list (defaults to MIGRATIONS)
+        engine: Optional engine (defaults to the shared engine)
 
-        if "end_time" not in columns:
-            await conn.execute(text("ALTER TABLE tasks ADD COLUMN end_time DATETIME"))
+    Returns:
+        Number of migrations applied
+    """
+    migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+    engine = engine or get_engine()
 
-        if "is_fixed_time" not in columns:
-            await conn.execute(text("ALTER TABLE tasks ADD COLUMN is_fixed_time BOOLEAN DEFAULT 0"))
-            # Create index for efficient filtering
-            await conn.execute(text("CREATE INDEX idx_tasks_is_fixed_time ON tasks(is_fixed_time)"))
+    async with engine.begin() as conn:
+        current = await get_schema_version(conn)
 
-        if "location" not in columns:
-            await conn.execute(text("ALTER TABLE tasks ADD COLUMN location VARCHAR(500)"))
+    pending = [m for m in migrations if m.version > current]
+    if not pending:
+        return 0
 
-        if "attendees" not in columns:
-            await conn.execute(text("ALTER TABLE tasks ADD COLUMN attendees JSON"))
+    for migration in pending:
+        async with engine.begin() as conn:
+            await migration.run(conn)
+            await conn.execute(
+                text(
+                    f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description) "
+                    "VALUES (:version, :description)"
+                ),
+                {"version": migration.version, "description": migration.description},
+            )
+        logger.info(f"Applied migration {migration.version}: {migration.description}")
 
-        if "meeting_notes" not in columns:
-            await conn.execute(text("ALTER TABLE tasks ADD COLUMN meeting_notes TEXT"))
+    return len(pending)
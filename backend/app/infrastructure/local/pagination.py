@@ -0,0 +1,54 @@
+"""
+Keyset pagination for SQLAlchemy queries.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Select, and_, or_
+
+from app.core.pagination import decode_cursor
+
+
+def apply_keyset(
+    query: Select,
+    sort_column,
+    id_column,
+    after: Optional[str] = None,
+    descending: bool = True,
+) -> Select:
+    """
+    Order a query by (sort_column, id_column) and continue after a cursor.
+
+    Args:
+        query: Base select
+        sort_column: Primary sort column (e.g. created_at)
+        id_column: Unique tie-breaker column
+        after: Opaque cursor of the last item on the previous page
+        descending: Sort direction
+
+    Returns:
+        Query with keyset condition and ORDER BY applied
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    if after:
+        sort_value, item_id = decode_cursor(after)
+        if descending:
+            query = query.where(
+                or_(
+                    sort_column < sort_value,
+                    and_(sort_column == sort_value, id_column < item_id),
+                )
+            )
+        else:
+            query = query.where(
+                or_(
+                    sort_column > sort_value,
+                    and_(sort_column == sort_value, id_column > item_id),
+                )
+            )
+
+    if descending:
+        return query.order_by(sort_column.desc(), id_column.desc())
+    return query.order_by(sort_column.asc(), id_column.asc())
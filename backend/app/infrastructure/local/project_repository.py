@@ -8,7 +8,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, case
+from sqlalchemy import delete as sql_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError
@@ -16,6 +17,7 @@ from app.interfaces.project_repository import IProjectRepository
 from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectWithTaskCount
 from app.models.enums import ProjectStatus, TaskStatus
 from app.infrastructure.local.database import ProjectORM, TaskORM, get_session_factory
+from app.infrastructure.local.returning import insert_returning, update_returning
 
 
 class SqliteProjectRepository(IProjectRepository):
@@ -46,7 +48,9 @@ class SqliteProjectRepository(IProjectRepository):
         """Create a new project."""
         async with self._session_factory() as session:
             kpi_config = project.kpi_config.model_dump() if project.kpi_config else None
-            orm = ProjectORM(
+            row = await insert_returning(
+                session,
+                ProjectORM,
                 id=str(uuid4()),
                 user_id=user_id,
                 name=project.name,
@@ -58,10 +62,8 @@ class SqliteProjectRepository(IProjectRepository):
                 key_points=project.key_points,
                 kpi_config=kpi_config,
             )
-            session.add(orm)
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def get(self, user_id: str, project_id: UUID) -> Optional[Project]:
         """Get a project by ID."""
@@ -94,98 +96,101 @@ class SqliteProjectRepository(IProjectRepository):
             result = await session.execute(query)
             return [self._orm_to_model(orm) for orm in result.scalars().all()]
 
+    def _task_count_query(self, user_id: str):
+        """Build a grouped project query with per-status task counts."""
+        done_count = func.coalesce(
+            func.sum(case((TaskORM.status == TaskStatus.DONE.value, 1), else_=0)), 0
+        )
+        in_progress_count = func.coalesce(
+            func.sum(case((TaskORM.status == TaskStatus.IN_PROGRESS.value, 1), else_=0)), 0
+        )
+        return (
+            select(
+                ProjectORM,
+                func.count(TaskORM.id).label("total_tasks"),
+                done_count.label("completed_tasks"),
+                in_progress_count.label("in_progress_tasks"),
+            )
+            .outerjoin(
+                TaskORM,
+                and_(TaskORM.project_id == ProjectORM.id, TaskORM.user_id == user_id),
+            )
+            .where(ProjectORM.user_id == user_id)
+            .group_by(ProjectORM.id)
+        )
+
+    def _row_to_task_count_model(self, row) -> ProjectWithTaskCount:
+        """Convert an aggregate row to ProjectWithTaskCount."""
+        project = self._orm_to_model(row[0])
+        return ProjectWithTaskCount(
+            **project.model_dump(),
+            total_tasks=row.total_tasks or 0,
+            completed_tasks=row.completed_tasks or 0,
+            in_progress_tasks=row.in_progress_tasks or 0,
+        )
+
     async def list_with_task_count(
         self,
         user_id: str,
         status: Optional[str] = None,
     ) -> list[ProjectWithTaskCount]:
-        """List projects with task statistics."""
-        projects = await self.list(user_id, status)
-        result = []
-
+        """List projects with task statistics (single aggregate query)."""
         async with self._session_factory() as session:
-            for project in projects:
-                # Total tasks
-                total = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        and_(
-                            TaskORM.user_id == user_id,
-                            TaskORM.project_id == str(project.id),
-                        )
-                    )
-                )
-                # Completed tasks
-                completed = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        and_(
-                            TaskORM.user_id == user_id,
-                            TaskORM.project_id == str(project.id),
-                            TaskORM.status == TaskStatus.DONE.value,
-                        )
-                    )
-                )
-                # In progress tasks
-                in_progress = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        and_(
-                            TaskORM.user_id == user_id,
-                            TaskORM.project_id == str(project.id),
-                            TaskORM.status == TaskStatus.IN_PROGRESS.value,
-                        )
-                    )
-                )
+            query = self._task_count_query(user_id)
+            if status:
+                query = query.where(ProjectORM.status == status)
+            query = query.order_by(ProjectORM.created_at.desc())
 
-                result.append(ProjectWithTaskCount(
-                    **project.model_dump(),
-                    total_tasks=total.scalar() or 0,
-                    completed_tasks=completed.scalar() or 0,
-                    in_progress_tasks=in_progress.scalar() or 0,
-                ))
+            result = await session.execute(query)
+            return [self._row_to_task_count_model(row) for row in result.all()]
 
-        return result
+    async def get_with_task_count(
+        self,
+        user_id: str,
+        project_id: UUID,
+    ) -> Optional[ProjectWithTaskCount]:
+        """Get a single project with task statistics."""
+        async with self._session_factory() as session:
+            query = self._task_count_query(user_id).where(ProjectORM.id == str(project_id))
+            result = await session.execute(query)
+            row = result.first()
+            return self._row_to_task_count_model(row) if row else None
 
     async def update(
         self, user_id: str, project_id: UUID, update: ProjectUpdate
     ) -> Project:
         """Update an existing project."""
+        values = {}
+        update_data = update.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            if value is not None:
+                if field == "kpi_config" and hasattr(value, "model_dump"):
+                    value = value.model_dump()
+                if hasattr(value, "value"):  # Enum
+                    value = value.value
+                values[field] = value
+        values["updated_at"] = datetime.utcnow()
+
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(ProjectORM).where(
-                    and_(ProjectORM.id == str(project_id), ProjectORM.user_id == user_id)
-                )
+            row = await update_returning(
+                session,
+                ProjectORM,
+                [ProjectORM.id == str(project_id), ProjectORM.user_id == user_id],
+                **values,
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
+            if row is None:
                 raise NotFoundError(f"Project {project_id} not found")
 
-            update_data = update.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                if value is not None:
-                    if field == "kpi_config" and hasattr(value, "model_dump"):
-                        value = value.model_dump()
-                    if hasattr(value, "value"):  # Enum
-                        value = value.value
-                    setattr(orm, field, value)
-
-            orm.updated_at = datetime.utcnow()
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return self._orm_to_model(row)
 
     async def delete(self, user_id: str, project_id: UUID) -> bool:
         """Delete a project."""
         async with self._session_factory() as session:
             result = await session.execute(
-                select(ProjectORM).where(
+                sql_delete(ProjectORM).where(
                     and_(ProjectORM.id == str(project_id), ProjectORM.user_id == user_id)
                 )
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
-                return False
-
-            await session.delete(orm)
             await session.commit()
-            return True
+            return bool(result.rowcount)
@@ -0,0 +1,97 @@
+"""
+Single-statement write helpers using SQLite RETURNING (SQLite >= 3.35).
+
+Each helper issues one INSERT/UPDATE/UPSERT and returns the written row with
+all columns, so repositories don't need a follow-up refresh SELECT. Result
+rows expose columns as attributes, like ORM objects, and can be passed to
+the repositories' ``_orm_to_model`` converters directly.
+"""
+
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import ColumnElement, Row, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.local.database import Base
+
+
+async def insert_returning(session: AsyncSession, model: type[Base], **values: Any) -> Row:
+    """
+    INSERT a row and return it.
+
+    Column defaults declared on the model (ids, timestamps, status) are
+    applied as usual.
+
+    Args:
+        session: Active session
+        model: ORM model class
+        **values: Column values
+
+    Returns:
+        Inserted row
+    """
+    result = await session.execute(
+        insert(model).values(**values).returning(*model.__table__.c)
+    )
+    return result.one()
+
+
+async def update_returning(
+    session: AsyncSession,
+    model: type[Base],
+    where: Iterable[ColumnElement[bool]],
+    **values: Any,
+) -> Optional[Row]:
+    """
+    UPDATE a single row and return it.
+
+    Values may be SQL expressions (e.g. ``Model.counter + 1``); they see the
+    row's previous values.
+
+    Args:
+        session: Active session
+        model: ORM model class
+        where: Conditions identifying the row
+        **values: Column values
+
+    Returns:
+        Updated row, or None if no row matched
+    """
+    result = await session.execute(
+        update(model).where(*where).values(**values).returning(*model.__table__.c)
+    )
+    return result.one_or_none()
+
+
+async def upsert_returning(
+    session: AsyncSession,
+    model: type[Base],
+    values: dict[str, Any],
+    conflict_columns: Iterable[ColumnElement[Any]],
+    set_: dict[str, Any],
+    where: Optional[ColumnElement[bool]] = None,
+) -> Optional[Row]:
+    """
+    INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+
+    Args:
+        session: Active session
+        model: ORM model class
+        values: Column values for the insert
+        conflict_columns: Unique columns that identify an existing row
+        set_: Column values applied to an existing row
+        where: Optional condition on the existing row for the update
+
+    Returns:
+        Inserted or updated row, or None if the conflicting row did not
+        satisfy ``where``
+    """
+    statement = (
+        sqlite_insert(model)
+        .values(**values)
+        .on_conflict_do_update(index_elements=list(conflict_columns), set_=set_, where=where)
+        .returning(*model.__table__.c)
+    )
+    result = await session.execute(statement)
+    return result.one_or_none()
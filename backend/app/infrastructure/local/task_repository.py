@@ -4,19 +4,81 @@ SQLite implementation of Task repository.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-from typing import Optional
+from typing import Any, AsyncGenerator, Callable, Optional, Sequence
 from uuid import UUID, uuid4
 
 from sqlalchemy import select, func, and_, or_
+from sqlalchemy import delete as sql_delete, update as sql_update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import NotFoundError, ValidationError
 from app.interfaces.task_repository import ITaskRepository
-from app.models.task import Task, TaskCreate, TaskUpdate, SimilarTask
-from app.models.enums import TaskStatus
+from app.models.task import (
+    TASK_FIELDS,
+    SimilarTask,
+    Task,
+    TaskCreate,
+    TaskFilters,
+    TaskSummary,
+    TaskUpdate,
+)
+from app.models.enums import CreatedBy, EnergyLevel, Priority, TaskStatus
 from app.infrastructure.local.database import TaskORM, get_session_factory
+from app.infrastructure.local.pagination import apply_keyset
+from app.infrastructure.local.returning import insert_returning, update_returning
+
+
+def _optional_uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+# Column value -> model value conversions (columns not listed are passed through)
+# Nullable columns use converters that accept None
+_COLUMN_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "id": UUID,
+    "project_id": _optional_uuid,
+    "parent_id": _optional_uuid,
+    "source_capture_id": _optional_uuid,
+    "dependency_ids": lambda value: [UUID(dep_id) for dep_id in value or []],
+    "status": TaskStatus,
+    "importance": Priority,
+    "urgency": Priority,
+    "energy_level": EnergyLevel,
+    "created_by": CreatedBy,
+    "is_fixed_time": bool,
+    "attendees": lambda value: value or [],
+}
+
+
+def _column_values(source: Any, fields: Sequence[str]) -> dict[str, Any]:
+    """
+    Convert column values to Task/TaskSummary field values.
+
+    Args:
+        source: ORM object or result row exposing columns as attributes
+        fields: Task fields to copy from the source
+    """
+    values: dict[str, Any] = {}
+    for name in fields:
+        converter = _COLUMN_CONVERTERS.get(name)
+        value = getattr(source, name)
+        values[name] = converter(value) if converter else value
+
+    # Mirror TaskBase.validate_fixed_time for TaskSummary: meetings default to their duration
+    if (
+        values.get("is_fixed_time")
+        and "estimated_minutes" in values
+        and not values["estimated_minutes"]
+        and values.get("start_time")
+        and values.get("end_time")
+    ):
+        values["estimated_minutes"] = int(
+            (values["end_time"] - values["start_time"]).total_seconds() / 60
+        )
+    return values
 
 
 class SqliteTaskRepository(ITaskRepository):
@@ -32,62 +94,122 @@ class SqliteTaskRepository(ITaskRepository):
         self._session_factory = session_factory or get_session_factory()
 
     def _orm_to_model(self, orm: TaskORM) -> Task:
-        """Convert ORM object to Pydantic model."""
-        return Task(
-            id=UUID(orm.id),
-            user_id=orm.user_id,
-            project_id=UUID(orm.project_id) if orm.project_id else None,
-            title=orm.title,
-            description=orm.description,
-            status=TaskStatus(orm.status),
-            importance=orm.importance,
-            urgency=orm.urgency,
-            energy_level=orm.energy_level,
-            estimated_minutes=orm.estimated_minutes,
-            due_date=orm.due_date,
-            parent_id=UUID(orm.parent_id) if orm.parent_id else None,
-            dependency_ids=[UUID(dep_id) for dep_id in (orm.dependency_ids or [])],
-            source_capture_id=UUID(orm.source_capture_id) if orm.source_capture_id else None,
-            created_by=orm.created_by,
-            created_at=orm.created_at,
-            updated_at=orm.updated_at,
-            start_time=orm.start_time,
-            end_time=orm.end_time,
-            is_fixed_time=bool(orm.is_fixed_time),
-            location=orm.location,
-            attendees=orm.attendees or [],
-            meeting_notes=orm.meeting_notes,
+        """Convert ORM object (or a row of task columns) to Pydantic model."""
+        return Task.model_validate(_column_values(orm, TASK_FIELDS))
+
+    @staticmethod
+    def _projection(fields: Sequence[str]) -> tuple[str, ...]:
+        """
+        Resolve requested fields to the columns to select.
+
+        id and created_at are always loaded (identity and cursor key).
+
+        Raises:
+            ValidationError: If a field is unknown
+        """
+        unknown = sorted(set(fields) - set(TASK_FIELDS))
+        if unknown:
+            raise ValidationError(f"Unknown task fields: {', '.join(unknown)}")
+        requested = {"id", "created_at", *fields}
+        return tuple(name for name in TASK_FIELDS if name in requested)
+
+    def _insert_values(
+        self,
+        user_id: str,
+        task: TaskCreate,
+        task_id: Optional[str] = None,
+        dependency_ids: Optional[list[str]] = None,
+        created_at: Optional[datetime] = None,
+    ) -> dict[str, Any]:
+        """Build column values for a new task row from creation data."""
+        if dependency_ids is None:
+            dependency_ids = [str(dep_id) for dep_id in task.dependency_ids]
+        values = dict(
+            id=task_id or str(uuid4()),
+            user_id=user_id,
+            project_id=str(task.project_id) if task.project_id else None,
+            title=task.title,
+            description=task.description,
+            importance=task.importance.value,
+            urgency=task.urgency.value,
+            energy_level=task.energy_level.value,
+            estimated_minutes=task.estimated_minutes,
+            due_date=task.due_date,
+            parent_id=str(task.parent_id) if task.parent_id else None,
+            dependency_ids=dependency_ids,
+            source_capture_id=str(task.source_capture_id) if task.source_capture_id else None,
+            created_by=task.created_by.value,
+            start_time=task.start_time,
+            end_time=task.end_time,
+            is_fixed_time=task.is_fixed_time,
+            location=task.location,
+            attendees=task.attendees,
+            meeting_notes=task.meeting_notes,
         )
+        if created_at is not None:
+            values.update(status=TaskStatus.TODO.value, created_at=created_at, updated_at=created_at)
+        return values
+
+    @staticmethod
+    def _update_values(update: TaskUpdate) -> dict[str, Any]:
+        """Build column values for an update (always bumps updated_at)."""
+        values = {}
+        for field, value in update.model_dump(exclude_unset=True).items():
+            if value is not None:
+                if field in ("project_id", "parent_id", "source_capture_id"):
+                    value = str(value) if value else None
+                elif field == "dependency_ids":
+                    value = [str(dep_id) for dep_id in value]
+                elif hasattr(value, "value"):  # Enum
+                    value = value.value
+                values[field] = value
+
+        values["updated_at"] = datetime.utcnow()
+        return values
 
     async def create(self, user_id: str, task: TaskCreate) -> Task:
-        """Create a new task."""
+        """Create a new task (single INSERT ... RETURNING)."""
         async with self._session_factory() as session:
-            orm = TaskORM(
-                id=str(uuid4()),
-                user_id=user_id,
-                project_id=str(task.project_id) if task.project_id else None,
-                title=task.title,
-                description=task.description,
-                importance=task.importance.value,
-                urgency=task.urgency.value,
-                energy_level=task.energy_level.value,
-                estimated_minutes=task.estimated_minutes,
-                due_date=task.due_date,
-                parent_id=str(task.parent_id) if task.parent_id else None,
-                dependency_ids=[str(dep_id) for dep_id in task.dependency_ids],
-                source_capture_id=str(task.source_capture_id) if task.source_capture_id else None,
-                created_by=task.created_by.value,
-                start_time=task.start_time,
-                end_time=task.end_time,
-                is_fixed_time=task.is_fixed_time,
-                location=task.location,
-                attendees=task.attendees,
-                meeting_notes=task.meeting_notes,
+            row = await insert_returning(session, TaskORM, **self._insert_values(user_id, task))
+            await session.commit()
+            return self._orm_to_model(row)
+
+    async def create_many(self, user_id: str, tasks: list[TaskCreate]) -> list[Task]:
+        """Create multiple tasks in a single transaction."""
+        if not tasks:
+            return []
+
+        # Pre-generate IDs so siblings can reference each other inside the batch
+        task_ids = [str(uuid4()) for _ in tasks]
+        now = datetime.utcnow()
+        orms: list[TaskORM] = []
+
+        for index, task in enumerate(tasks):
+            dependency_ids = [str(dep_id) for dep_id in task.dependency_ids]
+            for dep_index in getattr(task, "batch_dependency_indexes", []):
+                if dep_index < 0 or dep_index >= len(tasks) or dep_index == index:
+                    raise ValidationError(
+                        f"Invalid batch dependency index {dep_index} for task {index}"
+                    )
+                dep_id = task_ids[dep_index]
+                if dep_id not in dependency_ids:
+                    dependency_ids.append(dep_id)
+
+            orms.append(
+                TaskORM(**self._insert_values(
+                    user_id,
+                    task,
+                    task_id=task_ids[index],
+                    dependency_ids=dependency_ids,
+                    # Keep batch order stable for created_at-ordered listings
+                    created_at=now + timedelta(microseconds=index),
+                ))
             )
-            session.add(orm)
+
+        async with self._session_factory() as session:
+            session.add_all(orms)
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return [self._orm_to_model(orm) for orm in orms]
 
     async def get(self, user_id: str, task_id: UUID) -> Optional[Task]:
         """Get a task by ID."""
@@ -109,10 +231,50 @@ class SqliteTaskRepository(ITaskRepository):
         include_done: bool = False,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[Task]:
-        """List tasks with optional filters."""
+        """List tasks with optional filters (newest first, keyset-paginated)."""
+        rows = await self._list_rows(
+            TASK_FIELDS, user_id, project_id, status, parent_id, include_done, limit, offset, after
+        )
+        return [self._orm_to_model(row) for row in rows]
+
+    async def list_summaries(
+        self,
+        user_id: str,
+        fields: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        parent_id: Optional[UUID] = None,
+        include_done: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        """List tasks like list(), selecting only the requested columns."""
+        projected = self._projection(fields)
+        rows = await self._list_rows(
+            projected, user_id, project_id, status, parent_id, include_done, limit, offset, after
+        )
+        return [TaskSummary.model_validate(_column_values(row, projected)) for row in rows]
+
+    async def _list_rows(
+        self,
+        columns: Sequence[str],
+        user_id: str,
+        project_id: Optional[UUID],
+        status: Optional[str],
+        parent_id: Optional[UUID],
+        include_done: bool,
+        limit: int,
+        offset: int,
+        after: Optional[str],
+    ) -> Sequence[Any]:
         async with self._session_factory() as session:
-            query = select(TaskORM).where(TaskORM.user_id == user_id)
+            # Select plain columns: rows skip ORM identity-map bookkeeping
+            table_columns = TaskORM.__table__.c
+            query = select(*[table_columns[name] for name in columns])
+            query = query.where(TaskORM.user_id == user_id)
 
             if project_id is not None:
                 query = query.where(TaskORM.project_id == str(project_id))
@@ -125,71 +287,180 @@ class SqliteTaskRepository(ITaskRepository):
             if parent_id is not None:
                 query = query.where(TaskORM.parent_id == str(parent_id))
 
-            query = query.order_by(TaskORM.created_at.desc())
+            query = apply_keyset(query, TaskORM.created_at, TaskORM.id, after)
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return result.all()
+
+    async def iter_tasks(
+        self,
+        user_id: str,
+        filters: Optional[TaskFilters] = None,
+        batch_size: int = 500,
+    ) -> AsyncGenerator[list[Task], None]:
+        """Stream tasks in batches using a server-side cursor."""
+        filters = filters or TaskFilters()
+        # Select plain columns so rows are not tracked in the identity map
+        query = select(*TaskORM.__table__.c).where(TaskORM.user_id == user_id)
+
+        if filters.project_id is not None:
+            query = query.where(TaskORM.project_id == str(filters.project_id))
+
+        if filters.status:
+            query = query.where(TaskORM.status == filters.status.value)
+        elif not filters.include_done:
+            query = query.where(TaskORM.status != TaskStatus.DONE.value)
+
+        if filters.parent_id is not None:
+            query = query.where(TaskORM.parent_id == str(filters.parent_id))
+
+        query = apply_keyset(query, TaskORM.created_at, TaskORM.id)
+
+        async with self._session_factory() as session:
+            result = await session.stream(query.execution_options(yield_per=batch_size))
+            async for rows in result.partitions(batch_size):
+                yield [self._orm_to_model(row) for row in rows]
 
     async def update(self, user_id: str, task_id: UUID, update: TaskUpdate) -> Task:
-        """Update an existing task."""
+        """Update an existing task (UPDATE ... RETURNING plus status cascade)."""
+        values = self._update_values(update)
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(TaskORM).where(
-                    and_(TaskORM.id == str(task_id), TaskORM.user_id == user_id)
-                )
+            row = await update_returning(
+                session,
+                TaskORM,
+                [TaskORM.id == str(task_id), TaskORM.user_id == user_id],
+                **values,
             )
-            orm = result.scalar_one_or_none()
-
-            if not orm:
+            if row is None:
                 raise NotFoundError(f"Task {task_id} not found")
 
-            update_data = update.model_dump(exclude_unset=True)
-            status_value = None
-            for field, value in update_data.items():
-                if value is not None:
-                    if field in ("project_id", "parent_id"):
-                        value = str(value) if value else None
-                    elif field == "dependency_ids":
-                        value = [str(dep_id) for dep_id in value]
-                    elif hasattr(value, "value"):  # Enum
-                        value = value.value
-                    if field == "status":
-                        status_value = value
-                    setattr(orm, field, value)
+            if "status" in values:
+                await self._cascade_status(session, user_id, [str(task_id)], values["status"])
+
+            await session.commit()
+            return self._orm_to_model(row)
 
-            orm.updated_at = datetime.utcnow()
+    async def update_many(
+        self,
+        user_id: str,
+        updates: dict[UUID, TaskUpdate],
+    ) -> list[Task]:
+        """Update multiple tasks in a single transaction."""
+        if not updates:
+            return []
 
-            if status_value is not None:
-                subtask_result = await session.execute(
-                    select(TaskORM).where(
-                        and_(TaskORM.parent_id == str(task_id), TaskORM.user_id == user_id)
-                    )
+        ids = [str(task_id) for task_id in updates]
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(TaskORM).where(and_(TaskORM.id.in_(ids), TaskORM.user_id == user_id))
+            )
+            orm_by_id = {orm.id: orm for orm in result.scalars().all()}
+
+            missing = [task_id for task_id in ids if task_id not in orm_by_id]
+            if missing:
+                raise NotFoundError(f"Task {missing[0]} not found")
+
+            # Group status cascades so each status needs one UPDATE for all children
+            parents_by_status: dict[str, list[str]] = {}
+            for task_id, update in updates.items():
+                values = self._update_values(update)
+                orm = orm_by_id[str(task_id)]
+                for field, value in values.items():
+                    setattr(orm, field, value)
+                if "status" in values:
+                    parents_by_status.setdefault(values["status"], []).append(str(task_id))
+
+            # Explicit status updates in the batch win over the cascade
+            explicit_status_ids = [
+                task_id for ids_ in parents_by_status.values() for task_id in ids_
+            ]
+            await session.flush()
+            for status_value, parent_ids in parents_by_status.items():
+                await self._cascade_status(
+                    session, user_id, parent_ids, status_value, exclude_ids=explicit_status_ids
                 )
-                for subtask in subtask_result.scalars().all():
-                    subtask.status = status_value
-                    subtask.updated_at = datetime.utcnow()
 
             await session.commit()
-            await session.refresh(orm)
-            return self._orm_to_model(orm)
+            return [self._orm_to_model(orm_by_id[task_id]) for task_id in ids]
+
+    async def cascade_status(self, user_id: str, task_id: UUID, status: TaskStatus) -> int:
+        """Set the status of every descendant of a task in one statement."""
+        async with self._session_factory() as session:
+            affected = await self._cascade_status(session, user_id, [str(task_id)], status.value)
+            await session.commit()
+            return affected
+
+    @staticmethod
+    async def _cascade_status(
+        session: AsyncSession,
+        user_id: str,
+        root_ids: Sequence[str],
+        status_value: str,
+        exclude_ids: Sequence[str] = (),
+    ) -> int:
+        """
+        Propagate a status to all descendants of root_ids (recursive CTE UPDATE).
+
+        Descendants listed in exclude_ids are skipped together with their
+        subtrees (they carry their own explicit status update). UNION (not
+        UNION ALL) keeps the recursion finite even if parent links form a cycle.
+
+        Returns:
+            Number of descendant rows updated
+        """
+        child = aliased(TaskORM)
+        subtree = (
+            select(TaskORM.id)
+            .where(
+                TaskORM.parent_id.in_(root_ids),
+                TaskORM.user_id == user_id,
+                TaskORM.id.notin_(exclude_ids),
+            )
+            .cte("subtree", recursive=True)
+        )
+        subtree = subtree.union(
+            select(child.id).where(
+                child.parent_id == subtree.c.id,
+                child.user_id == user_id,
+                child.id.notin_(exclude_ids),
+            )
+        )
+        result = await session.execute(
+            sql_update(TaskORM)
+            .where(TaskORM.id.in_(select(subtree.c.id)))
+            .values(status=status_value, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount or 0
 
     async def delete(self, user_id: str, task_id: UUID) -> bool:
         """Delete a task."""
         async with self._session_factory() as session:
             result = await session.execute(
-                select(TaskORM).where(
+                sql_delete(TaskORM).where(
                     and_(TaskORM.id == str(task_id), TaskORM.user_id == user_id)
                 )
             )
-            orm = result.scalar_one_or_none()
+            await session.commit()
+            return bool(result.rowcount)
 
-            if not orm:
-                return False
+    async def delete_many(self, user_id: str, task_ids: list[UUID]) -> int:
+        """Delete multiple tasks in a single transaction."""
+        if not task_ids:
+            return 0
 
-            await session.delete(orm)
+        async with self._session_factory() as session:
+            result = await session.execute(
+                sql_delete(TaskORM).where(
+                    and_(
+                        TaskORM.id.in_([str(task_id) for task_id in task_ids]),
+                        TaskORM.user_id == user_id,
+                    )
+                )
+            )
             await session.commit()
-            return True
+            return result.rowcount or 0
 
     async def find_similar(
         self,
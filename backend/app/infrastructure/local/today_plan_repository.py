@@ -0,0 +1,102 @@
+"""
+SQLite implementation of the today plan repository.
+
+Plans are tagged with the user's data version at compute time. The
+version lives in user_data_versions and is bumped by triggers on the
+tasks and projects tables (migration 4), so a plan is never served after
+the data it was computed from changed, whichever process wrote it.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import and_, func, select
+from sqlalchemy import delete as sql_delete
+
+from app.infrastructure.local.database import (
+    TaskORM,
+    TodayPlanORM,
+    UserDataVersionORM,
+    get_session_factory,
+)
+from app.infrastructure.local.returning import upsert_returning
+from app.interfaces.today_plan_repository import ITodayPlanRepository
+from app.models.schedule import TodayTasksResponse
+
+
+class SqliteTodayPlanRepository(ITodayPlanRepository):
+    """SQLite implementation of today plan repository."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or get_session_factory()
+
+    async def list_user_ids(self) -> list[str]:
+        """List every user that owns tasks."""
+        async with self._session_factory() as session:
+            result = await session.execute(select(TaskORM.user_id).distinct())
+            return [row[0] for row in result]
+
+    async def get_data_version(self, user_id: str) -> int:
+        """Get a user's data version (0 before their first write)."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(UserDataVersionORM.version).where(UserDataVersionORM.user_id == user_id)
+            )
+            return result.scalar_one_or_none() or 0
+
+    async def get_current(self, user_id: str, plan_date: date) -> Optional[TodayTasksResponse]:
+        """Get the plan for a day if it is still current (one primary-key read)."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(TodayPlanORM.payload)
+                .outerjoin(UserDataVersionORM, UserDataVersionORM.user_id == TodayPlanORM.user_id)
+                .where(
+                    and_(
+                        TodayPlanORM.user_id == user_id,
+                        TodayPlanORM.plan_date == plan_date,
+                        TodayPlanORM.data_version == func.coalesce(UserDataVersionORM.version, 0),
+                    )
+                )
+            )
+            payload = result.scalar_one_or_none()
+            return TodayTasksResponse.model_validate_json(payload) if payload else None
+
+    async def save(
+        self,
+        user_id: str,
+        plan_date: date,
+        data_version: int,
+        plan: TodayTasksResponse,
+    ) -> None:
+        """Store the plan, unless a plan from a newer data version is stored already."""
+        payload = plan.model_dump_json()
+        async with self._session_factory() as session:
+            await upsert_returning(
+                session,
+                TodayPlanORM,
+                values={
+                    "user_id": user_id,
+                    "plan_date": plan_date,
+                    "data_version": data_version,
+                    "payload": payload,
+                },
+                conflict_columns=[TodayPlanORM.user_id, TodayPlanORM.plan_date],
+                set_={
+                    "data_version": data_version,
+                    "payload": payload,
+                    "computed_at": datetime.utcnow(),
+                },
+                where=TodayPlanORM.data_version <= data_version,
+            )
+            await session.commit()
+
+    async def delete_before(self, plan_date: date) -> int:
+        """Delete plans of earlier days."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                sql_delete(TodayPlanORM).where(TodayPlanORM.plan_date < plan_date)
+            )
+            await session.commit()
+            return result.rowcount or 0
@@ -0,0 +1,377 @@
+"""
+Per-user snapshot cache for task/project reads.
+
+Snapshots are checked against the stored data version, so writes from any process invalidate them.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, AsyncGenerator, Awaitable, Callable, Hashable, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.task_repository import ITaskRepository
+from app.models.enums import TaskStatus
+from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectWithTaskCount
+from app.models.task import SimilarTask, Task, TaskCreate, TaskFilters, TaskSummary, TaskUpdate
+
+T = TypeVar("T")
+
+_ALL_TASKS = TaskFilters()
+
+
+@dataclass
+class _UserSnapshots:
+    version: int
+    entries: dict[Hashable, Any] = field(default_factory=dict)
+    # Stored data version the entries were loaded at (None = not tracked)
+    data_version: Optional[int] = None
+
+
+class SnapshotCache:
+    """
+    Size-bounded LRU cache of per-user, versioned read snapshots.
+
+    Writes bump the user's version; a snapshot whose load raced a write is
+    not stored. Runs on the event loop, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        max_users: int = 256,
+        data_version: Optional[Callable[[str], Awaitable[int]]] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_users: Maximum number of users whose snapshots are kept
+            data_version: Reads a user's stored data version, which every
+                write from any process changes (None = only writes through
+                this process's cached repositories invalidate snapshots)
+        """
+        self._max_users = max_users
+        self._data_version = data_version
+        self._users: OrderedDict[str, _UserSnapshots] = OrderedDict()
+        # Global clock so a re-created user entry never reuses an old version
+        self._clock = count(1)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    async def version(self, user_id: str) -> int:
+        """Return the current data version of a user."""
+        stored = await self._data_version(user_id) if self._data_version is not None else None
+        snapshots = self._users.get(user_id)
+        if snapshots is None:
+            snapshots = _UserSnapshots(version=next(self._clock), data_version=stored)
+            self._users[user_id] = snapshots
+            self._evict()
+        else:
+            self._users.move_to_end(user_id)
+            if stored != snapshots.data_version:
+                # Written by another worker or a script
+                self.invalidate(user_id)
+                snapshots.data_version = stored
+        return snapshots.version
+
+    def invalidate(self, user_id: str) -> None:
+        """Bump a user's data version, dropping all of their snapshots."""
+        snapshots = self._users.get(user_id)
+        if snapshots is None:
+            return
+        snapshots.version = next(self._clock)
+        snapshots.entries.clear()
+        self.invalidations += 1
+
+    async def get_or_load(
+        self,
+        user_id: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Return a cached snapshot, loading it on a miss.
+
+        Args:
+            user_id: Owner user ID
+            key: Snapshot key (e.g. method name and arguments)
+            loader: Coroutine factory that reads the snapshot from storage
+
+        Returns:
+            Snapshot value
+        """
+        version = await self.version(user_id)
+        snapshots = self._users[user_id]
+        if key in snapshots.entries:
+            self.hits += 1
+            return snapshots.entries[key]
+
+        self.misses += 1
+        value = await loader()
+
+        # Only store if no write happened while loading
+        snapshots = self._users.get(user_id)
+        if snapshots is not None and snapshots.version == version:
+            snapshots.entries[key] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop all snapshots (counters are kept)."""
+        self._users.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return cache counters."""
+        lookups = self.hits + self.misses
+        return {
+            "users": len(self._users),
+            "max_users": self._max_users,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self) -> None:
+        while len(self._users) > self._max_users:
+            self._users.popitem(last=False)
+            self.evictions += 1
+
+
+class CachedTaskRepository(ITaskRepository):
+    """Task repository decorator serving full-user scans from a SnapshotCache."""
+
+    def __init__(self, repo: ITaskRepository, cache: SnapshotCache):
+        """
+        Initialize repository.
+
+        Args:
+            repo: Underlying task repository
+            cache: Shared snapshot cache (also used by CachedProjectRepository)
+        """
+        self._repo = repo
+        self._cache = cache
+
+    async def _load_all(self, user_id: str) -> tuple[Task, ...]:
+        tasks: list[Task] = []
+        async for batch in self._repo.iter_tasks(user_id):
+            tasks.extend(batch)
+        return tuple(tasks)
+
+    async def iter_tasks(
+        self,
+        user_id: str,
+        filters: Optional[TaskFilters] = None,
+        batch_size: int = 500,
+    ) -> AsyncGenerator[list[Task], None]:
+        """Stream tasks in batches; unfiltered scans come from the snapshot."""
+        if filters is not None and filters != _ALL_TASKS:
+            # Closed with this generator, if its consumer stops early
+            async with aclosing(self._repo.iter_tasks(user_id, filters, batch_size)) as batches:
+                async for batch in batches:
+                    yield batch
+            return
+
+        tasks = await self._cache.get_or_load(
+            user_id, ("tasks",), lambda: self._load_all(user_id)
+        )
+        for start in range(0, len(tasks), batch_size):
+            yield list(tasks[start:start + batch_size])
+
+    async def create(self, user_id: str, task: TaskCreate) -> Task:
+        try:
+            return await self._repo.create(user_id, task)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def create_many(self, user_id: str, tasks: list[TaskCreate]) -> list[Task]:
+        try:
+            return await self._repo.create_many(user_id, tasks)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def update(self, user_id: str, task_id: UUID, update: TaskUpdate) -> Task:
+        try:
+            return await self._repo.update(user_id, task_id, update)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def update_many(
+        self,
+        user_id: str,
+        updates: dict[UUID, TaskUpdate],
+    ) -> list[Task]:
+        try:
+            return await self._repo.update_many(user_id, updates)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def cascade_status(self, user_id: str, task_id: UUID, status: TaskStatus) -> int:
+        try:
+            return await self._repo.cascade_status(user_id, task_id, status)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def delete(self, user_id: str, task_id: UUID) -> bool:
+        try:
+            return await self._repo.delete(user_id, task_id)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def delete_many(self, user_id: str, task_ids: list[UUID]) -> int:
+        try:
+            return await self._repo.delete_many(user_id, task_ids)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def get(self, user_id: str, task_id: UUID) -> Optional[Task]:
+        return await self._repo.get(user_id, task_id)
+
+    async def list(
+        self,
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        parent_id: Optional[UUID] = None,
+        include_done: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> list[Task]:
+        return await self._repo.list(
+            user_id,
+            project_id=project_id,
+            status=status,
+            parent_id=parent_id,
+            include_done=include_done,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    async def list_summaries(
+        self,
+        user_id: str,
+        fields: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        parent_id: Optional[UUID] = None,
+        include_done: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        return await self._repo.list_summaries(
+            user_id,
+            fields,
+            project_id=project_id,
+            status=status,
+            parent_id=parent_id,
+            include_done=include_done,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    async def find_similar(
+        self,
+        user_id: str,
+        title: str,
+        project_id: UUID | None = None,
+        threshold: float = 0.8,
+        limit: int = 5,
+    ) -> list[SimilarTask]:
+        return await self._repo.find_similar(
+            user_id, title, project_id=project_id, threshold=threshold, limit=limit
+        )
+
+    async def get_by_capture_id(self, user_id: str, capture_id: UUID) -> list[Task]:
+        return await self._repo.get_by_capture_id(user_id, capture_id)
+
+    async def get_subtasks(self, user_id: str, parent_id: UUID) -> list[Task]:
+        return await self._repo.get_subtasks(user_id, parent_id)
+
+    async def count(
+        self,
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+    ) -> int:
+        return await self._repo.count(user_id, project_id=project_id, status=status)
+
+
+class CachedProjectRepository(IProjectRepository):
+    """Project repository decorator serving list reads from a SnapshotCache."""
+
+    def __init__(self, repo: IProjectRepository, cache: SnapshotCache):
+        """
+        Initialize repository.
+
+        Args:
+            repo: Underlying project repository
+            cache: Shared snapshot cache (task writes also invalidate counts)
+        """
+        self._repo = repo
+        self._cache = cache
+
+    async def list(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Project]:
+        projects = await self._cache.get_or_load(
+            user_id,
+            ("projects", status, limit, offset),
+            lambda: self._repo.list(user_id, status=status, limit=limit, offset=offset),
+        )
+        return list(projects)
+
+    async def list_with_task_count(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+    ) -> list[ProjectWithTaskCount]:
+        projects = await self._cache.get_or_load(
+            user_id,
+            ("projects_with_task_count", status),
+            lambda: self._repo.list_with_task_count(user_id, status=status),
+        )
+        return list(projects)
+
+    async def create(self, user_id: str, project: ProjectCreate) -> Project:
+        try:
+            return await self._repo.create(user_id, project)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def update(
+        self, user_id: str, project_id: UUID, update: ProjectUpdate
+    ) -> Project:
+        try:
+            return await self._repo.update(user_id, project_id, update)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def delete(self, user_id: str, project_id: UUID) -> bool:
+        try:
+            return await self._repo.delete(user_id, project_id)
+        finally:
+            self._cache.invalidate(user_id)
+
+    async def get(self, user_id: str, project_id: UUID) -> Optional[Project]:
+        return await self._repo.get(user_id, project_id)
+
+    async def get_with_task_count(
+        self,
+        user_id: str,
+        project_id: UUID,
+    ) -> Optional[ProjectWithTaskCount]:
+        return await self._repo.get_with_task_count(user_id, project_id)
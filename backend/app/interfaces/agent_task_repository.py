@@ -53,6 +53,7 @@ class IAgentTaskRepository(ABC):
         status: Optional[AgentTaskStatus] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[AgentTask]:
         """
         List agent tasks with optional filters.
@@ -62,6 +63,7 @@ class IAgentTaskRepository(ABC):
             status: Filter by status
             limit: Maximum number of results
             offset: Pagination offset
+            after: Opaque cursor from the previous page (keyset pagination)
 
         Returns:
             List of agent tasks
@@ -51,6 +51,7 @@ class ICaptureRepository(ABC):
         processed: Optional[bool] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[Capture]:
         """
         List captures with optional filters.
@@ -60,6 +61,7 @@ class ICaptureRepository(ABC):
             processed: Filter by processed status
             limit: Maximum number of results
             offset: Pagination offset
+            after: Opaque cursor from the previous page (keyset pagination)
 
         Returns:
             List of captures
@@ -9,7 +9,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from app.models.chat_session import ChatSession, ChatMessage
+from app.models.chat_session import ChatSession, ChatMessage, ChatSessionSummary
 
 
 class IChatSessionRepository(ABC):
@@ -86,6 +86,7 @@ class IChatSessionRepository(ABC):
         session_id: str,
         limit: int = 500,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[ChatMessage]:
         """
         List messages for a session.
@@ -95,8 +96,64 @@ class IChatSessionRepository(ABC):
             session_id: Session ID
             limit: Max messages
             offset: Pagination offset
+            after: Opaque cursor from the previous page (keyset pagination)
 
         Returns:
             List of chat messages
         """
         pass
+
+    @abstractmethod
+    async def list_recent_messages(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int,
+    ) -> list[ChatMessage]:
+        """
+        List the latest messages of a session.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+            limit: Max messages
+
+        Returns:
+            Up to limit most recent messages, oldest first
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary(self, user_id: str, session_id: str) -> Optional[ChatSessionSummary]:
+        """
+        Get the running summary of a session's older turns.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+
+        Returns:
+            Summary, or None if nothing was summarized yet
+        """
+        pass
+
+    @abstractmethod
+    async def save_summary(
+        self,
+        user_id: str,
+        session_id: str,
+        summary: str,
+        summarized_until: float,
+    ) -> None:
+        """
+        Store the running summary of a session.
+
+        A summary ending before the stored one (from a stale worker) is ignored.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+            summary: Summary of the folded turns
+            summarized_until: Start time of the last turn folded into the summary
+        """
+        pass
@@ -2,7 +2,7 @@
 LLM provider interface.
 
 Defines the contract for LLM (Large Language Model) access.
-Implementations: Gemini, LiteLLM (for Bedrock, OpenAI, etc.)
+Implementations: Gemini, LiteLLM (for Bedrock, OpenAI, etc.), Fake (offline)
 """
 
 from abc import ABC, abstractmethod
@@ -54,3 +54,16 @@ class ILLMProvider(ABC):
             True if function calling is supported
         """
         pass
+
+    @abstractmethod
+    def supports_streaming(self) -> bool:
+        """
+        Check if the model can stream partial responses (token deltas).
+
+        When True, chat streaming runs the ADK runner in SSE mode and
+        forwards text deltas as they are generated.
+
+        Returns:
+            True if streaming is supported
+        """
+        pass
@@ -54,6 +54,7 @@ class IMemoryRepository(ABC):
         project_id: Optional[UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[Memory]:
         """
         List memories with optional filters.
@@ -65,6 +66,7 @@ class IMemoryRepository(ABC):
             project_id: Filter by project
             limit: Maximum number of results
             offset: Pagination offset
+            after: Opaque cursor from the previous page (keyset pagination)
 
         Returns:
             List of memories
@@ -84,6 +84,24 @@ class IProjectRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_with_task_count(
+        self,
+        user_id: str,
+        project_id: UUID,
+    ) -> Optional[ProjectWithTaskCount]:
+        """
+        Get a single project with task statistics.
+
+        Args:
+            user_id: Owner user ID
+            project_id: Project ID
+
+        Returns:
+            Project with task counts if found, None otherwise
+        """
+        pass
+
     @abstractmethod
     async def update(
         self, user_id: str, project_id: UUID, update: ProjectUpdate
@@ -9,10 +9,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import AsyncGenerator, Optional, Sequence
 from uuid import UUID
 
-from app.models.task import Task, TaskCreate, TaskUpdate, SimilarTask
+from app.models.enums import TaskStatus
+from app.models.task import Task, TaskCreate, TaskFilters, TaskSummary, TaskUpdate, SimilarTask
 
 
 class ITaskRepository(ABC):
@@ -56,6 +57,7 @@ class ITaskRepository(ABC):
         include_done: bool = False,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[Task]:
         """
         List tasks with optional filters.
@@ -68,12 +70,73 @@ class ITaskRepository(ABC):
             include_done: Include completed tasks
             limit: Maximum number of results
             offset: Pagination offset
+            after: Opaque cursor from the previous page (keyset pagination)
 
         Returns:
             List of tasks matching filters
         """
         pass
 
+    @abstractmethod
+    async def list_summaries(
+        self,
+        user_id: str,
+        fields: Sequence[str],
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        parent_id: Optional[UUID] = None,
+        include_done: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> list[TaskSummary]:
+        """
+        List tasks like list(), loading only some fields.
+
+        Args:
+            user_id: Owner user ID
+            fields: Task fields to load (id and created_at are always included)
+            project_id: Filter by project (None = Inbox)
+            status: Filter by status
+            parent_id: Filter by parent task (for subtasks)
+            include_done: Include completed tasks
+            limit: Maximum number of results
+            offset: Pagination offset
+            after: Opaque cursor from the previous page (keyset pagination)
+
+        Returns:
+            Projected tasks matching filters (fields not loaded are None)
+
+        Raises:
+            ValidationError: If fields contains an unknown field
+        """
+        pass
+
+    @abstractmethod
+    def iter_tasks(
+        self,
+        user_id: str,
+        filters: Optional[TaskFilters] = None,
+        batch_size: int = 500,
+    ) -> AsyncGenerator[list[Task], None]:
+        """
+        Stream all tasks matching filters in batches.
+
+        Unlike list(), there is no row ceiling: rows are fetched
+        incrementally, so memory stays bounded by batch_size. Callers
+        that stop before the end should wrap the iterator in
+        contextlib.aclosing() so the underlying cursor is released.
+
+        Args:
+            user_id: Owner user ID
+            filters: Optional filters (default: all tasks, including done)
+            batch_size: Number of tasks per yielded batch
+
+        Yields:
+            Lists of up to batch_size tasks (newest first)
+        """
+        pass
+
     @abstractmethod
     async def update(self, user_id: str, task_id: UUID, update: TaskUpdate) -> Task:
         """
@@ -92,6 +155,23 @@ class ITaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def cascade_status(self, user_id: str, task_id: UUID, status: TaskStatus) -> int:
+        """
+        Set the status of every descendant of a task (the whole subtree).
+
+        update() applies the same cascade whenever it changes a status.
+
+        Args:
+            user_id: Owner user ID
+            task_id: Root task ID (its own status is not changed)
+            status: Status to propagate
+
+        Returns:
+            Number of descendant tasks updated
+        """
+        pass
+
     @abstractmethod
     async def delete(self, user_id: str, task_id: UUID) -> bool:
         """
@@ -106,6 +186,62 @@ class ITaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, user_id: str, tasks: list[TaskCreate]) -> list[Task]:
+        """
+        Create multiple tasks in a single transaction.
+
+        Items that are TaskBatchCreate may reference earlier or later
+        siblings via batch_dependency_indexes; these are resolved to the
+        generated IDs of the new tasks.
+
+        Args:
+            user_id: Owner user ID
+            tasks: Task creation data (in batch order)
+
+        Returns:
+            Created tasks in the same order as the input
+
+        Raises:
+            ValidationError: If a batch dependency index is out of range
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(
+        self,
+        user_id: str,
+        updates: dict[UUID, TaskUpdate],
+    ) -> list[Task]:
+        """
+        Update multiple tasks in a single transaction.
+
+        Args:
+            user_id: Owner user ID
+            updates: Mapping of task ID to fields to update
+
+        Returns:
+            Updated tasks in the same order as the input
+
+        Raises:
+            NotFoundError: If any task is not found (nothing is updated)
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, user_id: str, task_ids: list[UUID]) -> int:
+        """
+        Delete multiple tasks in a single transaction.
+
+        Args:
+            user_id: Owner user ID
+            task_ids: Task IDs to delete
+
+        Returns:
+            Number of tasks deleted
+        """
+        pass
+
     @abstractmethod
     async def find_similar(
         self,
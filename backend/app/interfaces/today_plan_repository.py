@@ -0,0 +1,88 @@
+"""
+Today plan repository interface.
+
+Defines the contract for precomputed today views (see TodayPlanService).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional
+
+from app.models.schedule import TodayTasksResponse
+
+
+class ITodayPlanRepository(ABC):
+    """Abstract interface for precomputed today plan persistence."""
+
+    @abstractmethod
+    async def list_user_ids(self) -> list[str]:
+        """
+        List every user that owns tasks.
+
+        Returns:
+            User IDs
+        """
+        pass
+
+    @abstractmethod
+    async def get_data_version(self, user_id: str) -> int:
+        """
+        Get a user's data version.
+
+        The version changes on every task or project write of the user.
+
+        Args:
+            user_id: Owner user ID
+
+        Returns:
+            Current data version
+        """
+        pass
+
+    @abstractmethod
+    async def get_current(self, user_id: str, plan_date: date) -> Optional[TodayTasksResponse]:
+        """
+        Get the plan for a day if it is still current.
+
+        Args:
+            user_id: Owner user ID
+            plan_date: Day of the plan
+
+        Returns:
+            Plan, or None if missing or computed before the user's last write
+        """
+        pass
+
+    @abstractmethod
+    async def save(
+        self,
+        user_id: str,
+        plan_date: date,
+        data_version: int,
+        plan: TodayTasksResponse,
+    ) -> None:
+        """
+        Store (or replace) the plan for a day.
+
+        Args:
+            user_id: Owner user ID
+            plan_date: Day of the plan
+            data_version: Data version read before the plan's inputs were loaded
+            plan: Today view
+        """
+        pass
+
+    @abstractmethod
+    async def delete_before(self, plan_date: date) -> int:
+        """
+        Delete plans of earlier days.
+
+        Args:
+            plan_date: First day to keep
+
+        Returns:
+            Number of deleted plans
+        """
+        pass
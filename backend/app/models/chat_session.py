@@ -46,3 +46,13 @@ class ChatMessage(ChatMessageBase):
     id: UUID
     user_id: str = Field(..., description="Owner user ID")
     created_at: datetime
+
+
+class ChatSessionSummary(BaseModel):
+    """Running summary of a session's older turns (context compaction)."""
+
+    session_id: str = Field(..., max_length=100, description="Chat session ID")
+    summary: str = Field("", description="Summary of the folded turns")
+    summarized_until: float = Field(
+        0.0, ge=0, description="Start time (epoch seconds) of the last turn folded into the summary"
+    )
@@ -65,6 +65,21 @@ class TaskCreate(TaskBase):
     created_by: CreatedBy = Field(CreatedBy.USER, description="作成者 (USER/AGENT)")
 
 
+class TaskBatchCreate(TaskCreate):
+    """Schema for creating a task as part of a batch."""
+
+    batch_dependency_indexes: list[int] = Field(
+        default_factory=list,
+        description="同一バッチ内で先に終わらせるべきタスクのインデックス（0始まり）",
+    )
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating multiple tasks in one transaction."""
+
+    tasks: list[TaskBatchCreate] = Field(..., min_length=1, max_length=500)
+
+
 class TaskUpdate(BaseModel):
     """Schema for updating an existing task."""
 
@@ -88,6 +103,39 @@ class TaskUpdate(BaseModel):
     meeting_notes: Optional[str] = Field(None, max_length=5000)
 
 
+class TaskBulkUpdateItem(TaskUpdate):
+    """Schema for a single update within a bulk update."""
+
+    id: UUID
+
+
+class TaskBulkUpdate(BaseModel):
+    """Schema for updating multiple tasks in one transaction."""
+
+    updates: list[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBulkDelete(BaseModel):
+    """Schema for deleting multiple tasks in one transaction."""
+
+    task_ids: list[UUID] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBulkDeleteResponse(BaseModel):
+    """Result of a bulk delete."""
+
+    deleted_count: int
+
+
+class TaskFilters(BaseModel):
+    """Filters for streaming task scans."""
+
+    project_id: Optional[UUID] = None
+    status: Optional[TaskStatus] = None
+    parent_id: Optional[UUID] = None
+    include_done: bool = True
+
+
 class Task(TaskBase):
     """Complete task model with all fields."""
 
@@ -103,6 +151,38 @@ class Task(TaskBase):
         from_attributes = True
 
 
+# Fields that can be requested via projection (?fields=), in model order
+TASK_FIELDS: tuple[str, ...] = tuple(Task.model_fields)
+
+
+class TaskSummary(BaseModel):
+    """Projected task (?fields=): fields that were not loaded are None."""
+
+    id: UUID
+    created_at: datetime
+    user_id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    project_id: Optional[UUID] = None
+    status: Optional[TaskStatus] = None
+    importance: Optional[Priority] = None
+    urgency: Optional[Priority] = None
+    energy_level: Optional[EnergyLevel] = None
+    estimated_minutes: Optional[int] = None
+    due_date: Optional[datetime] = None
+    parent_id: Optional[UUID] = None
+    dependency_ids: Optional[list[UUID]] = None
+    source_capture_id: Optional[UUID] = None
+    created_by: Optional[CreatedBy] = None
+    updated_at: Optional[datetime] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    is_fixed_time: Optional[bool] = None
+    location: Optional[str] = None
+    attendees: Optional[list[str]] = None
+    meeting_notes: Optional[str] = None
+
+
 class TaskWithSubtasks(Task):
     """Task with its subtasks for hierarchical display."""
 
@@ -7,11 +7,17 @@ This service handles agent execution, tool calling, and response generation.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-from google.adk.runners import InMemoryRunner
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.events import Event
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.memory import InMemoryMemoryService
+from google.adk.runners import InMemoryRunner, Runner
+from google.adk.sessions import BaseSessionService
 from google.genai.types import Content, Part
 
 from app.agents.secretary_agent import create_secretary_agent
@@ -26,13 +32,42 @@ from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.task_repository import ITaskRepository
 from app.models.capture import CaptureCreate
 from app.models.chat import ChatRequest, ChatResponse
+from app.models.chat_session import ChatMessage
 from app.models.enums import ContentType
-
-
-# Global cache for runners (keyed by user_id)
-# This allows session state to persist across requests
-_runner_cache: dict[str, InMemoryRunner] = {}
-_session_index: dict[str, dict[str, dict[str, Any]]] = {}
+from app.services.context_compactor import ContextCompactor, context_stats, llm_summarizer
+from app.services.runner_cache import (
+    LruTtlCache,
+    estimate_runner_bytes,
+    estimate_session_index_bytes,
+)
+from app.services.stream_coalescer import coalesce_text_chunks
+
+# Prefix of the assistant messages recording a failed run; they are stored
+# for the history view but not replayed to the agent
+ERROR_MESSAGE_PREFIX = "Error: "
+
+# Process-wide caches keyed by user_id, bounded by LRU size and idle TTL.
+# Runners keep session state across requests; an evicted user's session is
+# rehydrated from chat_messages (see _ensure_session).
+_settings = get_settings()
+_runner_cache: LruTtlCache[Runner] = LruTtlCache(
+    max_entries=_settings.AGENT_RUNNER_CACHE_MAX_USERS,
+    idle_ttl_seconds=_settings.AGENT_RUNNER_IDLE_TTL_SECONDS,
+    size_of=estimate_runner_bytes,
+)
+_session_index: LruTtlCache[dict[str, dict[str, Any]]] = LruTtlCache(
+    max_entries=_settings.AGENT_SESSION_INDEX_MAX_USERS,
+    idle_ttl_seconds=_settings.AGENT_RUNNER_IDLE_TTL_SECONDS,
+    size_of=estimate_session_index_bytes,
+)
+
+
+@lru_cache()
+def get_shared_session_service() -> BaseSessionService:
+    """Get the process-wide persistent ADK session service (AGENT_SESSION_STORE=sqlite)."""
+    from app.infrastructure.local.adk_session_service import SqliteAdkSessionService
+
+    return SqliteAdkSessionService()
 
 
 class AgentService:
@@ -70,9 +105,42 @@ class AgentService:
         self._capture_repo = capture_repo
         self._chat_repo = chat_repo
 
-    def _get_or_create_runner(self, user_id: str) -> InMemoryRunner:
-        """Get cached runner or create a new one for the user."""
-        if user_id not in _runner_cache:
+    @staticmethod
+    def cache_stats() -> dict[str, dict[str, int | float]]:
+        """Return counters of the runner cache, session index and context compaction."""
+        settings = get_settings()
+        return {
+            "runners": _runner_cache.stats(),
+            "session_index": _session_index.stats(),
+            "context": context_stats.as_dict(
+                settings.CHAT_CONTEXT_TOKEN_BUDGET, settings.CHAT_CONTEXT_KEEP_TURNS
+            ),
+        }
+
+    def _create_context_compactor(self, user_id: str) -> ContextCompactor:
+        """Create the compactor capping the history sent with each model call."""
+        settings = get_settings()
+        return ContextCompactor(
+            chat_repo=self._chat_repo,
+            # The summary is sent with every call, so it gets a fraction of the budget
+            summarizer=llm_summarizer(
+                self._llm_provider.get_model(),
+                max_output_tokens=max(256, settings.CHAT_CONTEXT_TOKEN_BUDGET // 4),
+            ),
+            user_id=user_id,
+            token_budget=settings.CHAT_CONTEXT_TOKEN_BUDGET,
+            keep_turns=settings.CHAT_CONTEXT_KEEP_TURNS,
+        )
+
+    def _get_or_create_runner(self, user_id: str) -> Runner:
+        """
+        Get cached runner or create a new one for the user.
+
+        With AGENT_SESSION_STORE=sqlite, runners share the persistent
+        session service, so any worker process can continue any session.
+        """
+        runner = _runner_cache.get(user_id)
+        if runner is None:
             agent = create_secretary_agent(
                 llm_provider=self._llm_provider,
                 task_repo=self._task_repo,
@@ -80,25 +148,111 @@ class AgentService:
                 memory_repo=self._memory_repo,
                 agent_task_repo=self._agent_task_repo,
                 user_id=user_id,
+                before_model_callback=self._create_context_compactor(user_id),
+            )
+            if get_settings().AGENT_SESSION_STORE == "sqlite":
+                runner = Runner(
+                    app_name=self.APP_NAME,
+                    agent=agent,
+                    session_service=get_shared_session_service(),
+                    artifact_service=InMemoryArtifactService(),
+                    memory_service=InMemoryMemoryService(),
+                )
+            else:
+                runner = InMemoryRunner(agent=agent, app_name=self.APP_NAME)
+            _runner_cache.put(user_id, runner)
+        return runner
+
+    async def _ensure_session(
+        self,
+        runner: Runner,
+        user_id: str,
+        session_id: str,
+        rehydrate: bool = True,
+    ) -> None:
+        """
+        Make sure the runner has the session, restoring its history if needed.
+
+        A session the runner does not know (its runner was evicted, or the
+        process restarted) is recreated, and its last stored messages are
+        replayed into it so the agent keeps the conversation context.
+
+        Args:
+            runner: User's runner
+            user_id: User ID
+            session_id: Session ID
+            rehydrate: Replay stored messages into a recreated session
+        """
+        existing = await runner.session_service.get_session(
+            app_name=self.APP_NAME,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        if existing is not None:
+            return
+        session = await runner.session_service.create_session(
+            app_name=self.APP_NAME,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        if not (rehydrate and self._chat_repo):
+            return
+
+        max_messages = get_settings().AGENT_REHYDRATE_MAX_MESSAGES
+        history: list[ChatMessage] = []
+        if max_messages > 0:
+            history = await self._chat_repo.list_recent_messages(
+                user_id=user_id, session_id=session_id, limit=max_messages
+            )
+
+        for message in history:
+            if message.role == "assistant" and message.content.startswith(ERROR_MESSAGE_PREFIX):
+                continue
+            is_user = message.role == "user"
+            created_at = message.created_at
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            await runner.session_service.append_event(
+                session,
+                Event(
+                    invocation_id=f"rehydrate-{message.id}",
+                    author="user" if is_user else runner.agent.name,
+                    content=Content(
+                        role="user" if is_user else "model",
+                        parts=[Part(text=message.content)],
+                    ),
+                    # Keeps the turns matched to the stored context summary
+                    timestamp=created_at.timestamp(),
+                ),
+            )
+        if history:
+            logger.info(
+                f"Rehydrated session {session_id} for user {user_id} "
+                f"with {len(history)} stored messages"
             )
-            _runner_cache[user_id] = InMemoryRunner(agent=agent, app_name=self.APP_NAME)
-        return _runner_cache[user_id]
 
     def _touch_session_index(self, user_id: str, session_id: str, title: str | None = None) -> None:
         """Track session metadata for list/history fallback when ADK APIs are unavailable."""
-        user_sessions = _session_index.setdefault(user_id, {})
-        entry = user_sessions.get(session_id)
+        user_sessions = _session_index.peek(user_id)
+        if user_sessions is None:
+            user_sessions = {}
+        _session_index.put(user_id, user_sessions)
+        entry = user_sessions.pop(session_id, None)
         updated_at = datetime.now(timezone.utc).isoformat()
         if entry:
             entry["updated_at"] = updated_at
             if title:
                 entry["title"] = title
-            return
-        user_sessions[session_id] = {
-            "session_id": session_id,
-            "title": title or "New Chat",
-            "updated_at": updated_at,
-        }
+        else:
+            entry = {
+                "session_id": session_id,
+                "title": title or "New Chat",
+                "updated_at": updated_at,
+            }
+        # Most recently updated last; keep the newest sessions per user
+        user_sessions[session_id] = entry
+        while len(user_sessions) > get_settings().AGENT_SESSION_INDEX_MAX_SESSIONS:
+            del user_sessions[next(iter(user_sessions))]
 
     def _derive_session_title(self, text: str | None) -> str | None:
         """Derive a session title from user text."""
@@ -244,22 +398,31 @@ class AgentService:
 
             return sorted(result, key=lambda x: x.get("updated_at") or "", reverse=True)
 
-        fallback_sessions = list(_session_index.get(user_id, {}).values())
+        fallback_sessions = list((_session_index.get(user_id) or {}).values())
         return sorted(fallback_sessions, key=lambda x: x.get("updated_at") or "", reverse=True)
 
-    async def get_session_messages(self, user_id: str, session_id: str) -> list[dict[str, Any]]:
-        """Get all messages for a specific session."""
+    async def get_session_messages(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int = 500,
+        after: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get messages for a specific session (keyset-paginated when persisted)."""
         runner = self._get_or_create_runner(user_id)
         if self._chat_repo:
             stored_messages = await self._chat_repo.list_messages(
                 user_id=user_id,
                 session_id=session_id,
+                limit=limit,
+                after=after,
             )
-            if stored_messages:
+            if stored_messages or after:
                 result = []
                 for msg in stored_messages:
                     result.append(
                         {
+                            "id": str(msg.id),
                             "role": msg.role,
                             "content": msg.content,
                             "created_at": msg.created_at.isoformat() if msg.created_at else None,
@@ -398,6 +561,7 @@ class AgentService:
             Chat response with assistant message and related tasks
         """
         # Generate session ID if not provided
+        is_new_session = not session_id
         if not session_id:
             session_id = str(uuid4())
         title = self._derive_session_title(request.text)
@@ -420,6 +584,9 @@ class AgentService:
 
         # Run agent with user message
         try:
+            # Before the new message is stored, so it is not replayed
+            await self._ensure_session(runner, user_id, session_id, rehydrate=not is_new_session)
+
             user_message_text = self._get_user_message_text(request)
             if user_message_text:
                 await self._record_message(
@@ -431,19 +598,6 @@ class AgentService:
                 )
             new_message = await self._construct_user_message(request)
 
-            # Ensure session exists
-            existing = await runner.session_service.get_session(
-                app_name=self.APP_NAME,
-                user_id=user_id,
-                session_id=session_id,
-            )
-            if existing is None:
-                await runner.session_service.create_session(
-                    app_name=self.APP_NAME,
-                    user_id=user_id,
-                    session_id=session_id,
-                )
-
             assistant_message_parts: list[str] = []
             async for event in runner.run_async(
                 user_id=user_id,
@@ -482,7 +636,7 @@ class AgentService:
                 user_id=user_id,
                 session_id=session_id,
                 role="assistant",
-                content=f"Error: {str(e)}",
+                content=f"{ERROR_MESSAGE_PREFIX}{str(e)}",
             )
             return ChatResponse(
                 assistant_message=f"申し訳ございません。エラーが発生しました: {str(e)}",
@@ -492,6 +646,12 @@ class AgentService:
                 capture_id=capture_id,
             )
 
+    def _stream_run_config(self) -> RunConfig:
+        """Run config of streaming chats: token deltas when the provider streams."""
+        if get_settings().CHAT_TOKEN_STREAMING and self._llm_provider.supports_streaming():
+            return RunConfig(streaming_mode=StreamingMode.SSE)
+        return RunConfig()
+
     async def process_chat_stream(
         self,
         user_id: str,
@@ -500,7 +660,26 @@ class AgentService:
     ):
         """
         Process a chat request with streaming response.
+
+        Text is coalesced into chunks of up to CHAT_STREAM_FLUSH_CHARS
+        characters or CHAT_STREAM_FLUSH_MS of buffering (see
+        coalesce_text_chunks).
         """
+        settings = get_settings()
+        async for chunk in coalesce_text_chunks(
+            self._stream_chat(user_id, request, session_id),
+            flush_ms=settings.CHAT_STREAM_FLUSH_MS,
+            flush_chars=settings.CHAT_STREAM_FLUSH_CHARS,
+        ):
+            yield chunk
+
+    async def _stream_chat(
+        self,
+        user_id: str,
+        request: ChatRequest,
+        session_id: str | None = None,
+    ):
+        """Run the agent and yield stream chunks, one text chunk per text part."""
         # Generate session ID if not provided
         session_id_str = session_id or str(uuid4())
         title = self._derive_session_title(request.text)
@@ -522,6 +701,11 @@ class AgentService:
         runner = self._get_or_create_runner(user_id)
 
         try:
+            # Before the new message is stored, so it is not replayed
+            await self._ensure_session(
+                runner, user_id, session_id_str, rehydrate=session_id is not None
+            )
+
             user_message_text = self._get_user_message_text(request)
             if user_message_text:
                 await self._record_message(
@@ -533,31 +717,28 @@ class AgentService:
                 )
             new_message = await self._construct_user_message(request)
 
-            # Ensure session exists
-            existing = await runner.session_service.get_session(
-                app_name=self.APP_NAME,
-                user_id=user_id,
-                session_id=session_id_str,
-            )
-            if existing is None:
-                await runner.session_service.create_session(
-                    app_name=self.APP_NAME,
-                    user_id=user_id,
-                    session_id=session_id_str,
-                )
-
-            # Stream agent execution
+            # Stream agent execution. In SSE mode the model's text arrives as
+            # partial events (deltas), followed by one event with the whole
+            # text of the response, which was already forwarded.
             assistant_message_parts: list[str] = []
+            streamed_parts: list[str] = []
             async for event in runner.run_async(
                 user_id=user_id,
                 session_id=session_id_str,
                 new_message=new_message,
+                run_config=self._stream_run_config(),
             ):
                 # ... (Tool handling logic remains same as original) ...
                 
                 # Check for function_call in part
                 if event.content and hasattr(event.content, "parts") and event.content.parts:
                     for part in event.content.parts:
+                        if event.partial:
+                            if part.text and not part.thought:
+                                streamed_parts.append(part.text)
+                                yield {"chunk_type": "text", "content": part.text}
+                            continue
+
                         func_call = getattr(part, "function_call", None)
                         if func_call:
                             yield {
@@ -575,13 +756,18 @@ class AgentService:
                             }
 
                         text = getattr(part, "text", None)
-                        if text:
+                        if text and not getattr(part, "thought", None):
                             assistant_message_parts.append(text)
-                            for char in text:
+                            if not streamed_parts:
                                 yield {
                                     "chunk_type": "text",
-                                    "content": char,
+                                    "content": text,
                                 }
+                    if not event.partial:
+                        streamed_parts.clear()
+
+            # Deltas of a response that never got its final event
+            assistant_message_parts.extend(streamed_parts)
 
             # Final message
             assistant_message = "".join(assistant_message_parts).strip()
@@ -608,7 +794,7 @@ class AgentService:
                 user_id=user_id,
                 session_id=session_id_str,
                 role="assistant",
-                content=f"Error: {str(e)}",
+                content=f"{ERROR_MESSAGE_PREFIX}{str(e)}",
             )
             yield {
                 "chunk_type": "error",
@@ -0,0 +1,338 @@
+"""
+Rolling conversation summarization that caps the history sent to the model.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.events import Event
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.models.registry import LLMRegistry
+from google.genai.types import Content, GenerateContentConfig, Part
+
+from app.core.logger import setup_logger
+from app.interfaces.chat_session_repository import IChatSessionRepository
+
+logger = setup_logger(__name__)
+
+# Gemini bills an image as a fixed number of tokens
+IMAGE_TOKENS = 258
+
+SUMMARY_PREFIX = "【これまでの会話の要約】\n"
+
+SUMMARY_INSTRUCTION = (
+    "あなたは会話ログの要約担当です。秘書エージェントとユーザーの会話を、"
+    "後続の会話で文脈として使えるように日本語で簡潔に要約してください。"
+    "ユーザーの目的・決定事項・作成/更新したタスクやプロジェクト(名前・期限)・"
+    "未解決の依頼は必ず残し、挨拶や重複は省いてください。"
+)
+
+# (previous summary, transcript of the turns to fold) -> new summary
+Summarizer = Callable[[str, str], Awaitable[str]]
+
+
+def estimate_tokens(contents: list[Content]) -> int:
+    """
+    Estimate the tokens of model contents.
+
+    Text counts a quarter token per UTF-8 byte (about 4 characters per
+    token for English, under 1 per character for Japanese); tool calls and
+    results count their JSON the same way; images count IMAGE_TOKENS.
+
+    Args:
+        contents: Model contents
+
+    Returns:
+        Estimated token count
+    """
+    total_bytes = 0
+    images = 0
+    for content in contents:
+        for part in content.parts or []:
+            if part.text:
+                total_bytes += len(part.text.encode("utf-8"))
+            elif part.function_call or part.function_response:
+                total_bytes += len(part.model_dump_json(exclude_none=True).encode("utf-8"))
+            elif part.inline_data or part.file_data:
+                images += 1
+    return math.ceil(total_bytes / 4) + images * IMAGE_TOKENS
+
+
+def _starts_turn(content: Optional[Content]) -> bool:
+    """A user content carrying text or media (not a tool result) starts a turn."""
+    parts = (content.parts if content is not None else None) or []
+    return (
+        content is not None
+        and content.role == "user"
+        and bool(parts)
+        and not any(part.function_response for part in parts)
+    )
+
+
+def turn_start_times(events: list[Event]) -> list[float]:
+    """
+    Get the start time of each turn of a session.
+
+    Args:
+        events: Session events
+
+    Returns:
+        Timestamps of the events starting a turn, oldest first
+    """
+    return [
+        event.timestamp for event in events if not event.partial and _starts_turn(event.content)
+    ]
+
+
+def split_turns(contents: list[Content]) -> list[list[Content]]:
+    """
+    Split model contents into turns.
+
+    A turn starts at a user content carrying text or media (not a tool
+    result) and runs until the next one.
+
+    Args:
+        contents: Model contents
+
+    Returns:
+        Turns, oldest first
+    """
+    turns: list[list[Content]] = []
+    for content in contents:
+        if _starts_turn(content) or not turns:
+            turns.append([])
+        turns[-1].append(content)
+    return turns
+
+
+def format_transcript(turns: list[list[Content]]) -> str:
+    """Render turns as a plain transcript for summarization."""
+    lines: list[str] = []
+    for content in (content for turn in turns for content in turn):
+        speaker = "ユーザー" if content.role == "user" else "秘書"
+        for part in content.parts or []:
+            if part.text:
+                lines.append(f"{speaker}: {part.text}")
+            elif part.function_call:
+                lines.append(
+                    f"秘書(ツール呼び出し): {part.function_call.name} {part.function_call.args}"
+                )
+            elif part.function_response:
+                lines.append(
+                    f"ツール結果({part.function_response.name}): {part.function_response.response}"
+                )
+    return "\n".join(lines)
+
+
+def llm_summarizer(
+    model: Union[str, BaseLlm], max_output_tokens: Optional[int] = None
+) -> Summarizer:
+    """
+    Build a summarizer calling the agent's own model.
+
+    Args:
+        model: Model name or ADK model instance (ILLMProvider.get_model())
+        max_output_tokens: Upper bound of the summary length
+
+    Returns:
+        Summarizer
+    """
+    llm = LLMRegistry.new_llm(model) if isinstance(model, str) else model
+
+    async def summarize(previous_summary: str, transcript: str) -> str:
+        prompt = (
+            f"これまでの要約:\n{previous_summary or '(なし)'}\n\n"
+            f"追加の会話:\n{transcript}\n\n"
+            "上の要約と追加の会話をまとめた、新しい要約だけを出力してください。"
+        )
+        request = LlmRequest(
+            model=llm.model,
+            contents=[Content(role="user", parts=[Part(text=prompt)])],
+            config=GenerateContentConfig(
+                system_instruction=SUMMARY_INSTRUCTION, max_output_tokens=max_output_tokens
+            ),
+        )
+        texts: list[str] = []
+        async for response in llm.generate_content_async(request, stream=False):
+            if response.partial or not response.content:
+                continue
+            texts.extend(part.text for part in response.content.parts or [] if part.text)
+        return "".join(texts).strip()
+
+    return summarize
+
+
+@dataclass
+class ContextStats:
+    """Process-wide token budget counters of context compaction."""
+
+    model_calls: int = 0
+    compactions: int = 0
+    summary_failures: int = 0
+    history_tokens_total: int = 0
+    sent_tokens_total: int = 0
+    max_sent_tokens: int = 0
+    last_history_tokens: int = 0
+    last_sent_tokens: int = 0
+    summary_ms_total: float = 0.0
+
+    def as_dict(self, token_budget: int, keep_turns: int) -> dict[str, Any]:
+        calls = self.model_calls or 1
+        return {
+            "token_budget": token_budget,
+            "keep_turns": keep_turns,
+            "model_calls": self.model_calls,
+            "compactions": self.compactions,
+            "summary_failures": self.summary_failures,
+            "avg_history_tokens": round(self.history_tokens_total / calls, 1),
+            "avg_sent_tokens": round(self.sent_tokens_total / calls, 1),
+            "max_sent_tokens": self.max_sent_tokens,
+            "last_history_tokens": self.last_history_tokens,
+            "last_sent_tokens": self.last_sent_tokens,
+            "avg_summary_ms": round(self.summary_ms_total / (self.compactions or 1), 1),
+        }
+
+
+context_stats = ContextStats()
+
+
+class ContextCompactor:
+    """
+    before_model_callback folding older turns into a stored running summary.
+
+    Once the history exceeds token_budget, all but the last keep_turns turns
+    are folded in one summarizer call; later calls reuse the stored summary.
+    """
+
+    def __init__(
+        self,
+        chat_repo: Optional[IChatSessionRepository],
+        summarizer: Summarizer,
+        user_id: str,
+        token_budget: int = 6000,
+        keep_turns: int = 6,
+        stats: ContextStats = context_stats,
+    ):
+        """
+        Initialize compactor.
+
+        Args:
+            chat_repo: Chat session repository storing the summaries
+                (None = compaction disabled)
+            summarizer: Folds turns into the previous summary
+            user_id: Owner of the agent's sessions
+            token_budget: History tokens above which older turns are folded
+                (0 = disabled)
+            keep_turns: Most recent turns always sent verbatim
+            stats: Counters to update
+        """
+        self._chat_repo = chat_repo
+        self._summarizer = summarizer
+        self._user_id = user_id
+        self.token_budget = token_budget
+        self.keep_turns = max(1, keep_turns)
+        self._stats = stats
+
+    async def __call__(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Compact llm_request.contents in place; never short-circuits the model call."""
+        history_tokens = estimate_tokens(llm_request.contents)
+        if self._chat_repo is not None and self.token_budget > 0:
+            session = callback_context._invocation_context.session
+            llm_request.contents = await self.compact(
+                session.id, llm_request.contents, turn_start_times(session.events)
+            )
+
+        sent_tokens = estimate_tokens(llm_request.contents)
+        stats = self._stats
+        stats.model_calls += 1
+        stats.history_tokens_total += history_tokens
+        stats.sent_tokens_total += sent_tokens
+        stats.max_sent_tokens = max(stats.max_sent_tokens, sent_tokens)
+        stats.last_history_tokens = history_tokens
+        stats.last_sent_tokens = sent_tokens
+        return None
+
+    async def compact(
+        self, session_id: str, contents: list[Content], turn_times: list[float]
+    ) -> list[Content]:
+        """
+        Replace the older turns of a session's contents by its running summary.
+
+        Turns are matched to the stored summary by their start time, not their
+        position, because a rehydrated session only holds the latest turns.
+
+        Args:
+            session_id: Session ID
+            contents: Model contents of the session
+            turn_times: Start time of each turn in contents (turn_start_times)
+
+        Returns:
+            Contents to send
+        """
+        turns = split_turns(contents)
+        if len(turn_times) != len(turns):
+            logger.warning(
+                f"Session {session_id}: {len(turns)} turns but {len(turn_times)} turn events; "
+                "sending full history"
+            )
+            return contents
+
+        stored = await self._chat_repo.get_summary(self._user_id, session_id)
+        summary = stored.summary if stored is not None else ""
+        summarized_until = stored.summarized_until if stored is not None else 0.0
+        # Turns the summary already covers; the current turn is always kept
+        folded = min(
+            sum(1 for started_at in turn_times if started_at <= summarized_until),
+            len(turns) - 1,
+        )
+
+        recent = turns[folded:]
+        if (
+            len(recent) > self.keep_turns
+            and estimate_tokens(self._with_summary(summary, recent)) > self.token_budget
+        ):
+            fold_until = len(turns) - self.keep_turns
+            started_at = time.perf_counter()
+            try:
+                summary = await self._summarizer(
+                    summary, format_transcript(turns[folded:fold_until])
+                )
+            except Exception:
+                self._stats.summary_failures += 1
+                logger.exception(f"Summarizing session {session_id} failed; sending full history")
+            else:
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                recent = turns[fold_until:]
+                await self._chat_repo.save_summary(
+                    self._user_id, session_id, summary, turn_times[fold_until - 1]
+                )
+                self._stats.compactions += 1
+                self._stats.summary_ms_total += elapsed_ms
+                logger.info(
+                    f"Compacted session {session_id}: {fold_until - folded} turns summarized, "
+                    f"{len(recent)} kept ({elapsed_ms:.0f} ms)"
+                )
+
+        return self._with_summary(summary, recent)
+
+    @staticmethod
+    def _with_summary(summary: str, turns: list[list[Content]]) -> list[Content]:
+        contents = [content for turn in turns for content in turn]
+        if not summary or not contents:
+            return contents
+        first = contents[0]
+        # Prepended to the first kept user message, so roles keep alternating
+        return [
+            Content(
+                role=first.role,
+                parts=[Part(text=SUMMARY_PREFIX + summary), *(first.parts or [])],
+            ),
+            *contents[1:],
+        ]
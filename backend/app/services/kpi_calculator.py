@@ -7,15 +7,16 @@ Compute project KPI current values based on task data.
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, TypeVar
+from typing import Iterable, Optional, TypeVar
 from uuid import UUID
 
+from app.infrastructure.compute_executor import ComputeExecutor
 from app.interfaces.task_repository import ITaskRepository
 from app.models.enums import TaskStatus
 from app.models.project import Project, ProjectWithTaskCount
 from app.models.project_kpi import ProjectKpiConfig, ProjectKpiMetric
-from app.models.task import Task
-from app.services.task_utils import get_effective_estimated_minutes
+from app.models.task import Task, TaskFilters
+from app.services.task_utils import SubtaskIndex, get_effective_estimated_minutes
 
 
 TProject = TypeVar("TProject", Project, ProjectWithTaskCount)
@@ -49,6 +50,7 @@ def _compute_task_kpis(tasks: Iterable[Task]) -> dict[str, float | int]:
 
     task_by_id = {task.id: task for task in task_list}
     done_ids = {task.id for task in task_list if task.status == TaskStatus.DONE}
+    subtask_index = SubtaskIndex(task_list)
 
     for task in task_list:
         if task.status == TaskStatus.IN_PROGRESS:
@@ -57,7 +59,7 @@ def _compute_task_kpis(tasks: Iterable[Task]) -> dict[str, float | int]:
         if task.status != TaskStatus.DONE:
             backlog_count += 1
             # Use effective estimated minutes (considers subtasks)
-            effective_minutes = get_effective_estimated_minutes(task, task_list)
+            effective_minutes = get_effective_estimated_minutes(task, subtask_index)
             remaining_minutes += effective_minutes
 
         if task.due_date and task.status != TaskStatus.DONE:
@@ -117,22 +119,15 @@ async def _fetch_all_tasks(
     task_repo: ITaskRepository,
     user_id: str,
     project_id: UUID,
-    limit: int = 200,
+    batch_size: int = 500,
 ) -> list[Task]:
     tasks: list[Task] = []
-    offset = 0
-    while True:
-        batch = await task_repo.list(
-            user_id,
-            project_id=project_id,
-            include_done=True,
-            limit=limit,
-            offset=offset,
-        )
+    async for batch in task_repo.iter_tasks(
+        user_id,
+        TaskFilters(project_id=project_id),
+        batch_size=batch_size,
+    ):
         tasks.extend(batch)
-        if len(batch) < limit:
-            break
-        offset += limit
     return tasks
 
 
@@ -140,11 +135,15 @@ async def apply_project_kpis(
     user_id: str,
     project: TProject,
     task_repo: ITaskRepository,
+    compute: Optional[ComputeExecutor] = None,
 ) -> TProject:
     if not project.kpi_config or not project.kpi_config.metrics:
         return project
 
     tasks = await _fetch_all_tasks(task_repo, user_id, project.id)
-    computed = _compute_task_kpis(tasks)
+    if compute is None:
+        computed = _compute_task_kpis(tasks)
+    else:
+        computed = await compute.run(_compute_task_kpis, tasks)
     updated_config = _apply_kpi_results(project.kpi_config, computed)
     return project.model_copy(update={"kpi_config": updated_config})
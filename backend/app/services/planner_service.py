@@ -26,7 +26,7 @@ from app.models.breakdown import (
     TaskBreakdown,
 )
 from app.models.enums import CreatedBy, EnergyLevel
-from app.models.task import Task, TaskCreate
+from app.models.task import Task, TaskBatchCreate
 
 if TYPE_CHECKING:
     from app.interfaces.project_repository import IProjectRepository
@@ -384,11 +384,11 @@ class PlannerService:
         breakdown: TaskBreakdown,
     ) -> list[UUID]:
         """Create subtasks from breakdown steps with dependency relationships."""
-        # Map step_number -> subtask_id for dependency resolution
-        step_to_id: dict[int, UUID] = {}
-        subtask_ids = []
+        # Map step_number -> batch index for dependency resolution
+        step_to_index = {step.step_number: index for index, step in enumerate(breakdown.steps)}
+        subtasks: list[TaskBatchCreate] = []
 
-        for step in breakdown.steps:
+        for index, step in enumerate(breakdown.steps):
             # Build description with guide
             # Format: description + separator + guide (Markdown)
             description_parts = []
@@ -399,18 +399,20 @@ class PlannerService:
                     description_parts.append("\n\n---\n\n")
                 description_parts.append(step.guide)
 
-            # Resolve dependencies: map step_numbers to task IDs
-            dependency_ids = []
+            # Resolve dependencies: map step_numbers to sibling indexes in the batch.
+            # Only earlier steps are resolved, so a breakdown can never form a cycle.
+            dependency_indexes = []
             for dep_step_num in step.dependency_step_numbers:
-                if dep_step_num in step_to_id:
-                    dependency_ids.append(step_to_id[dep_step_num])
+                dep_index = step_to_index.get(dep_step_num)
+                if dep_index is not None and dep_index < index:
+                    dependency_indexes.append(dep_index)
                 else:
                     logger.warning(
                         f"Step {step.step_number} depends on step {dep_step_num}, "
-                        f"but step {dep_step_num} has not been created yet. Skipping dependency."
+                        f"but step {dep_step_num} does not come before it. Skipping dependency."
                     )
 
-            subtask = TaskCreate(
+            subtasks.append(TaskBatchCreate(
                 title=f"[{step.step_number}] {step.title}",
                 description="".join(description_parts) if description_parts else None,
                 project_id=parent_task.project_id,
@@ -419,14 +421,10 @@ class PlannerService:
                 energy_level=step.energy_level,
                 estimated_minutes=step.estimated_minutes,
                 parent_id=parent_task.id,
-                dependency_ids=dependency_ids,  # Always pass list (can be empty)
+                batch_dependency_indexes=dependency_indexes,
                 created_by=CreatedBy.AGENT,
-            )
-            created = await self._task_repo.create(user_id, subtask)
-
-            # Map this step number to the created task ID
-            step_to_id[step.step_number] = created.id
-            subtask_ids.append(created.id)
-
-        return subtask_ids
+            ))
 
+        # Single transaction for all subtasks
+        created = await self._task_repo.create_many(user_id, subtasks)
+        return [task.id for task in created]
@@ -0,0 +1,161 @@
+"""
+Bounded per-user cache for agent runners and session metadata.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+# Measured with tracemalloc: secretary agent + tools + empty InMemoryRunner,
+# and one session event without its text
+RUNNER_BASE_BYTES = 24_000
+EVENT_BASE_BYTES = 3_000
+SESSION_INDEX_ENTRY_BYTES = 600
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    last_used: float
+
+
+class LruTtlCache(Generic[V]):
+    """
+    Size-bounded LRU cache whose entries also expire after an idle TTL.
+
+    Idle entries sit at the LRU end, so expiry only looks at the oldest
+    ones. Runs on the event loop, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        idle_ttl_seconds: float = 0,
+        size_of: Optional[Callable[[V], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            idle_ttl_seconds: Entries unused for this long are dropped (0 = never)
+            size_of: Estimates the memory of a value in bytes
+            clock: Monotonic clock in seconds
+        """
+        self._max_entries = max_entries
+        self._idle_ttl = idle_ttl_seconds
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[V]:
+        """Return a live entry and mark it as used, or None."""
+        self._expire()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry.last_used = self._clock()
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def peek(self, key: str) -> Optional[V]:
+        """Return a live entry without counting a lookup or marking it used."""
+        self._expire()
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def put(self, key: str, value: V) -> None:
+        """Store an entry as most recently used, evicting the least recently used."""
+        self._entries[key] = _Entry(value, self._clock())
+        self._entries.move_to_end(key)
+        self._expire()
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: str) -> Optional[V]:
+        """Remove an entry."""
+        entry = self._entries.pop(key, None)
+        return entry.value if entry is not None else None
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return cache counters and the estimated memory of live entries."""
+        self._expire()
+        lookups = self.hits + self.misses
+        stats: dict[str, int | float] = {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "idle_ttl_seconds": self._idle_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+        if self._size_of is not None:
+            sizes = [self._size_of(entry.value) for entry in self._entries.values()]
+            stats["estimated_bytes"] = sum(sizes)
+            stats["max_entry_bytes"] = max(sizes, default=0)
+        return stats
+
+    def _expire(self) -> None:
+        if self._idle_ttl <= 0:
+            return
+        cutoff = self._clock() - self._idle_ttl
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.last_used > cutoff:
+                break
+            del self._entries[key]
+            self.expirations += 1
+
+
+def estimate_runner_bytes(runner: Any) -> int:
+    """
+    Estimate the memory held by a user's runner.
+
+    Counts a fixed cost for the agent and runner plus every event of the
+    runner's in-memory sessions.
+
+    Args:
+        runner: InMemoryRunner
+
+    Returns:
+        Estimated bytes
+    """
+    total = RUNNER_BASE_BYTES
+    sessions_by_app = getattr(runner.session_service, "sessions", {})
+    for sessions_by_user in sessions_by_app.values():
+        for sessions in sessions_by_user.values():
+            for session in sessions.values():
+                for event in session.events:
+                    total += EVENT_BASE_BYTES
+                    for part in (event.content.parts if event.content else None) or []:
+                        if part.text:
+                            total += sys.getsizeof(part.text)
+    return total
+
+
+def estimate_session_index_bytes(sessions: dict[str, dict[str, Any]]) -> int:
+    """Estimate the memory of one user's session index."""
+    return SESSION_INDEX_ENTRY_BYTES * len(sessions)
@@ -0,0 +1,223 @@
+"""
+Schedule result cache.
+
+Keeps built schedules between requests until the user's data changes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Awaitable, Callable, Optional, Sequence, Union
+
+from app.models.schedule import ScheduleResponse
+from app.services.scheduler_service import ScheduleRun
+
+
+@dataclass(frozen=True)
+class ScheduleParams:
+    """Inputs of a build_schedule call, other than the user's data."""
+
+    start_date: date
+    capacity_hours: Optional[float]
+    capacity_by_weekday: Optional[tuple[float, ...]]
+    horizon_days: int
+
+    @classmethod
+    def create(
+        cls,
+        start_date: date,
+        capacity_hours: Optional[float],
+        capacity_by_weekday: Optional[Sequence[float]],
+        max_days: int,
+        until: Optional[date] = None,
+    ) -> ScheduleParams:
+        """
+        Normalize build_schedule arguments into cache parameters.
+
+        Buffer hours are expected to be applied to the capacities already.
+
+        Args:
+            start_date: Resolved schedule start date
+            capacity_hours: Effective daily capacity (None = scheduler default)
+            capacity_by_weekday: Effective capacity per weekday (Sun..Sat)
+            max_days: Maximum days to schedule
+            until: Last day to schedule, if any
+
+        Returns:
+            Cache parameters
+        """
+        horizon_days = max_days
+        if until is not None:
+            horizon_days = min(horizon_days, max(0, (until - start_date).days + 1))
+        return cls(
+            start_date=start_date,
+            capacity_hours=capacity_hours,
+            capacity_by_weekday=tuple(capacity_by_weekday) if capacity_by_weekday else None,
+            horizon_days=horizon_days,
+        )
+
+    @property
+    def base(self) -> tuple:
+        """Parameters without the horizon."""
+        return (self.start_date, self.capacity_hours, self.capacity_by_weekday)
+
+
+@dataclass
+class _Entry:
+    version: int
+    schedule: ScheduleResponse
+    run: Optional[ScheduleRun] = None
+
+
+class ScheduleCache:
+    """
+    Size-bounded LRU cache of built schedules, invalidated by data version.
+
+    Today views may be served from a longer schedule with the same
+    parameters, since the simulation never looks ahead.
+    """
+
+    def __init__(self, version: Callable[[str], Awaitable[int]], max_entries: int = 512):
+        """
+        Initialize cache.
+
+        Args:
+            version: Coroutine returning a user's current data version; must
+                change on every task/project write (e.g. SnapshotCache.version)
+            max_entries: Maximum number of cached schedules (0 = disabled)
+        """
+        self._version = version
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # (user_id, base params) -> longest cached horizon
+        self._widest: dict[tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get_or_build(
+        self,
+        user_id: str,
+        params: ScheduleParams,
+        build: Callable[[], Awaitable[Union[ScheduleResponse, ScheduleRun]]],
+        days_only: bool = False,
+    ) -> ScheduleResponse:
+        """
+        Return a cached schedule, building it on a miss.
+
+        Args:
+            user_id: Owner user ID
+            params: Scheduling parameters
+            build: Coroutine factory that loads the user's data and builds
+                the schedule (or a ScheduleRun) for params
+            days_only: The caller only reads schedule days up to the
+                horizon, so a longer schedule may be returned
+
+        Returns:
+            Schedule
+        """
+        if self._max_entries <= 0:
+            return _response(await build())
+
+        version = await self._version(user_id)
+        schedule = self._lookup(user_id, params, version, days_only)
+        if schedule is not None:
+            self.hits += 1
+            return schedule
+
+        self.misses += 1
+        built = await build()
+        run = built if isinstance(built, ScheduleRun) else None
+        schedule = _response(built)
+
+        # Only store if no write happened while building
+        if await self._version(user_id) == version:
+            self._store(user_id, params, version, schedule, run)
+        return schedule
+
+    def previous_run(self, user_id: str, params: ScheduleParams) -> Optional[ScheduleRun]:
+        """
+        Return the last stored run for params, even if the data changed since.
+
+        Args:
+            user_id: Owner user ID
+            params: Scheduling parameters
+
+        Returns:
+            Run to resume from, or None
+        """
+        entry = self._entries.get((user_id, params.base, params.horizon_days))
+        return entry.run if entry is not None else None
+
+    def clear(self) -> None:
+        """Drop all cached schedules (counters are kept)."""
+        self._entries.clear()
+        self._widest.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Return cache counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def _get(self, key: tuple, version: int) -> Optional[ScheduleResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            return None
+        self._entries.move_to_end(key)
+        return entry.schedule
+
+    def _lookup(
+        self,
+        user_id: str,
+        params: ScheduleParams,
+        version: int,
+        days_only: bool,
+    ) -> Optional[ScheduleResponse]:
+        schedule = self._get((user_id, params.base, params.horizon_days), version)
+        if schedule is not None or not days_only:
+            return schedule
+        widest = self._widest.get((user_id, params.base))
+        if widest is None or widest < params.horizon_days:
+            return None
+        return self._get((user_id, params.base, widest), version)
+
+    def _store(
+        self,
+        user_id: str,
+        params: ScheduleParams,
+        version: int,
+        schedule: ScheduleResponse,
+        run: Optional[ScheduleRun],
+    ) -> None:
+        key = (user_id, params.base, params.horizon_days)
+        self._entries[key] = _Entry(version=version, schedule=schedule, run=run)
+        self._entries.move_to_end(key)
+
+        widest_key = (user_id, params.base)
+        widest = self._widest.get(widest_key)
+        widest_entry = self._entries.get((user_id, params.base, widest))
+        if (
+            widest_entry is None
+            or widest_entry.version != version
+            or widest < params.horizon_days
+        ):
+            self._widest[widest_key] = params.horizon_days
+
+        while len(self._entries) > self._max_entries:
+            (evicted_user, evicted_base, evicted_horizon), _ = self._entries.popitem(last=False)
+            if self._widest.get((evicted_user, evicted_base)) == evicted_horizon:
+                del self._widest[(evicted_user, evicted_base)]
+            self.evictions += 1
+
+
+def _response(built: Union[ScheduleResponse, ScheduleRun]) -> ScheduleResponse:
+    return built.response if isinstance(built, ScheduleRun) else built
@@ -0,0 +1,27 @@
+"""
+Schedule input loading.
+
+Reads the tasks and project priorities a user's schedule is built from.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.task_repository import ITaskRepository
+from app.models.task import Task
+
+
+async def load_all_tasks(repo: ITaskRepository, user_id: str) -> list[Task]:
+    """Load every task for scheduling (streamed in batches, no row ceiling)."""
+    tasks: list[Task] = []
+    async for batch in repo.iter_tasks(user_id):
+        tasks.extend(batch)
+    return tasks
+
+
+async def load_project_priorities(project_repo: IProjectRepository, user_id: str) -> dict[UUID, int]:
+    """Load project priorities for scheduling."""
+    projects = await project_repo.list(user_id, limit=1000)
+    return {project.id: project.priority for project in projects}
@@ -4,12 +4,17 @@ Scheduler service for capacity-aware task scheduling.
 Handles task scheduling with capacity constraints and dependency resolution.
 """
 
+import heapq
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta
-from typing import Optional
+from itertools import count
+from typing import Callable, Optional
 from uuid import UUID
 
+import numpy as np
+
 from app.core.logger import setup_logger
-from app.models.enums import EnergyLevel, Priority, TaskStatus
+from app.models.enums import EnergyLevel, TaskStatus
 from app.models.schedule import (
     ScheduleDay,
     TaskAllocation,
@@ -21,7 +26,19 @@ from app.models.schedule import (
     ExcludedTask,
 )
 from app.models.task import Task
-from app.services.task_utils import get_effective_estimated_minutes, is_parent_task
+from app.services.scoring import (
+    IMPORTANCE_POINTS,
+    PRIORITY_WEIGHTS,
+    URGENCY_POINTS,
+    TaskScoreArrays,
+    ramp_due_bonus_curve,
+)
+from app.services.task_utils import (
+    MeetingIndex,
+    SubtaskIndex,
+    get_effective_estimated_minutes,
+    is_parent_task,
+)
 
 logger = setup_logger(__name__)
 
@@ -36,6 +53,16 @@ class SchedulerService:
     - Dependency-aware scheduling
     """
 
+    # Due-date bonus: ramps up to DUE_BONUS_MAX over the last
+    # DUE_BONUS_HORIZON_DAYS days before the due date
+    DUE_BONUS_MAX = 30.0
+    DUE_BONUS_HORIZON_DAYS = 14
+    DUE_BONUS_CURVE = ramp_due_bonus_curve(DUE_BONUS_MAX, DUE_BONUS_HORIZON_DAYS)
+
+    # Incremental rescheduling: above this many changed tasks, scanning the
+    # previous run for each of them costs more than simulating from scratch
+    INCREMENTAL_MAX_CHANGED_TASKS = 64
+
     def __init__(
         self,
         default_capacity_hours: float = 8.0,
@@ -60,6 +87,7 @@ class SchedulerService:
         self,
         tasks: list[Task],
         capacity_hours: Optional[float] = None,
+        subtask_index: Optional[SubtaskIndex] = None,
     ) -> dict:
         """
         Check if tasks fit within daily capacity.
@@ -67,6 +95,7 @@ class SchedulerService:
         Args:
             tasks: List of tasks to schedule
             capacity_hours: Daily capacity in hours (None = use default)
+            subtask_index: Prebuilt subtask index (None = build from tasks)
 
         Returns:
             Dictionary with:
@@ -79,6 +108,8 @@ class SchedulerService:
         """
         capacity = capacity_hours or self.default_capacity_hours
         capacity_minutes = int(capacity * 60)
+        if subtask_index is None:
+            subtask_index = SubtaskIndex(tasks)
 
         # Calculate total estimated time
         total_minutes = 0
@@ -87,10 +118,10 @@ class SchedulerService:
 
         for task in tasks:
             # Use effective estimated minutes (considers subtasks)
-            effective_minutes = get_effective_estimated_minutes(task, tasks)
+            effective_minutes = get_effective_estimated_minutes(task, subtask_index)
             if effective_minutes > 0:
                 total_minutes += effective_minutes
-                tasks_with_time.append(task)
+                tasks_with_time.append((task, effective_minutes))
             else:
                 tasks_without_time.append(task)
 
@@ -107,9 +138,7 @@ class SchedulerService:
         accumulated_minutes = 0
 
         # Prioritize tasks with estimates first (already scored by caller)
-        for task in tasks_with_time:
-            # Use effective estimated minutes (considers subtasks)
-            task_minutes = get_effective_estimated_minutes(task, tasks)
+        for task, task_minutes in tasks_with_time:
             if accumulated_minutes + task_minutes <= capacity_minutes:
                 tasks_that_fit.append(task)
                 accumulated_minutes += task_minutes
@@ -183,67 +212,43 @@ class SchedulerService:
 
         return message
 
-    def _get_meetings_for_day(
+    def build_schedule(
         self,
         tasks: list[Task],
-        target_date: date,
-    ) -> tuple[list[Task], int]:
+        project_priorities: dict[UUID, int] | None = None,
+        start_date: Optional[date] = None,
+        capacity_hours: Optional[float] = None,
+        capacity_by_weekday: Optional[list[float]] = None,
+        max_days: int = 60,
+        subtask_index: Optional[SubtaskIndex] = None,
+        until: Optional[date] = None,
+    ) -> ScheduleResponse:
         """
-        Get meetings scheduled for a specific day and calculate total duration.
+        Build a capacity-aware schedule across multiple days.
 
-        Handles overlapping meetings by merging time intervals to avoid
-        double-counting overlapping periods.
+        - Tasks can span multiple days.
+        - Dependencies are respected.
 
-        Args:
-            tasks: All tasks
-            target_date: Date to check
+        subtask_index may be passed to reuse an index already built over
+        the same tasks (e.g. by get_today_tasks or the KPI calculator).
 
-        Returns:
-            (list of meeting tasks, total meeting minutes accounting for overlaps)
+        Days are simulated in order and never look ahead, so the days up to
+        ``until`` are identical to those of a longer run. Pass ``until`` (the
+        last day to schedule, inclusive) when only that window is needed,
+        e.g. ``until=start_date`` for today's plan; tasks left over are
+        reported as max_days_exceeded.
         """
-        meetings = [
-            task for task in tasks
-            if task.is_fixed_time
-            and task.start_time
-            and task.start_time.date() == target_date
-        ]
-
-        if not meetings:
-            return meetings, 0
-
-        # Create list of time intervals (start_minutes, end_minutes from midnight)
-        intervals = []
-        for meeting in meetings:
-            if meeting.end_time and meeting.start_time:
-                # Convert to minutes from midnight for easier calculation
-                start_mins = meeting.start_time.hour * 60 + meeting.start_time.minute
-                end_mins = meeting.end_time.hour * 60 + meeting.end_time.minute
-
-                # Handle meetings that span midnight (rare but possible)
-                if end_mins < start_mins:
-                    end_mins = 24 * 60  # Cap at end of day
-
-                intervals.append((start_mins, end_mins))
-
-        # Sort intervals by start time
-        intervals.sort()
-
-        # Merge overlapping intervals
-        merged = []
-        for start, end in intervals:
-            if merged and start <= merged[-1][1]:
-                # Overlaps with previous interval, merge them
-                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-            else:
-                # No overlap, add as new interval
-                merged.append((start, end))
-
-        # Calculate total minutes from merged intervals
-        total_minutes = sum(end - start for start, end in merged)
+        inputs = self._prepare_schedule(
+            tasks, project_priorities, start_date, capacity_hours, capacity_by_weekday, max_days, subtask_index, until
+        )
+        if not inputs.scheduled_tasks:
+            return self._assemble_schedule(inputs, None)
 
-        return meetings, total_minutes
+        state = self._initial_state(inputs, record=False)
+        self._simulate(inputs, state)
+        return self._assemble_schedule(inputs, state)
 
-    def build_schedule(
+    def build_schedule_run(
         self,
         tasks: list[Task],
         project_priorities: dict[UUID, int] | None = None,
@@ -251,53 +256,96 @@ class SchedulerService:
         capacity_hours: Optional[float] = None,
         capacity_by_weekday: Optional[list[float]] = None,
         max_days: int = 60,
-    ) -> ScheduleResponse:
+        subtask_index: Optional[SubtaskIndex] = None,
+        until: Optional[date] = None,
+        previous: Optional["ScheduleRun"] = None,
+    ) -> "ScheduleRun":
         """
-        Build a capacity-aware schedule across multiple days.
+        Build a schedule and keep its per-day checkpoints for incremental updates.
 
-        - Tasks can span multiple days.
-        - Dependencies are respected.
+        Takes the same arguments as build_schedule, and the response equals
+        build_schedule's. When ``previous`` is a run over an earlier version
+        of the same user's tasks with the same scheduling parameters, the
+        days before the first day the changed tasks could affect are reused
+        and the simulation resumes from that day's checkpoint. A day is
+        affected by a changed task if the task was allocated on it, or could
+        have been forced by its due date or picked over that day's actual
+        pick. Changed meetings affect the days they are on.
+
+        Args:
+            tasks: Current tasks of the user
+            previous: Earlier run to resume from (None = full build)
+
+        Returns:
+            Schedule run; ``resumed_day`` tells where the simulation resumed
         """
-        if not tasks:
-            start = start_date or date.today()
-            return ScheduleResponse(
-                start_date=start,
-                days=[],
-                tasks=[],
-                unscheduled_task_ids=[],
-                excluded_tasks=[],
-            )
+        inputs = self._prepare_schedule(
+            tasks, project_priorities, start_date, capacity_hours, capacity_by_weekday, max_days, subtask_index, until
+        )
+        if not inputs.scheduled_tasks:
+            return ScheduleRun(response=self._assemble_schedule(inputs, None), inputs=inputs, state=None)
+
+        recorded = previous.recorded() if previous is not None else None
+        resume_index = self._resume_index(recorded, inputs) if recorded is not None else None
+        if recorded is None or resume_index is None:
+            state = self._initial_state(inputs, record=True)
+            self._simulate(inputs, state)
+        else:
+            state = self._resume_state(recorded, inputs, resume_index)
+            if not state.ended_due_to_cycle:
+                self._simulate(inputs, state)
+        return ScheduleRun(
+            response=self._assemble_schedule(inputs, state),
+            inputs=inputs,
+            state=state,
+            resumed_day=resume_index,
+        )
 
+    def _prepare_schedule(
+        self,
+        tasks: list[Task],
+        project_priorities: dict[UUID, int] | None,
+        start_date: Optional[date],
+        capacity_hours: Optional[float],
+        capacity_by_weekday: Optional[list[float]],
+        max_days: int,
+        subtask_index: Optional[SubtaskIndex],
+        until: Optional[date],
+    ) -> "_ScheduleInputs":
+        """Derive the static inputs of a schedule simulation from the tasks."""
         start = start_date or date.today()
         project_priorities = project_priorities or {}
         capacity_by_weekday = capacity_by_weekday if capacity_by_weekday and len(capacity_by_weekday) == 7 else None
+        horizon_days = max_days
+        if until is not None:
+            horizon_days = min(horizon_days, max(0, (until - start).days + 1))
+
+        inputs = _ScheduleInputs(
+            start=start,
+            horizon_days=horizon_days,
+            capacity=(
+                capacity_hours or self.default_capacity_hours,
+                tuple(capacity_by_weekday) if capacity_by_weekday else None,
+            ),
+            project_priorities=project_priorities,
+            all_task_map={task.id: task for task in tasks},
+            subtask_index=subtask_index if subtask_index is not None else SubtaskIndex(tasks),
+            meeting_index=MeetingIndex(tasks),
+        )
+        if not tasks:
+            return inputs
+        subtask_index = inputs.subtask_index
 
-        def capacity_minutes_for_day(day: date) -> int:
-            if capacity_by_weekday:
-                weekday_index = (day.weekday() + 1) % 7
-                hours = capacity_by_weekday[weekday_index]
-            else:
-                hours = capacity_hours or self.default_capacity_hours
-            return max(0, int(hours * 60))
-
-        all_task_map = {task.id: task for task in tasks}
-
-        def get_parent_info(task: Task) -> tuple[Optional[UUID], Optional[str]]:
-            if not task.parent_id:
-                return None, None
-            parent = all_task_map.get(task.parent_id)
-            return task.parent_id, parent.title if parent else None
-
-        excluded_tasks: list[ExcludedTask] = []
+        parent_ids = {task.id for task in tasks if is_parent_task(task, subtask_index)}
         for task in tasks:
             reason: Optional[str] = None
             if task.status == TaskStatus.WAITING:
                 reason = "waiting"
-            elif is_parent_task(task, tasks):
+            elif task.id in parent_ids:
                 reason = "parent_task"
             if reason:
-                parent_id, parent_title = get_parent_info(task)
-                excluded_tasks.append(
+                parent_id, parent_title = inputs.parent_info(task)
+                inputs.excluded_tasks.append(
                     ExcludedTask(
                         task_id=task.id,
                         title=task.title,
@@ -313,19 +361,18 @@ class SchedulerService:
             for task in tasks
             if task.status != TaskStatus.DONE
             and task.status != TaskStatus.WAITING
-            and not is_parent_task(task, tasks)
+            and task.id not in parent_ids
             and not task.is_fixed_time  # 会議は通常スケジューリング対象外
         ]
         candidate_ids = {task.id for task in candidate_tasks}
+        inputs.candidate_tasks = candidate_tasks
 
-        blocked_task_ids: set[UUID] = set()
-        unscheduled_reasons: dict[UUID, str] = {}
         for task in candidate_tasks:
             if not task.dependency_ids:
                 continue
-            reason: Optional[str] = None
+            reason = None
             for dep_id in task.dependency_ids:
-                dep_task = all_task_map.get(dep_id)
+                dep_task = inputs.all_task_map.get(dep_id)
                 if dep_task is None:
                     reason = "dependency_missing"
                     break
@@ -333,80 +380,120 @@ class SchedulerService:
                     reason = "dependency_unresolved"
                     break
             if reason:
-                blocked_task_ids.add(task.id)
-                unscheduled_reasons[task.id] = reason
-
-        scheduled_tasks = [task for task in candidate_tasks if task.id not in blocked_task_ids]
-
-        if not scheduled_tasks:
-            tasks_info = [
-                TaskScheduleInfo(
-                    task_id=task.id,
-                    title=task.title,
-                    project_id=task.project_id,
-                    parent_id=get_parent_info(task)[0],
-                    parent_title=get_parent_info(task)[1],
-                    due_date=task.due_date,
-                    planned_start=None,
-                    planned_end=None,
-                    total_minutes=get_effective_estimated_minutes(task, tasks) or self.default_task_minutes,
-                    priority_score=self._calculate_task_score(task, project_priorities, start),
-                )
-                for task in candidate_tasks
-            ]
-            unscheduled_items = [
-                UnscheduledTask(task_id=task_id, reason=unscheduled_reasons.get(task_id, "dependency_unresolved"))
-                for task_id in blocked_task_ids
-            ]
-            return ScheduleResponse(
-                start_date=start,
-                days=[],
-                tasks=tasks_info,
-                unscheduled_task_ids=unscheduled_items,
-                excluded_tasks=excluded_tasks,
-            )
+                inputs.blocked_reasons[task.id] = reason
 
-        task_map = {task.id: task for task in scheduled_tasks}
-        remaining_minutes: dict[UUID, int] = {}
-        base_scores: dict[UUID, float] = {}
+        inputs.scheduled_tasks = [task for task in candidate_tasks if task.id not in inputs.blocked_reasons]
+        inputs.task_map = {task.id: task for task in inputs.scheduled_tasks}
 
-        for task in candidate_tasks:
-            base_scores[task.id] = self._calculate_base_score(task, project_priorities)
+        inputs.score_arrays = TaskScoreArrays(candidate_tasks, project_priorities)
+        inputs.base_score_array = inputs.score_arrays.scheduler_base_scores(self.project_priority_weight)
+        inputs.base_scores = dict(zip(inputs.score_arrays.task_ids, inputs.base_score_array.tolist()))
+        inputs.due_ordinals = {
+            task.id: task.due_date.toordinal() for task in inputs.scheduled_tasks if task.due_date
+        }
 
-        for task in scheduled_tasks:
-            minutes = get_effective_estimated_minutes(task, tasks)
-            remaining_minutes[task.id] = minutes if minutes > 0 else self.default_task_minutes
+        for task in inputs.scheduled_tasks:
+            minutes = get_effective_estimated_minutes(task, subtask_index)
+            inputs.estimated_minutes[task.id] = minutes if minutes > 0 else self.default_task_minutes
 
         # Build dependency graph within scheduled tasks
-        task_ids = set(task_map.keys())
-        dependents: dict[UUID, list[UUID]] = {task_id: [] for task_id in task_ids}
-        indegree: dict[UUID, int] = {task_id: 0 for task_id in task_ids}
-
-        for task in scheduled_tasks:
-            relevant_deps = [dep_id for dep_id in task.dependency_ids if dep_id in task_ids]
+        task_map = inputs.task_map
+        inputs.dependents = {task_id: [] for task_id in task_map}
+        for task in inputs.scheduled_tasks:
+            relevant_deps = [dep_id for dep_id in task.dependency_ids if dep_id in task_map]
+            inputs.dependencies[task.id] = relevant_deps
             for dep_id in relevant_deps:
-                dependents[dep_id].append(task.id)
-                indegree[task.id] += 1
+                inputs.dependents[dep_id].append(task.id)
+        return inputs
 
-        ready = [task_id for task_id, count in indegree.items() if count == 0]
-        in_progress: list[UUID] = []
+    def _day_score_fn(self, inputs: "_ScheduleInputs", day: date) -> Callable[[UUID], float]:
+        base_scores = inputs.base_scores
+        due_ordinals = inputs.due_ordinals
+        bonus = self.DUE_BONUS_CURVE.bonus
+        day_ordinal = day.toordinal()
 
-        task_start: dict[UUID, date] = {}
-        task_end: dict[UUID, date] = {}
+        def score(task_id: UUID) -> float:
+            due_ordinal = due_ordinals.get(task_id)
+            if due_ordinal is None:
+                return base_scores[task_id]
+            return base_scores[task_id] + bonus(due_ordinal - day_ordinal)
 
-        days: list[ScheduleDay] = []
-        day_cursor = start
-        remaining_task_ids = set(task_ids)
-        safety_limit = max_days
+        return score
 
-        ended_due_to_limit = False
-        ended_due_to_cycle = False
+    def _initial_state(self, inputs: "_ScheduleInputs", record: bool) -> "_SimulationState":
+        """Return the simulation state before the first day."""
+        day_score = self._day_score_fn(inputs, inputs.start)
+        state = _SimulationState(
+            remaining_minutes=dict(inputs.estimated_minutes),
+            indegree={task_id: len(deps) for task_id, deps in inputs.dependencies.items()},
+            ready=_ReadyQueue(inputs.task_map, day_score),
+            in_progress=_ReadyQueue(inputs.task_map, day_score),
+            scored_day=inputs.start,
+            day_cursor=inputs.start,
+            safety_limit=inputs.horizon_days,
+            remaining_task_ids=set(inputs.task_map),
+            checkpoints=[] if record else None,
+        )
+        for task_id, degree in state.indegree.items():
+            if degree == 0:
+                state.ready.add(task_id)
+        return state
+
+    def _simulate(self, inputs: "_ScheduleInputs", state: "_SimulationState") -> None:
+        """Allocate tasks day by day from the state's current day until done or out of days."""
+        task_map = inputs.task_map
+        meeting_index = inputs.meeting_index
+        dependents = inputs.dependents
+        remaining_minutes = state.remaining_minutes
+        indegree = state.indegree
+        ready = state.ready
+        in_progress = state.in_progress
+        task_start = state.task_start
+        task_end = state.task_end
+        days = state.days
+        remaining_task_ids = state.remaining_task_ids
+        checkpoints = state.checkpoints
+        checkpoint: Optional[_DayCheckpoint] = None
+
+        while remaining_task_ids and state.safety_limit > 0:
+            day_cursor = state.day_cursor
+            capacity_minutes_today = inputs.capacity_minutes_for_day(day_cursor)
+            if checkpoints is not None:
+                checkpoint = _DayCheckpoint(
+                    in_progress={task_id: remaining_minutes[task_id] for task_id in in_progress.task_ids()}
+                )
+                checkpoints.append(checkpoint)
+
+            # Fast-forward: nothing can be allocated on a day without capacity,
+            # meetings or tasks forced by their due date
+            if (
+                capacity_minutes_today == 0
+                and not meeting_index.meetings_on(day_cursor)
+                and not ready.due_by(day_cursor)
+                and not in_progress.due_by(day_cursor)
+            ):
+                days.append(
+                    ScheduleDay(
+                        date=day_cursor,
+                        capacity_minutes=0,
+                        allocated_minutes=0,
+                        overflow_minutes=0,
+                        task_allocations=[],
+                        meeting_minutes=0,
+                        available_minutes=0,
+                    )
+                )
+                if checkpoint is not None:
+                    checkpoint.pooled = len(ready) + len(in_progress)
+                state.day_cursor += timedelta(days=1)
+                state.safety_limit -= 1
+                if not ready and not in_progress:
+                    state.ended_due_to_cycle = True
+                    break
+                continue
 
-        while remaining_task_ids and safety_limit > 0:
             # Get meetings for this day and reduce capacity
-            day_meetings, meeting_minutes = self._get_meetings_for_day(tasks, day_cursor)
-
-            capacity_minutes_today = capacity_minutes_for_day(day_cursor)
+            day_meetings, meeting_minutes = meeting_index.for_day(day_cursor)
             capacity_remaining = max(0, capacity_minutes_today - meeting_minutes)
 
             # Pre-allocate meetings (they're fixed and take priority)
@@ -435,20 +522,22 @@ class SchedulerService:
             for meeting in day_meetings:
                 duration = int((meeting.end_time - meeting.start_time).total_seconds() / 60)
                 energy_minutes[meeting.energy_level] += duration
-            day_scores = {
-                task_id: base_scores[task_id] + self._calculate_due_bonus(task_map[task_id], day_cursor)
-                for task_id in task_map
-            }
 
-            forced_today = [
-                task_id
-                for task_id in ready + in_progress
-                if task_map[task_id].due_date
-                and task_map[task_id].due_date.date() <= day_cursor
-            ]
+            # Due bonuses change with the date. Since the last scored day, only
+            # tasks due within the bonus horizon can have a different score.
+            day_score = self._day_score_fn(inputs, day_cursor)
+            if day_cursor != state.scored_day:
+                rekey_from = state.scored_day + timedelta(days=1)
+                rekey_to = day_cursor + timedelta(days=self.DUE_BONUS_HORIZON_DAYS)
+                ready.reprioritize(day_score, rekey_from, rekey_to)
+                in_progress.reprioritize(day_score, rekey_from, rekey_to)
+                state.scored_day = day_cursor
+
+            forced_today = ready.due_by(day_cursor) + in_progress.due_by(day_cursor)
 
             if forced_today:
-                for task_id in self._sort_task_ids(forced_today, day_scores, task_map):
+                forced_scores = {task_id: day_score(task_id) for task_id in forced_today}
+                for task_id in self._sort_task_ids(forced_today, forced_scores, task_map):
                     minutes = remaining_minutes.get(task_id, 0)
                     if minutes <= 0:
                         continue
@@ -460,10 +549,8 @@ class SchedulerService:
                     remaining_minutes[task_id] = 0
                     task_end[task_id] = day_cursor
                     energy_minutes[task_map[task_id].energy_level] += minutes
-                    if task_id in in_progress:
-                        in_progress.remove(task_id)
-                    if task_id in ready:
-                        ready.remove(task_id)
+                    in_progress.discard(task_id)
+                    ready.discard(task_id)
                     remaining_task_ids.discard(task_id)
                     self._release_dependents(task_id, indegree, dependents, ready)
 
@@ -481,20 +568,25 @@ class SchedulerService:
                             available_minutes=0 if overflow_minutes > 0 else capacity_remaining,
                         )
                     )
-                    day_cursor += timedelta(days=1)
-                    safety_limit -= 1
+                    if checkpoint is not None:
+                        checkpoint.pooled = len(ready) + len(in_progress)
+                    state.day_cursor += timedelta(days=1)
+                    state.safety_limit -= 1
                     continue
 
             # Normal scheduling within remaining capacity
             while capacity_remaining > 0 and (ready or in_progress):
                 candidate_pool = in_progress if in_progress else ready
-                next_id = self._pick_next_task(candidate_pool, day_scores, task_map, energy_minutes)
+                preferred_energy = self._preferred_energy(energy_minutes)
+                next_id = candidate_pool.peek(preferred_energy)
+                if next_id is None:
+                    break
+                if checkpoint is not None:
+                    checkpoint.record_pick(candidate_pool is ready, preferred_energy, task_map[next_id], day_score)
                 minutes_left = remaining_minutes.get(next_id, 0)
                 if minutes_left <= 0:
-                    if next_id in in_progress:
-                        in_progress.remove(next_id)
-                    if next_id in ready:
-                        ready.remove(next_id)
+                    in_progress.discard(next_id)
+                    ready.discard(next_id)
                     continue
 
                 allocation = min(capacity_remaining, minutes_left)
@@ -510,16 +602,16 @@ class SchedulerService:
                 if remaining_minutes[next_id] == 0:
                     task_end[next_id] = day_cursor
                     remaining_task_ids.discard(next_id)
-                    if next_id in in_progress:
-                        in_progress.remove(next_id)
-                    if next_id in ready:
-                        ready.remove(next_id)
+                    in_progress.discard(next_id)
+                    ready.discard(next_id)
                     self._release_dependents(next_id, indegree, dependents, ready)
                 else:
-                    if next_id in ready:
-                        ready.remove(next_id)
-                    if next_id not in in_progress:
-                        in_progress.append(next_id)
+                    ready.discard(next_id)
+                    in_progress.add(next_id)
+
+            if checkpoint is not None and capacity_remaining > 0:
+                # The pools ran dry: any other available task would have been allocated
+                checkpoint.open = True
 
             days.append(
                 ScheduleDay(
@@ -532,23 +624,83 @@ class SchedulerService:
                     available_minutes=capacity_remaining,
                 )
             )
-            day_cursor += timedelta(days=1)
-            safety_limit -= 1
+            if checkpoint is not None:
+                checkpoint.pooled = len(ready) + len(in_progress)
+            state.day_cursor += timedelta(days=1)
+            state.safety_limit -= 1
 
             if not ready and not in_progress and remaining_task_ids:
-                ended_due_to_cycle = True
+                state.ended_due_to_cycle = True
                 break
 
-        if remaining_task_ids and safety_limit <= 0:
-            ended_due_to_limit = True
+        if remaining_task_ids and state.safety_limit <= 0:
+            state.ended_due_to_limit = True
+        elif checkpoints and not checkpoints[-1].open:
+            # The run stopped on its last day because no task was left to
+            # allocate; one more available task would have kept it going.
+            # Earlier checkpoints may be shared with a previous run.
+            checkpoints[-1] = replace(checkpoints[-1], open=True)
+
+    def _assemble_schedule(
+        self,
+        inputs: "_ScheduleInputs",
+        state: Optional["_SimulationState"],
+    ) -> ScheduleResponse:
+        """Build the schedule response from a finished simulation (None = nothing was schedulable)."""
+        start = inputs.start
+        project_priorities = inputs.project_priorities
+        subtask_index = inputs.subtask_index
+        candidate_tasks = inputs.candidate_tasks
+        unscheduled_reasons = dict(inputs.blocked_reasons)
+
+        if state is None:
+            tasks_info = [
+                TaskScheduleInfo(
+                    task_id=task.id,
+                    title=task.title,
+                    project_id=task.project_id,
+                    parent_id=inputs.parent_info(task)[0],
+                    parent_title=inputs.parent_info(task)[1],
+                    due_date=task.due_date,
+                    planned_start=None,
+                    planned_end=None,
+                    total_minutes=get_effective_estimated_minutes(task, subtask_index) or self.default_task_minutes,
+                    priority_score=priority_score,
+                )
+                for task, priority_score in zip(candidate_tasks, self._priority_scores(inputs, candidate_tasks, {}))
+            ]
+            unscheduled_items = [
+                UnscheduledTask(task_id=task_id, reason=unscheduled_reasons.get(task_id, "dependency_unresolved"))
+                for task_id in inputs.blocked_reasons
+            ]
+            return ScheduleResponse(
+                start_date=start,
+                days=[],
+                tasks=tasks_info,
+                unscheduled_task_ids=unscheduled_items,
+                excluded_tasks=inputs.excluded_tasks,
+            )
+
+        task_start = state.task_start
+        task_end = state.task_end
+        remaining_task_ids = state.remaining_task_ids
+        remaining_minutes = state.remaining_minutes
 
         # Collect all meeting tasks that were scheduled
-        all_meetings = [task for task in tasks if task.is_fixed_time and task.id in task_start]
+        all_meetings = [
+            task for task in inputs.all_task_map.values() if task.is_fixed_time and task.id in task_start
+        ]
 
         tasks_info: list[TaskScheduleInfo] = []
-        tasks_for_info = scheduled_tasks + [task for task in candidate_tasks if task.id in blocked_task_ids] + all_meetings
-        for task in tasks_for_info:
-            total_minutes = get_effective_estimated_minutes(task, tasks) or self.default_task_minutes
+        info_candidates = inputs.scheduled_tasks + [
+            task for task in candidate_tasks if task.id in inputs.blocked_reasons
+        ]
+        tasks_for_info = info_candidates + all_meetings
+        priority_scores = self._priority_scores(inputs, info_candidates, task_start) + [
+            self._calculate_task_score(task, project_priorities, task_start[task.id]) for task in all_meetings
+        ]
+        for task, priority_score in zip(tasks_for_info, priority_scores):
+            total_minutes = get_effective_estimated_minutes(task, subtask_index) or self.default_task_minutes
             if task.id in remaining_task_ids:
                 total_minutes = remaining_minutes.get(task.id, total_minutes)
             tasks_info.append(
@@ -556,26 +708,22 @@ class SchedulerService:
                     task_id=task.id,
                     title=task.title,
                     project_id=task.project_id,
-                    parent_id=get_parent_info(task)[0],
-                    parent_title=get_parent_info(task)[1],
+                    parent_id=inputs.parent_info(task)[0],
+                    parent_title=inputs.parent_info(task)[1],
                     due_date=task.due_date,
                     planned_start=task_start.get(task.id),
                     planned_end=task_end.get(task.id),
                     total_minutes=total_minutes,
-                    priority_score=self._calculate_task_score(
-                        task,
-                        project_priorities,
-                        task_start.get(task.id, start),
-                    ),
+                    priority_score=priority_score,
                 )
             )
 
         for task_id in remaining_task_ids:
             if task_id in unscheduled_reasons:
                 continue
-            if ended_due_to_limit:
+            if state.ended_due_to_limit:
                 unscheduled_reasons[task_id] = "max_days_exceeded"
-            elif ended_due_to_cycle:
+            elif state.ended_due_to_cycle:
                 unscheduled_reasons[task_id] = "dependency_cycle"
             else:
                 unscheduled_reasons[task_id] = "unscheduled"
@@ -586,22 +734,255 @@ class SchedulerService:
         ]
         return ScheduleResponse(
             start_date=start,
-            days=days,
+            days=list(state.days),
             tasks=tasks_info,
             unscheduled_task_ids=unscheduled_task_ids,
-            excluded_tasks=excluded_tasks,
+            excluded_tasks=inputs.excluded_tasks,
         )
 
+    def _priority_scores(
+        self,
+        inputs: "_ScheduleInputs",
+        tasks: list[Task],
+        reference_days: dict[UUID, date],
+    ) -> list[float]:
+        """Return scores of candidate tasks, with due bonuses on their reference day (default: start)."""
+        if not tasks:
+            return []
+        arrays = inputs.score_arrays
+        base_score_array = inputs.base_score_array
+        # Packed by _prepare_schedule whenever there are candidate tasks
+        assert arrays is not None and base_score_array is not None
+        count = len(tasks)
+        index = np.fromiter((arrays.position[task.id] for task in tasks), np.intp, count)
+        reference = np.fromiter(
+            (reference_days.get(task.id, inputs.start).toordinal() for task in tasks), np.int64, count
+        )
+        bonuses = np.where(
+            arrays.has_due[index],
+            self.DUE_BONUS_CURVE.bonuses(arrays.due_ordinal[index] - reference),
+            0.0,
+        )
+        scores: list[float] = (base_score_array[index] + bonuses).tolist()
+        return scores
+
+    def _resume_index(self, previous: "_RecordedRun", inputs: "_ScheduleInputs") -> Optional[int]:
+        """
+        Return the first day index a new run can differ from a previous one.
+
+        Before that day both runs make the same decisions, so the new run
+        can resume from the previous run's checkpoint there. Returns None
+        when the previous run can't be reused (different parameters, too
+        many changes).
+        """
+        old = previous.inputs
+        state = previous.state
+        if (old.start, old.horizon_days, old.capacity) != (inputs.start, inputs.horizon_days, inputs.capacity):
+            return None
+
+        start = inputs.start
+        day_count = len(previous.checkpoints)
+        # Day on which the run's end (all done, or dependency cycle) was decided
+        last_day = None if state.ended_due_to_limit else max(0, day_count - 1)
+        first = day_count
+
+        def index_of(day: Optional[date]) -> Optional[int]:
+            return None if day is None else (day - start).days
+
+        # Meetings: a changed meeting affects the days it was and is on
+        for day in old.meeting_index.days() | inputs.meeting_index.days():
+            if day >= start and _meeting_signature(old.meeting_index, day) != _meeting_signature(
+                inputs.meeting_index, day
+            ):
+                first = min(first, (day - start).days)
+
+        changed: list[UUID] = []
+        for task_id in old.task_map.keys() - inputs.task_map.keys():
+            touched = index_of(state.task_start.get(task_id))
+            first = min(first, touched if touched is not None else (last_day if last_day is not None else first))
+            first = min(first, self._first_sole_pool_day(task_id, previous, first))
+
+        for task_id, task in inputs.task_map.items():
+            old_task = old.task_map.get(task_id)
+            if old_task is None:
+                changed.append(task_id)
+                continue
+            same_key = (
+                old.base_scores[task_id] == inputs.base_scores[task_id]
+                and old_task.due_date == task.due_date
+                and old_task.created_at == task.created_at
+                and old_task.energy_level == task.energy_level
+                and old.dependencies[task_id] == inputs.dependencies[task_id]
+            )
+            if same_key and old.estimated_minutes[task_id] == inputs.estimated_minutes[task_id]:
+                continue
+            # A new estimate alone only matters once the task was started
+            touched = index_of(state.task_start.get(task_id))
+            if touched is not None:
+                first = min(first, touched)
+            if not same_key:
+                changed.append(task_id)
+            if old.dependencies[task_id] != inputs.dependencies[task_id]:
+                first = min(first, self._first_sole_pool_day(task_id, previous, first))
+
+        if len(changed) > self.INCREMENTAL_MAX_CHANGED_TASKS:
+            return None
+        for task_id in changed:
+            if first == 0:
+                break
+            possible = self._first_possible_day(task_id, previous, inputs, first, last_day)
+            if possible is not None:
+                first = min(first, possible)
+        return first
+
+    def _first_possible_day(
+        self,
+        task_id: UUID,
+        previous: "_RecordedRun",
+        inputs: "_ScheduleInputs",
+        limit: int,
+        last_day: Optional[int],
+    ) -> Optional[int]:
+        """
+        Return the first day index (below limit) a new or changed task could be allocated on.
+
+        The task can only be allocated once its dependencies are done, which
+        in the previous run happened on their end days. From then on it is
+        allocated on a day if it is due, if the pools ran dry, or if it ranks
+        before one of the day's picks from the ready queue.
+        """
+        state = previous.state
+        start = inputs.start
+        task = inputs.task_map[task_id]
+
+        available = 0
+        for dep_id in inputs.dependencies[task_id]:
+            end = state.task_end.get(dep_id) if dep_id in previous.inputs.task_map else None
+            if end is None:
+                # Not done before the runs diverge; it can still change how the run ends
+                return last_day
+            available = max(available, (end - start).days)
+
+        due = task.due_date.date() if task.due_date else None
+        base_score = inputs.base_scores[task_id]
+        energy = task.energy_level
+        for index in range(available, min(limit, len(previous.checkpoints))):
+            day = start + timedelta(days=index)
+            checkpoint = previous.checkpoints[index]
+            if (due is not None and due <= day) or checkpoint.open:
+                return index
+            key = (
+                -(base_score + self._calculate_due_bonus(task, day)),
+                task.due_date or datetime.max,
+                task.created_at,
+                task_id,
+            )
+            for from_ready, preferred_energy, winner_key, winner_energy in checkpoint.picks:
+                if not from_ready:
+                    continue
+                if preferred_energy is not None and energy == preferred_energy:
+                    if winner_energy != preferred_energy or key < winner_key:
+                        return index
+                elif preferred_energy is not None and winner_energy == preferred_energy:
+                    continue
+                elif key < winner_key:
+                    return index
+        return None
+
+    @staticmethod
+    def _first_sole_pool_day(task_id: UUID, previous: "_RecordedRun", limit: int) -> int:
+        """
+        Return the first day index (or limit) a task may have been the only one left in the pools.
+
+        Used for tasks that leave the pools in the new run (removed, or with
+        new dependencies): without them, such a day ends as a dependency cycle.
+        """
+        old = previous.inputs
+        state = previous.state
+        available = 0
+        for dep_id in old.dependencies[task_id]:
+            end = state.task_end.get(dep_id)
+            if end is None:
+                return limit
+            available = max(available, (end - old.start).days)
+        for index in range(available, min(limit, len(previous.checkpoints))):
+            if previous.checkpoints[index].pooled <= 1:
+                return index
+        return limit
+
+    def _resume_state(
+        self,
+        previous: "_RecordedRun",
+        inputs: "_ScheduleInputs",
+        index: int,
+    ) -> "_SimulationState":
+        """Rebuild the simulation state at the start of a day of a previous run, for new inputs."""
+        old_state = previous.state
+        old_checkpoints = previous.checkpoints
+        day = inputs.start + timedelta(days=index)
+        if index < len(old_checkpoints):
+            in_progress_minutes = old_checkpoints[index].in_progress
+        else:
+            in_progress_minutes = {
+                task_id: old_state.remaining_minutes[task_id]
+                for task_id in old_state.task_start
+                if task_id not in old_state.task_end
+            }
+
+        task_start = {task_id: value for task_id, value in old_state.task_start.items() if value < day}
+        task_end = {task_id: value for task_id, value in old_state.task_end.items() if value < day}
+        completed = task_end.keys() & inputs.task_map.keys()
+
+        remaining_minutes = dict(inputs.estimated_minutes)
+        for task_id in completed:
+            remaining_minutes[task_id] = 0
+        remaining_minutes.update(in_progress_minutes)
+
+        day_score = self._day_score_fn(inputs, day)
+        state = _SimulationState(
+            remaining_minutes=remaining_minutes,
+            indegree={
+                task_id: sum(1 for dep_id in deps if dep_id not in completed)
+                for task_id, deps in inputs.dependencies.items()
+            },
+            ready=_ReadyQueue(inputs.task_map, day_score),
+            in_progress=_ReadyQueue(inputs.task_map, day_score),
+            scored_day=day,
+            day_cursor=day,
+            safety_limit=inputs.horizon_days - index,
+            remaining_task_ids=inputs.task_map.keys() - completed,
+            task_start=task_start,
+            task_end=task_end,
+            days=old_state.days[:index],
+            checkpoints=old_checkpoints[:index],
+        )
+        if index >= len(old_checkpoints):
+            # Nothing changed within the previous run: it ends the same way
+            state.ended_due_to_cycle = old_state.ended_due_to_cycle
+            state.ended_due_to_limit = old_state.ended_due_to_limit
+            if state.ended_due_to_cycle or not state.remaining_task_ids or state.safety_limit <= 0:
+                return state
+
+        for task_id in in_progress_minutes:
+            state.in_progress.add(task_id)
+        for task_id, degree in state.indegree.items():
+            if degree == 0 and task_id not in completed and task_id not in in_progress_minutes:
+                state.ready.add(task_id)
+        return state
+
     def get_today_tasks(
         self,
         schedule: ScheduleResponse,
         tasks: list[Task],
         project_priorities: dict[UUID, int] | None = None,
         today: Optional[date] = None,
+        subtask_index: Optional[SubtaskIndex] = None,
     ) -> TodayTasksResponse:
         """Extract today's tasks and top3 from schedule."""
         today_date = today or date.today()
         task_map = {task.id: task for task in tasks}
+        if subtask_index is None:
+            subtask_index = SubtaskIndex(tasks)
         project_priorities = project_priorities or {}
 
         today_day = next((day for day in schedule.days if day.date == today_date), None)
@@ -631,7 +1012,7 @@ class SchedulerService:
             task = task_map.get(task_id)
             if not task:
                 continue
-            total_minutes = get_effective_estimated_minutes(task, tasks)
+            total_minutes = get_effective_estimated_minutes(task, subtask_index)
             if total_minutes <= 0:
                 total_minutes = self.default_task_minutes
             allocated_for_day = allocation_minutes_by_task.get(task_id, 0)
@@ -645,20 +1026,13 @@ class SchedulerService:
                 )
             )
         # Calculate scores for all today's tasks
-        task_scores = {
-            task.id: self._calculate_task_score(task, project_priorities, today_date)
-            for task in today_tasks
-        }
+        score_arrays = TaskScoreArrays(today_tasks, project_priorities)
+        task_scores = score_arrays.scheduler_base_scores(self.project_priority_weight) + score_arrays.due_bonus(
+            today_date, self.DUE_BONUS_CURVE
+        )
 
         # Sort by score (descending), then by due date, then by creation time
-        today_tasks_sorted = sorted(
-            today_tasks,
-            key=lambda t: (
-                -task_scores[t.id],
-                t.due_date or datetime.max,
-                t.created_at
-            )
-        )
+        today_tasks_sorted = [today_tasks[index] for index in score_arrays.rank(task_scores)]
 
         # Top 3 are now the most important tasks based on score
         top3_ids = [task.id for task in today_tasks_sorted[:3]]
@@ -686,20 +1060,9 @@ class SchedulerService:
 
     def _calculate_base_score(self, task: Task, project_priorities: dict[UUID, int]) -> float:
         """Calculate stable base score for a task (no due-date contribution)."""
-        importance_weights = {
-            Priority.HIGH: 3.0,
-            Priority.MEDIUM: 2.0,
-            Priority.LOW: 1.0,
-        }
-        urgency_weights = {
-            Priority.HIGH: 3.0,
-            Priority.MEDIUM: 2.0,
-            Priority.LOW: 1.0,
-        }
-
         score = 0.0
-        score += importance_weights.get(task.importance, 1.0) * 10
-        score += urgency_weights.get(task.urgency, 1.0) * 8
+        score += PRIORITY_WEIGHTS.get(task.importance, 1.0) * IMPORTANCE_POINTS
+        score += PRIORITY_WEIGHTS.get(task.urgency, 1.0) * URGENCY_POINTS
 
         if task.status == TaskStatus.IN_PROGRESS:
             score += 2
@@ -719,18 +1082,8 @@ class SchedulerService:
         if not task.due_date:
             return 0.0
 
-        due_date = task.due_date.date()
-        days_until = (due_date - reference_date).days
-        max_bonus = 30.0
-        horizon_days = 14
-
-        if days_until <= 0:
-            return max_bonus
-        if days_until >= horizon_days:
-            return 0.0
-
-        step = max_bonus / horizon_days
-        return max(0.0, max_bonus - (days_until * step))
+        days_until = (task.due_date.date() - reference_date).days
+        return SchedulerService.DUE_BONUS_CURVE.bonus(days_until)
 
     @staticmethod
     def _sort_task_ids(
@@ -744,49 +1097,292 @@ class SchedulerService:
                 -scores.get(task_id, 0.0),
                 task_map[task_id].due_date or datetime.max,
                 task_map[task_id].created_at,
+                task_id,
             ),
         )
 
-    def _pick_next_task(
-        self,
-        task_ids: list[UUID],
-        scores: dict[UUID, float],
-        task_map: dict[UUID, Task],
-        energy_minutes: dict[EnergyLevel, int],
-    ) -> UUID:
-        if not task_ids:
-            raise ValueError("No task IDs available for scheduling")
-
+    def _preferred_energy(self, energy_minutes: dict[EnergyLevel, int]) -> Optional[EnergyLevel]:
+        """Return the energy level to favor next, based on the day's balance so far."""
         total_minutes = energy_minutes[EnergyLevel.HIGH] + energy_minutes[EnergyLevel.LOW]
-        preferred_energy: Optional[EnergyLevel] = None
-
-        if total_minutes > 0:
-            high_ratio = energy_minutes[EnergyLevel.HIGH] / total_minutes
-            low_ratio = energy_minutes[EnergyLevel.LOW] / total_minutes
-            if high_ratio > self.energy_high_ratio:
-                preferred_energy = EnergyLevel.LOW
-            elif low_ratio > self.energy_low_ratio:
-                preferred_energy = EnergyLevel.HIGH
-
-        if preferred_energy:
-            preferred_ids = [
-                task_id
-                for task_id in task_ids
-                if task_map[task_id].energy_level == preferred_energy
-            ]
-            if preferred_ids:
-                task_ids = preferred_ids
+        if total_minutes <= 0:
+            return None
 
-        return self._sort_task_ids(task_ids, scores, task_map)[0]
+        high_ratio = energy_minutes[EnergyLevel.HIGH] / total_minutes
+        low_ratio = energy_minutes[EnergyLevel.LOW] / total_minutes
+        if high_ratio > self.energy_high_ratio:
+            return EnergyLevel.LOW
+        if low_ratio > self.energy_low_ratio:
+            return EnergyLevel.HIGH
+        return None
 
     @staticmethod
     def _release_dependents(
         task_id: UUID,
         indegree: dict[UUID, int],
         dependents: dict[UUID, list[UUID]],
-        ready: list[UUID],
+        ready: "_ReadyQueue",
     ) -> None:
         for dependent_id in dependents.get(task_id, []):
             indegree[dependent_id] -= 1
-            if indegree[dependent_id] <= 0 and dependent_id not in ready:
-                ready.append(dependent_id)
+            if indegree[dependent_id] <= 0:
+                ready.add(dependent_id)
+
+
+# (-score, due date or datetime.max, creation time, task ID)
+_QueueKey = tuple[float, datetime, datetime, UUID]
+# Queue key followed by the sequence number of the entry
+_HeapEntry = tuple[float, datetime, datetime, UUID, int]
+
+
+class _ReadyQueue:
+    """
+    Schedulable task IDs kept in one priority queue per energy level.
+
+    Entries are ordered like SchedulerService._sort_task_ids (score desc,
+    due date, creation time, task ID), so picking the best task is O(log n) amortized
+    instead of a sort of the whole pool. Removal is lazy: discarded entries
+    are dropped when they reach the top of a heap.
+
+    Only the due-date bonus of a score changes from day to day, so dated
+    tasks are also bucketed by due date and reprioritize() re-keys just the
+    buckets in a given due-date window; undated tasks keep their entry.
+    A heap keyed by due date answers due_by() without a full scan.
+    """
+
+    def __init__(self, task_map: dict[UUID, Task], score: Callable[[UUID], float]):
+        self._task_map = task_map
+        self._heaps: dict[EnergyLevel, list[_HeapEntry]] = {level: [] for level in EnergyLevel}
+        # task_id -> (sequence number of its live heap entry, score)
+        self._live: dict[UUID, tuple[int, float]] = {}
+        self._by_due_date: dict[date, set[UUID]] = {}
+        self._due_heap: list[tuple[date, int, UUID]] = []
+        self._overdue: dict[UUID, None] = {}
+        self._sequence = count()
+        self._score = score
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def task_ids(self) -> list[UUID]:
+        """Return the queued task IDs."""
+        return list(self._live)
+
+    def _push(self, task_id: UUID, score: float) -> None:
+        task = self._task_map[task_id]
+        sequence = next(self._sequence)
+        self._live[task_id] = (sequence, score)
+        heapq.heappush(
+            self._heaps[task.energy_level],
+            (-score, task.due_date or datetime.max, task.created_at, task_id, sequence),
+        )
+
+    def add(self, task_id: UUID) -> None:
+        """Add a task (no-op if already queued)."""
+        if task_id in self._live:
+            return
+        self._push(task_id, self._score(task_id))
+        due_date = self._task_map[task_id].due_date
+        if due_date:
+            self._by_due_date.setdefault(due_date.date(), set()).add(task_id)
+            heapq.heappush(self._due_heap, (due_date.date(), self._live[task_id][0], task_id))
+
+    def discard(self, task_id: UUID) -> None:
+        """Remove a task if queued."""
+        if self._live.pop(task_id, None) is None:
+            return
+        due_date = self._task_map[task_id].due_date
+        if due_date:
+            self._by_due_date[due_date.date()].discard(task_id)
+        self._overdue.pop(task_id, None)
+
+    def reprioritize(
+        self,
+        score: Callable[[UUID], float],
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+    ) -> None:
+        """
+        Switch to a new score function (e.g. for the next day).
+
+        Args:
+            score: Score of a task ID; may only differ from the previous
+                function for tasks due within [due_from, due_to]
+            due_from: First due date to re-key (None = all dated tasks)
+            due_to: Last due date to re-key (inclusive)
+        """
+        self._score = score
+        if due_from is None or due_to is None:
+            buckets = list(self._by_due_date.values())
+        else:
+            buckets = [
+                self._by_due_date.get(due_from + timedelta(days=offset), set())
+                for offset in range((due_to - due_from).days + 1)
+            ]
+        for bucket in buckets:
+            for task_id in bucket:
+                new_score = score(task_id)
+                if new_score != self._live[task_id][1]:
+                    self._push(task_id, new_score)
+
+    def due_by(self, day: date) -> list[UUID]:
+        """Return queued tasks due on or before a day."""
+        while self._due_heap and self._due_heap[0][0] <= day:
+            _, _, task_id = heapq.heappop(self._due_heap)
+            if task_id in self._live:
+                self._overdue[task_id] = None
+        return list(self._overdue)
+
+    def _top(self, level: EnergyLevel) -> Optional[_HeapEntry]:
+        heap = self._heaps[level]
+        while heap:
+            entry = heap[0]
+            live = self._live.get(entry[3])
+            if live is not None and live[0] == entry[4]:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def peek(self, preferred_energy: Optional[EnergyLevel] = None) -> Optional[UUID]:
+        """
+        Return the best queued task without removing it.
+
+        Args:
+            preferred_energy: Prefer tasks of this energy level when any are queued
+
+        Returns:
+            Task ID, or None if the queue is empty
+        """
+        if preferred_energy is not None:
+            entry = self._top(preferred_energy)
+            if entry is not None:
+                return entry[3]
+        tops = [entry for entry in map(self._top, self._heaps) if entry is not None]
+        return min(tops)[3] if tops else None
+
+
+@dataclass
+class _ScheduleInputs:
+    """Static inputs of a schedule simulation, derived once from the task set."""
+
+    start: date
+    horizon_days: int
+    # (daily capacity hours, capacity hours per weekday Sun..Sat or None)
+    capacity: tuple[float, Optional[tuple[float, ...]]]
+    project_priorities: dict[UUID, int]
+    all_task_map: dict[UUID, Task]
+    subtask_index: SubtaskIndex
+    meeting_index: MeetingIndex
+    excluded_tasks: list[ExcludedTask] = field(default_factory=list)
+    candidate_tasks: list[Task] = field(default_factory=list)
+    blocked_reasons: dict[UUID, str] = field(default_factory=dict)
+    scheduled_tasks: list[Task] = field(default_factory=list)
+    task_map: dict[UUID, Task] = field(default_factory=dict)
+    base_scores: dict[UUID, float] = field(default_factory=dict)
+    # Candidate tasks packed for vectorized scoring, and their base scores
+    score_arrays: Optional[TaskScoreArrays] = None
+    base_score_array: Optional[np.ndarray] = None
+    # Due day ordinals of dated scheduled tasks
+    due_ordinals: dict[UUID, int] = field(default_factory=dict)
+    estimated_minutes: dict[UUID, int] = field(default_factory=dict)
+    # Dependencies / dependents among scheduled tasks
+    dependencies: dict[UUID, list[UUID]] = field(default_factory=dict)
+    dependents: dict[UUID, list[UUID]] = field(default_factory=dict)
+
+    def capacity_minutes_for_day(self, day: date) -> int:
+        hours, by_weekday = self.capacity
+        if by_weekday:
+            hours = by_weekday[(day.weekday() + 1) % 7]
+        return max(0, int(hours * 60))
+
+    def parent_info(self, task: Task) -> tuple[Optional[UUID], Optional[str]]:
+        if not task.parent_id:
+            return None, None
+        parent = self.all_task_map.get(task.parent_id)
+        return task.parent_id, parent.title if parent else None
+
+
+@dataclass
+class _DayCheckpoint:
+    """What a simulated day started from and decided."""
+
+    # Started, unfinished tasks -> remaining minutes at the start of the day
+    in_progress: dict[UUID, int]
+    # (picked from the ready queue, preferred energy, winner's queue key, winner's energy)
+    picks: list[tuple[bool, Optional[EnergyLevel], _QueueKey, EnergyLevel]] = field(default_factory=list)
+    # Capacity was left over, or the run ended here: any available task would have been allocated
+    open: bool = False
+    # Tasks left in the ready/in-progress pools at the end of the day; with
+    # none left the run ends as a dependency cycle
+    pooled: int = 0
+
+    def record_pick(
+        self,
+        from_ready: bool,
+        preferred_energy: Optional[EnergyLevel],
+        task: Task,
+        score: Callable[[UUID], float],
+    ) -> None:
+        key: _QueueKey = (-score(task.id), task.due_date or datetime.max, task.created_at, task.id)
+        self.picks.append((from_ready, preferred_energy, key, task.energy_level))
+
+
+@dataclass
+class _SimulationState:
+    """Mutable state of a schedule simulation between days."""
+
+    remaining_minutes: dict[UUID, int]
+    indegree: dict[UUID, int]
+    ready: _ReadyQueue
+    in_progress: _ReadyQueue
+    scored_day: date
+    day_cursor: date
+    safety_limit: int
+    remaining_task_ids: set[UUID]
+    task_start: dict[UUID, date] = field(default_factory=dict)
+    task_end: dict[UUID, date] = field(default_factory=dict)
+    days: list[ScheduleDay] = field(default_factory=list)
+    # One per simulated day (None = not recorded)
+    checkpoints: Optional[list[_DayCheckpoint]] = None
+    ended_due_to_limit: bool = False
+    ended_due_to_cycle: bool = False
+
+
+@dataclass
+class ScheduleRun:
+    """
+    A built schedule with the simulation state needed to update it.
+
+    Returned by SchedulerService.build_schedule_run; pass it back as
+    ``previous`` after the tasks change. Runs are not modified by later
+    updates, so one run can be the base of several of them.
+    """
+
+    response: ScheduleResponse
+    inputs: _ScheduleInputs
+    state: Optional[_SimulationState]
+    # Day index the simulation resumed from (None = full build)
+    resumed_day: Optional[int] = None
+
+    def recorded(self) -> Optional["_RecordedRun"]:
+        """Return the run with its checkpoints, or None if they were not recorded."""
+        if self.state is None or self.state.checkpoints is None:
+            return None
+        return _RecordedRun(inputs=self.inputs, state=self.state, checkpoints=self.state.checkpoints)
+
+
+@dataclass
+class _RecordedRun:
+    """A previous run whose per-day checkpoints can be resumed from."""
+
+    inputs: _ScheduleInputs
+    state: _SimulationState
+    checkpoints: list[_DayCheckpoint]
+
+
+def _meeting_signature(
+    index: MeetingIndex, day: date
+) -> list[tuple[UUID, Optional[datetime], Optional[datetime], EnergyLevel]]:
+    return [
+        (meeting.id, meeting.start_time, meeting.end_time, meeting.energy_level)
+        for meeting in index.meetings_on(day)
+    ]
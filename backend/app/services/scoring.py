@@ -0,0 +1,226 @@
+"""
+Vectorized task scoring.
+
+SchedulerService and Top3Service score tasks from the same fields:
+importance, urgency, energy level, status, due date and project priority.
+TaskScoreArrays packs these fields of a task list into NumPy arrays once,
+so base scores and due-date bonuses for all tasks (and for all days of a
+horizon) are array operations instead of per-task Python calls.
+
+A due-date bonus only depends on the days left until the due date,
+clipped to a small range, so each scoring scheme is a DueBonusCurve lookup
+table. Scalar helpers for single tasks read the same tables and add terms
+in the same order, so scalar and vectorized scores are bit-identical.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Mapping, Optional, Sequence, Union
+from uuid import UUID
+
+import numpy as np
+
+from app.models.enums import EnergyLevel, Priority, TaskStatus
+from app.models.task import Task
+
+PRIORITY_WEIGHTS: dict[Priority, float] = {
+    Priority.HIGH: 3.0,
+    Priority.MEDIUM: 2.0,
+    Priority.LOW: 1.0,
+}
+IMPORTANCE_POINTS = 10
+URGENCY_POINTS = 8
+DEFAULT_PROJECT_PRIORITY = 5
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class DueBonusCurve:
+    """
+    Due-date bonus by days until the due date.
+
+    values[i] is the bonus for ``first_day + i`` days left; days before
+    first_day get values[0] and days after the last entry get values[-1].
+    """
+
+    first_day: int
+    values: tuple[float, ...]
+
+    def bonus(self, days_until: int) -> float:
+        """Return the bonus for one task."""
+        index = min(max(days_until - self.first_day, 0), len(self.values) - 1)
+        return self.values[index]
+
+    def bonuses(self, days_until: np.ndarray) -> np.ndarray:
+        """Return the bonuses for an array of days-until values (any shape)."""
+        index = np.clip(days_until - self.first_day, 0, len(self.values) - 1)
+        return np.asarray(self.values, dtype=np.float64)[index]
+
+
+def ramp_due_bonus_curve(max_bonus: float, horizon_days: int) -> DueBonusCurve:
+    """
+    Build a bonus that ramps linearly up to max_bonus over the last horizon_days.
+
+    Due today or overdue gets max_bonus; horizon_days or more days left get 0.
+    """
+    step = max_bonus / horizon_days
+    ramp = [max(0.0, max_bonus - (days * step)) for days in range(1, horizon_days)]
+    return DueBonusCurve(first_day=0, values=(max_bonus, *ramp, 0.0))
+
+
+# Top 3 scoring: overdue +30, today +25, tomorrow +20, this week +10,
+# within two weeks +5
+TOP3_DUE_CURVE = DueBonusCurve(
+    first_day=-1,
+    values=(30.0, 25.0, 20.0, *([10.0] * 6), *([5.0] * 7), 0.0),
+)
+
+
+def _seconds(value: datetime) -> float:
+    # Sort key with datetime ordering (naive and aware values are never mixed)
+    if value.tzinfo is None:
+        return (value - _EPOCH).total_seconds()
+    return (value - _EPOCH_UTC).total_seconds()
+
+
+class TaskScoreArrays:
+    """
+    Struct-of-arrays view of a task list for vectorized scoring.
+
+    Arrays are indexed like the task list given to the constructor; use
+    ``position`` to map a task ID to its index.
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[Task],
+        project_priorities: Optional[Mapping[UUID, int]] = None,
+    ):
+        """
+        Pack the scoring fields of tasks.
+
+        Args:
+            tasks: Tasks to score
+            project_priorities: Project ID -> priority (missing = default 5)
+        """
+        project_priorities = project_priorities or {}
+        self._tasks = tasks
+        self.task_ids: list[UUID] = [task.id for task in tasks]
+        self.position: dict[UUID, int] = {task_id: index for index, task_id in enumerate(self.task_ids)}
+
+        # One pass over the tasks; columns are split off the packed matrix
+        weights = PRIORITY_WEIGHTS
+        low, in_progress = EnergyLevel.LOW, TaskStatus.IN_PROGRESS
+        rows = [
+            (
+                weights.get(task.importance, 1.0),
+                weights.get(task.urgency, 1.0),
+                task.energy_level == low,
+                task.status == in_progress,
+                project_priorities.get(task.project_id, DEFAULT_PROJECT_PRIORITY)
+                if task.project_id
+                else DEFAULT_PROJECT_PRIORITY,
+                task.due_date.toordinal() if task.due_date else 0,
+            )
+            for task in tasks
+        ]
+        packed = np.array(rows, dtype=np.float64).reshape(len(rows), 6)
+        self.importance = packed[:, 0]
+        self.urgency = packed[:, 1]
+        self.low_energy = packed[:, 2] != 0
+        self.in_progress = packed[:, 3] != 0
+        self.project_priority = packed[:, 4]
+        # Proleptic Gregorian ordinal of the due day (0 = no due date)
+        self.due_ordinal = packed[:, 5].astype(np.int64)
+        self.has_due = self.due_ordinal != 0
+        self._due_at: Optional[np.ndarray] = None
+        self._created_at: Optional[np.ndarray] = None
+
+    @property
+    def due_at(self) -> np.ndarray:
+        """Due dates as seconds since the epoch, for tie-breaking (inf = no due date)."""
+        if self._due_at is None:
+            self._due_at = np.fromiter(
+                (_seconds(task.due_date) if task.due_date else np.inf for task in self._tasks),
+                np.float64,
+                len(self._tasks),
+            )
+        return self._due_at
+
+    @property
+    def created_at(self) -> np.ndarray:
+        """Creation times as seconds since the epoch."""
+        if self._created_at is None:
+            self._created_at = np.fromiter(
+                (_seconds(task.created_at) for task in self._tasks), np.float64, len(self._tasks)
+            )
+        return self._created_at
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def days_until(self, days: Union[date, Sequence[date]]) -> np.ndarray:
+        """
+        Return days left until each task's due date.
+
+        Args:
+            days: Reference day, or a sequence of days
+
+        Returns:
+            (tasks,) array for one day, (days, tasks) matrix for a sequence;
+            entries of tasks without a due date are meaningless (see has_due)
+        """
+        if isinstance(days, date):
+            return self.due_ordinal - days.toordinal()
+        ordinals = np.fromiter((day.toordinal() for day in days), np.int64, len(days))
+        return self.due_ordinal[np.newaxis, :] - ordinals[:, np.newaxis]
+
+    def due_bonus(self, days: Union[date, Sequence[date]], curve: DueBonusCurve) -> np.ndarray:
+        """
+        Return due-date bonuses, 0 for tasks without a due date.
+
+        Args:
+            days: Reference day, or a sequence of days (e.g. a schedule horizon)
+            curve: Bonus curve
+
+        Returns:
+            (tasks,) array for one day, (days, tasks) matrix for a sequence
+        """
+        return np.where(self.has_due, curve.bonuses(self.days_until(days)), 0.0)
+
+    def scheduler_base_scores(
+        self,
+        project_priority_weight: float,
+        in_progress_bonus: float = 2.0,
+        low_energy_bonus: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Return SchedulerService base scores (no due-date contribution).
+
+        (importance * 10 + urgency * 8 + in-progress/low-energy bonuses)
+        scaled by (1 + project priority * project_priority_weight).
+        """
+        scores = self.importance * IMPORTANCE_POINTS + self.urgency * URGENCY_POINTS
+        scores += np.where(self.in_progress, in_progress_bonus, 0.0)
+        scores += np.where(self.low_energy, low_energy_bonus, 0.0)
+        scores *= 1 + self.project_priority * project_priority_weight
+        return scores
+
+    def top3_scores(self, today: date, low_energy_bonus: float = 2.0) -> np.ndarray:
+        """Return Top3Service scores on a day (importance, urgency, due date, low-energy bonus)."""
+        scores = self.importance * IMPORTANCE_POINTS + self.urgency * URGENCY_POINTS
+        scores += self.due_bonus(today, TOP3_DUE_CURVE)
+        scores += np.where(self.low_energy, low_energy_bonus, 0.0)
+        return scores
+
+    def rank(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Return task indexes ordered by score (desc), due date, then creation time.
+
+        Ties beyond that keep the task list order.
+        """
+        return np.lexsort((self.created_at, self.due_at, -scores))
@@ -0,0 +1,72 @@
+"""
+Text chunk coalescing for chat streaming.
+
+Merges consecutive text deltas so each SSE event carries more than a token.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, AsyncIterator, Callable
+
+StreamChunk = dict[str, Any]
+
+DEFAULT_FLUSH_MS = 40
+DEFAULT_FLUSH_CHARS = 64
+
+
+async def coalesce_text_chunks(
+    chunks: AsyncIterator[StreamChunk],
+    flush_ms: float = DEFAULT_FLUSH_MS,
+    flush_chars: int = DEFAULT_FLUSH_CHARS,
+    clock: Callable[[], float] = time.monotonic,
+) -> AsyncIterator[StreamChunk]:
+    """
+    Merge consecutive text chunks of a chat stream.
+
+    Any other chunk flushes the buffered text first, so event order is
+    preserved. The time limit is checked as chunks arrive.
+
+    Args:
+        chunks: Stream chunks ({"chunk_type": ..., ...})
+        flush_ms: Maximum time text is buffered (0 = no time limit)
+        flush_chars: Buffered characters that trigger a flush (<= 1 = no coalescing)
+        clock: Monotonic clock in seconds
+
+    Yields:
+        Chunks, with runs of text chunks merged
+    """
+    if flush_chars <= 1:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    buffer: list[str] = []
+    size = 0
+    started_at = 0.0
+
+    async for chunk in chunks:
+        if chunk.get("chunk_type") == "text":
+            content = chunk.get("content") or ""
+            if not content:
+                continue
+            if not buffer:
+                started_at = clock()
+            buffer.append(content)
+            size += len(content)
+            if size >= flush_chars or (
+                flush_ms > 0 and (clock() - started_at) * 1000 >= flush_ms
+            ):
+                yield {"chunk_type": "text", "content": "".join(buffer)}
+                buffer.clear()
+                size = 0
+            continue
+
+        if buffer:
+            yield {"chunk_type": "text", "content": "".join(buffer)}
+            buffer.clear()
+            size = 0
+        yield chunk
+
+    if buffer:
+        yield {"chunk_type": "text", "content": "".join(buffer)}
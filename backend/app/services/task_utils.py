@@ -4,12 +4,161 @@ Task utility functions.
 Helper functions for task calculations and processing.
 """
 
-from typing import Iterable
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date
+from typing import Iterable, Union
+from uuid import UUID
 
 from app.models.task import Task
 
 
-def get_effective_estimated_minutes(task: Task, all_tasks: Iterable[Task]) -> int:
+class SubtaskIndex:
+    """
+    Parent → children index over a task set.
+
+    Build it once per task set and pass it to get_effective_estimated_minutes
+    and is_parent_task instead of the task list: each lookup is then O(1)
+    rather than a scan of all tasks.
+    """
+
+    __slots__ = ("_children",)
+
+    def __init__(self, tasks: Iterable[Task]):
+        """
+        Build the index.
+
+        Args:
+            tasks: All tasks of the set (subtasks are found by parent_id)
+        """
+        self._children: dict[UUID, list[Task]] = {}
+        for task in tasks:
+            if task.parent_id is not None:
+                self._children.setdefault(task.parent_id, []).append(task)
+
+    def children(self, task_id: UUID) -> list[Task]:
+        """Return the direct subtasks of a task (empty if none)."""
+        return self._children.get(task_id, [])
+
+    def has_children(self, task_id: UUID) -> bool:
+        """Return True if the task has at least one subtask."""
+        return task_id in self._children
+
+
+class MeetingIndex:
+    """
+    Fixed-time meetings of a task set, sorted by start and bucketed by date.
+
+    Build it once per task set: a day lookup is then O(1) (O(log n + k) for
+    a date range) instead of a scan of all tasks per day. Merged busy
+    minutes are computed once per day and cached.
+    """
+
+    __slots__ = ("_dates", "_by_date", "_busy")
+
+    def __init__(self, tasks: Iterable[Task]):
+        """
+        Build the index.
+
+        Args:
+            tasks: All tasks of the set (meetings are fixed-time tasks with a start)
+        """
+        meetings = sorted(
+            (task for task in tasks if task.is_fixed_time and task.start_time),
+            key=lambda task: (task.start_time.date(), _minute_of_day(task.start_time)),
+        )
+        self._by_date: dict[date, list[Task]] = {}
+        for meeting in meetings:
+            self._by_date.setdefault(meeting.start_time.date(), []).append(meeting)
+        self._dates: list[date] = list(self._by_date)
+        self._busy: dict[date, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(meetings) for meetings in self._by_date.values())
+
+    def days(self) -> set[date]:
+        """Return the days with at least one meeting."""
+        return set(self._dates)
+
+    def meetings_on(self, day: date) -> list[Task]:
+        """Return the meetings starting on a day, ordered by start time."""
+        return self._by_date.get(day, [])
+
+    def busy_minutes(self, day: date) -> int:
+        """
+        Return the minutes a day is blocked by meetings.
+
+        Overlapping meetings are merged so shared time is counted once.
+        """
+        if day not in self._busy:
+            self._busy[day] = _merged_minutes(self.meetings_on(day))
+        return self._busy[day]
+
+    def for_day(self, day: date) -> tuple[list[Task], int]:
+        """Return (meetings, merged busy minutes) for a day."""
+        return self.meetings_on(day), self.busy_minutes(day)
+
+    def between(self, start: date, end: date) -> list[Task]:
+        """
+        Return meetings in a date range (e.g. a week view).
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (exclusive)
+
+        Returns:
+            Meetings ordered by start time
+        """
+        meetings: list[Task] = []
+        for day in self._dates[bisect_left(self._dates, start):bisect_left(self._dates, end)]:
+            meetings.extend(self._by_date[day])
+        return meetings
+
+    def busy_minutes_between(self, start: date, end: date) -> dict[date, int]:
+        """Return merged busy minutes for each day with meetings in [start, end)."""
+        return {
+            day: self.busy_minutes(day)
+            for day in self._dates[bisect_left(self._dates, start):bisect_left(self._dates, end)]
+        }
+
+
+def _minute_of_day(value) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _merged_minutes(meetings: Iterable[Task]) -> int:
+    # (start, end) in minutes from midnight
+    intervals = []
+    for meeting in meetings:
+        if meeting.end_time and meeting.start_time:
+            start_mins = _minute_of_day(meeting.start_time)
+            end_mins = _minute_of_day(meeting.end_time)
+            # Meetings that span midnight are capped at end of day
+            if end_mins < start_mins:
+                end_mins = 24 * 60
+            intervals.append((start_mins, end_mins))
+    intervals.sort()
+
+    merged: list[tuple[int, int]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return sum(end - start for start, end in merged)
+
+
+TaskSet = Union[SubtaskIndex, Iterable[Task]]
+
+
+def _as_index(all_tasks: TaskSet) -> SubtaskIndex:
+    if isinstance(all_tasks, SubtaskIndex):
+        return all_tasks
+    return SubtaskIndex(all_tasks)
+
+
+def get_effective_estimated_minutes(task: Task, all_tasks: TaskSet) -> int:
     """
     Get the effective estimated minutes for a task.
 
@@ -18,13 +167,13 @@ def get_effective_estimated_minutes(task: Task, all_tasks: Iterable[Task]) -> in
 
     Args:
         task: The task to get the estimate for
-        all_tasks: All tasks (needed to find subtasks)
+        all_tasks: All tasks (needed to find subtasks), or a prebuilt
+            SubtaskIndex over them
 
     Returns:
         Effective estimated minutes (0 if no estimate available)
     """
-    # Find all subtasks of this task
-    subtasks = [t for t in all_tasks if t.parent_id == task.id]
+    subtasks = _as_index(all_tasks).children(task.id)
 
     if subtasks:
         # If has subtasks: return sum of subtask estimates
@@ -34,15 +183,18 @@ def get_effective_estimated_minutes(task: Task, all_tasks: Iterable[Task]) -> in
         return task.estimated_minutes or 0
 
 
-def is_parent_task(task: Task, all_tasks: Iterable[Task]) -> bool:
+def is_parent_task(task: Task, all_tasks: TaskSet) -> bool:
     """
     Check if a task is a parent task (has subtasks).
 
     Args:
         task: The task to check
-        all_tasks: All tasks (needed to find subtasks)
+        all_tasks: All tasks (needed to find subtasks), or a prebuilt
+            SubtaskIndex over them
 
     Returns:
         True if the task has at least one subtask
     """
+    if isinstance(all_tasks, SubtaskIndex):
+        return all_tasks.has_children(task.id)
     return any(t.parent_id == task.id for t in all_tasks)
@@ -0,0 +1,153 @@
+"""
+Precomputed today plans.
+
+Nightly job storing each user's today view, served while the user's data is unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+
+from app.core.logger import setup_logger
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.task_repository import ITaskRepository
+from app.interfaces.today_plan_repository import ITodayPlanRepository
+from app.models.schedule import TodayTasksResponse
+from app.models.task import Task
+from app.services.schedule_inputs import load_all_tasks, load_project_priorities
+from app.services.scheduler_service import SchedulerService
+
+logger = setup_logger(__name__)
+
+# Horizon of the today views (/api/tasks/today and /api/today/top3 defaults)
+TODAY_PLAN_MAX_DAYS = 30
+
+
+def compute_today_plan(
+    scheduler_service: SchedulerService,
+    tasks: list[Task],
+    project_priorities: dict[UUID, int],
+    plan_date: date,
+    max_days: int = TODAY_PLAN_MAX_DAYS,
+) -> TodayTasksResponse:
+    """
+    Build a user's today view with default capacity.
+
+    Module-level so it can run on worker processes.
+
+    Args:
+        scheduler_service: Scheduler
+        tasks: All of the user's tasks
+        project_priorities: Project ID -> priority
+        plan_date: Day of the plan
+        max_days: Schedule horizon
+
+    Returns:
+        Today view (allocations, Top 3, capacity)
+    """
+    schedule = scheduler_service.build_schedule(
+        tasks,
+        project_priorities=project_priorities,
+        start_date=plan_date,
+        max_days=max_days,
+        until=plan_date,
+    )
+    return scheduler_service.get_today_tasks(
+        schedule,
+        tasks,
+        project_priorities=project_priorities,
+        today=plan_date,
+    )
+
+
+class TodayPlanService:
+    """
+    Precomputes and serves per-user today plans.
+
+    Plans are tagged with the user's data version, read before their inputs
+    are loaded; any later task or project write makes them stale.
+    """
+
+    def __init__(
+        self,
+        plan_repo: ITodayPlanRepository,
+        task_repo: ITaskRepository,
+        project_repo: IProjectRepository,
+        compute: ComputeExecutor,
+        scheduler_service: Optional[SchedulerService] = None,
+    ):
+        self.plan_repo = plan_repo
+        self.task_repo = task_repo
+        self.project_repo = project_repo
+        self.compute = compute
+        self.scheduler_service = scheduler_service or SchedulerService()
+
+    async def precompute_user(self, user_id: str, plan_date: date) -> TodayTasksResponse:
+        """
+        Compute and store one user's plan.
+
+        Args:
+            user_id: Owner user ID
+            plan_date: Day of the plan
+
+        Returns:
+            Stored plan
+        """
+        # Read the version first: a write while loading makes the plan stale
+        data_version = await self.plan_repo.get_data_version(user_id)
+        tasks = await load_all_tasks(self.task_repo, user_id)
+        project_priorities = await load_project_priorities(self.project_repo, user_id)
+
+        plan = await self.compute.run(
+            compute_today_plan, self.scheduler_service, tasks, project_priorities, plan_date
+        )
+        await self.plan_repo.save(user_id, plan_date, data_version, plan)
+        return plan
+
+    async def precompute_all(
+        self,
+        plan_date: Optional[date] = None,
+        concurrency: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Compute and store plans for every user, then drop older plans.
+
+        Args:
+            plan_date: Day of the plans (default: today)
+            concurrency: Users in flight at once (default: twice the
+                executor's workers, so loading overlaps computing)
+
+        Returns:
+            Summary with user, failure and timing counts
+        """
+        plan_date = plan_date or date.today()
+        user_ids = await self.plan_repo.list_user_ids()
+        limit = asyncio.Semaphore(concurrency or self.compute.max_workers * 2)
+        failed: list[str] = []
+        started_at = time.perf_counter()
+
+        async def run(user_id: str) -> None:
+            async with limit:
+                try:
+                    await self.precompute_user(user_id, plan_date)
+                except Exception:
+                    logger.exception(f"Today plan precompute failed for user {user_id}")
+                    failed.append(user_id)
+
+        await asyncio.gather(*(run(user_id) for user_id in user_ids))
+        deleted = await self.plan_repo.delete_before(plan_date)
+        summary = {
+            "plan_date": plan_date.isoformat(),
+            "users": len(user_ids),
+            "computed": len(user_ids) - len(failed),
+            "failed": len(failed),
+            "deleted_old_plans": deleted,
+            "elapsed_ms": round((time.perf_counter() - started_at) * 1000, 1),
+        }
+        logger.info(f"Today plan precompute: {summary}")
+        return summary
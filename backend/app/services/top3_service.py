@@ -4,15 +4,21 @@ Top 3 service for intelligent task prioritization.
 Provides rule-based scoring with optional AI enhancement.
 """
 
-from datetime import datetime, date
-from uuid import UUID
+from datetime import date
 from typing import Optional
 
 from app.core.logger import setup_logger
 from app.interfaces.task_repository import ITaskRepository
 from app.models.task import Task
-from app.models.enums import Priority, EnergyLevel, TaskStatus
+from app.models.enums import EnergyLevel, TaskStatus
 from app.services.scheduler_service import SchedulerService
+from app.services.scoring import (
+    IMPORTANCE_POINTS,
+    PRIORITY_WEIGHTS,
+    TOP3_DUE_CURVE,
+    URGENCY_POINTS,
+    TaskScoreArrays,
+)
 
 logger = setup_logger(__name__)
 
@@ -30,19 +36,6 @@ class Top3Service:
         self.task_repo = task_repo
         self.scheduler_service = scheduler_service or SchedulerService()
 
-        # Scoring weights
-        self.importance_weights = {
-            Priority.HIGH: 3.0,
-            Priority.MEDIUM: 2.0,
-            Priority.LOW: 1.0,
-        }
-
-        self.urgency_weights = {
-            Priority.HIGH: 3.0,
-            Priority.MEDIUM: 2.0,
-            Priority.LOW: 1.0,
-        }
-
     async def get_top3(
         self,
         user_id: str,
@@ -81,17 +74,12 @@ class Top3Service:
             logger.info(f"No actionable tasks found for user {user_id}")
             return {"tasks": [], "capacity_info": None, "overflow_suggestion": ""}
 
-        # Calculate scores
-        scored_tasks = []
-        for task in actionable_tasks:
-            score = self._calculate_base_score(task)
-            scored_tasks.append((task, score))
-
-        # Sort by score (highest first)
-        scored_tasks.sort(key=lambda x: x[1], reverse=True)
+        # Score all tasks in one pass and sort by score (highest first, ties keep list order)
+        scores = TaskScoreArrays(actionable_tasks).top3_scores(date.today())
+        order = (-scores).argsort(kind="stable")
 
         # Get top tasks (more than 3 for capacity check)
-        top_tasks = [task for task, score in scored_tasks]
+        top_tasks = [actionable_tasks[index] for index in order]
 
         # Check capacity if requested
         capacity_info = None
@@ -191,7 +179,10 @@ class Top3Service:
 
     def _calculate_base_score(self, task: Task) -> float:
         """
-        Calculate base priority score for a task.
+        Calculate base priority score for a single task.
+
+        get_top3 scores task lists with TaskScoreArrays.top3_scores, which
+        gives the same values.
 
         Scoring factors:
         - Importance (30 points max): 10 * weight
@@ -212,34 +203,15 @@ class Top3Service:
         score = 0.0
 
         # Importance weight (30 points max)
-        importance_weight = self.importance_weights.get(task.importance, 1.0)
-        score += importance_weight * 10
+        score += PRIORITY_WEIGHTS.get(task.importance, 1.0) * IMPORTANCE_POINTS
 
         # Urgency weight (24 points max)
-        urgency_weight = self.urgency_weights.get(task.urgency, 1.0)
-        score += urgency_weight * 8
+        score += PRIORITY_WEIGHTS.get(task.urgency, 1.0) * URGENCY_POINTS
 
-        # Due date proximity (30 points max)
+        # Due date proximity (30 points max, see TOP3_DUE_CURVE)
         if task.due_date:
-            today = date.today()
-            due_date = task.due_date.date()
-            days_until = (due_date - today).days
-
-            if days_until < 0:
-                # Overdue
-                score += 30
-            elif days_until == 0:
-                # Due today
-                score += 25
-            elif days_until == 1:
-                # Due tomorrow
-                score += 20
-            elif days_until <= 7:
-                # Due this week
-                score += 10
-            elif days_until <= 14:
-                # Due in 2 weeks
-                score += 5
+            days_until = (task.due_date.date() - date.today()).days
+            score += TOP3_DUE_CURVE.bonus(days_until)
 
         # Energy level bonus for low-energy tasks (quick wins)
         if task.energy_level == EnergyLevel.LOW:
@@ -6,6 +6,7 @@ Tools for creating, updating, deleting, and searching tasks.
 
 from __future__ import annotations
 
+from contextlib import aclosing
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
@@ -19,7 +20,7 @@ from app.interfaces.memory_repository import IMemoryRepository
 from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.task_repository import ITaskRepository
 from app.models.enums import CreatedBy, EnergyLevel, Priority
-from app.models.task import Task, TaskCreate, TaskUpdate
+from app.models.task import Task, TaskCreate, TaskFilters, TaskUpdate
 from app.services.planner_service import PlannerService
 
 
@@ -173,16 +174,18 @@ async def _find_existing_meeting(
     project_id: UUID | None,
 ) -> Task | None:
     normalized = _normalize_meeting_title(title)
-    tasks = await repo.list(user_id, project_id=project_id, include_done=True, limit=1000)
-    for task in tasks:
-        if not task.is_fixed_time or not task.start_time or not task.end_time:
-            continue
-        if not _within_minutes(task.start_time, start_time, 30):
-            continue
-        if not _within_minutes(task.end_time, end_time, 30):
-            continue
-        if _normalize_meeting_title(task.title) == normalized:
-            return task
+    # Closes the repository's cursor when returning mid-scan
+    async with aclosing(repo.iter_tasks(user_id, TaskFilters(project_id=project_id))) as batches:
+        async for batch in batches:
+            for task in batch:
+                if not task.is_fixed_time or not task.start_time or not task.end_time:
+                    continue
+                if not _within_minutes(task.start_time, start_time, 30):
+                    continue
+                if not _within_minutes(task.end_time, end_time, 30):
+                    continue
+                if _normalize_meeting_title(task.title) == normalized:
+                    return task
     return None
 
 
@@ -0,0 +1,80 @@
+"""
+Benchmark SchedulerService.build_schedule on a large synthetic task set.
+
+Also times incremental updates (build_schedule_run with the previous run)
+after single-task edits: marking a planned task done or changing its
+estimate. Garbage is collected before each timed call.
+
+Usage (from backend/):
+    python benchmarks/bench_scheduler.py --tasks 5000 --days 90
+"""
+
+import argparse
+import gc
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models.enums import TaskStatus  # noqa: E402
+from app.services.scheduler_service import SchedulerService  # noqa: E402
+from benchmarks.workloads import mixed as generate_tasks  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = date(2026, 1, 5)
+    tasks = generate_tasks(args.tasks, start, args.days, args.seed)
+    service = SchedulerService()
+
+    for label, until in (("full horizon", None), ("today only", start)):
+        timings = []
+        for _ in range(args.repeat):
+            gc.collect()
+            began = time.perf_counter()
+            schedule = service.build_schedule(tasks, start_date=start, max_days=args.days, until=until)
+            timings.append(time.perf_counter() - began)
+
+        print(
+            f"build_schedule ({label}): {args.tasks} tasks, {args.days} days, "
+            f"{len(schedule.days)} days scheduled, {len(schedule.unscheduled_task_ids)} unscheduled"
+        )
+        print(f"  median {statistics.median(timings) * 1000:.1f} ms, min {min(timings) * 1000:.1f} ms")
+
+    rnd = random.Random(args.seed)
+    run = service.build_schedule_run(tasks, start_date=start, max_days=args.days)
+    timings = []
+    resumed_days = []
+    for i in range(args.repeat * 4):
+        planned = {info.task_id for info in run.response.tasks if info.planned_start is not None}
+        index = rnd.choice([position for position, task in enumerate(tasks) if task.id in planned])
+        if i % 2 == 0:
+            update = {"status": TaskStatus.DONE}
+        else:
+            update = {"estimated_minutes": rnd.choice([15, 30, 60, 120, 240])}
+        tasks = tasks[:index] + [tasks[index].model_copy(update=update)] + tasks[index + 1:]
+        gc.collect()
+        began = time.perf_counter()
+        run = service.build_schedule_run(tasks, start_date=start, max_days=args.days, previous=run)
+        timings.append(time.perf_counter() - began)
+        resumed_days.append(len(run.response.days) if run.resumed_day is None else run.resumed_day)
+
+    print(
+        f"build_schedule_run (incremental, single-task edits): {len(timings)} edits, "
+        f"median resume day {statistics.median(resumed_days):.0f}"
+    )
+    print(f"  median {statistics.median(timings) * 1000:.1f} ms, min {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
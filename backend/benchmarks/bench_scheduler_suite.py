@@ -0,0 +1,181 @@
+"""
+Benchmark suite for SchedulerService across synthetic workloads.
+
+Times build_schedule, get_today_tasks and check_schedule_feasibility for
+every workload in benchmarks/workloads.py at each task count and horizon,
+and measures peak traced memory (tracemalloc) of one extra call. Timed
+calls run without tracing, after a garbage collection.
+
+Results are written as JSON. With --baseline, best-of-repeat timings are
+compared with a previous results file and the script exits with status 1
+when any case is slower than baseline * --tolerance.
+
+Usage (from backend/):
+    python benchmarks/bench_scheduler_suite.py --output bench.json
+    python benchmarks/bench_scheduler_suite.py --workloads long_chains --tasks 10000 --days 365
+    python benchmarks/bench_scheduler_suite.py --baseline main.json --output branch.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.scheduler_service import SchedulerService  # noqa: E402
+from app.services.task_utils import SubtaskIndex  # noqa: E402
+from benchmarks.workloads import WORKLOADS  # noqa: E402
+
+START = date(2026, 1, 5)
+TASK_COUNTS = [100, 1000, 10000]
+HORIZONS = [30, 90, 365]
+# Cases faster than this are too noisy to flag as regressions
+MIN_COMPARED_MS = 1.0
+
+
+def _measure(call: Callable[[], Any], repeat: int) -> dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        began = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - began)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_case(
+    service: SchedulerService, workload: str, count: int, days: int, seed: int, repeat: int
+) -> list[dict]:
+    """Benchmark the three scheduler entry points on one generated task set."""
+    tasks = WORKLOADS[workload](count, START, days, seed)
+    subtask_index = SubtaskIndex(tasks)
+    schedule = service.build_schedule(
+        tasks, start_date=START, max_days=days, subtask_index=subtask_index
+    )
+    calls = {
+        "build_schedule": lambda: service.build_schedule(
+            tasks, start_date=START, max_days=days, subtask_index=subtask_index
+        ),
+        "get_today_tasks": lambda: service.get_today_tasks(
+            schedule, tasks, today=START, subtask_index=subtask_index
+        ),
+        "check_schedule_feasibility": lambda: service.check_schedule_feasibility(
+            tasks, subtask_index=subtask_index
+        ),
+    }
+    context = {
+        "workload": workload,
+        "tasks": count,
+        "days": days,
+        "scheduled_days": len(schedule.days),
+        "unscheduled": len(schedule.unscheduled_task_ids),
+    }
+    return [
+        {**context, "operation": name, **_measure(call, repeat)} for name, call in calls.items()
+    ]
+
+
+def _case_key(result: dict) -> tuple:
+    return (result["workload"], result["tasks"], result["days"], result["operation"])
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Return a description of every case slower than baseline * tolerance."""
+    previous = {_case_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(_case_key(result))
+        # Best-of-repeat is far less noisy than the median on shared machines
+        if before is None or before["min_ms"] < MIN_COMPARED_MS:
+            continue
+        ratio = result["min_ms"] / before["min_ms"]
+        if ratio > tolerance:
+            workload, count, days, operation = _case_key(result)
+            regressions.append(
+                f"{operation} {workload} {count} tasks/{days} days: "
+                f"{before['min_ms']:.1f} -> {result['min_ms']:.1f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--workloads", nargs="+", choices=sorted(WORKLOADS), default=list(WORKLOADS)
+    )
+    parser.add_argument("--tasks", nargs="+", type=int, default=TASK_COUNTS)
+    parser.add_argument("--days", nargs="+", type=int, default=HORIZONS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=Path("bench_scheduler_suite.json"))
+    parser.add_argument("--baseline", type=Path, help="Previous results file to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5, help="Allowed slowdown factor vs baseline"
+    )
+    args = parser.parse_args()
+    # Per-call INFO logs (capacity checks) would dominate the output and the timings
+    logging.disable(logging.INFO)
+
+    service = SchedulerService()
+    results: list[dict] = []
+    for workload in args.workloads:
+        for count in args.tasks:
+            for days in args.days:
+                case = run_case(service, workload, count, days, args.seed, args.repeat)
+                results.extend(case)
+                timings = ", ".join(
+                    f"{r['operation']} {r['median_ms']:.1f} ms/{r['peak_kib']:.0f} KiB"
+                    for r in case
+                )
+                print(f"{workload:<15} {count:>6} tasks {days:>4} days: {timings}", flush=True)
+
+    report = {
+        "suite": "scheduler",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "start_date": START.isoformat(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.2f}x of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
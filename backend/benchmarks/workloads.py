@@ -0,0 +1,204 @@
+"""
+Seeded synthetic workloads for scheduler benchmarks.
+
+Every generator takes (count, start, horizon_days, seed) and returns a
+reproducible list of exactly count tasks for user "bench_user":
+
+- mixed: random statuses, subtasks, dependencies, due dates and meetings
+- flat_backlog: independent top-level tasks, no structure
+- deep_tree: parent/subtask trees up to 8 levels deep
+- long_chains: dependency chains of 50 tasks
+- wide_dag: layered DAG, each task depends on up to 3 tasks of the layer above
+- meeting_heavy: half of the tasks are fixed-time meetings across the horizon
+- overdue_pileup: most tasks are overdue by up to 60 days
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+from uuid import UUID
+
+from app.models.enums import CreatedBy, EnergyLevel, Priority, TaskStatus
+from app.models.task import Task
+
+STATUSES = [TaskStatus.TODO] * 6 + [TaskStatus.IN_PROGRESS, TaskStatus.DONE, TaskStatus.WAITING]
+ESTIMATES = [None, 15, 30, 60, 120, 240]
+
+
+class _Factory:
+    """Builds tasks with random scoring fields from one seeded generator."""
+
+    def __init__(self, start: date, seed: int):
+        self.rnd = random.Random(seed)
+        self.start = start
+        self.created = datetime.combine(start, datetime.min.time()) - timedelta(days=365)
+        self.tasks: list[Task] = []
+
+    def due_date(self, first_day: int, last_day: int) -> datetime:
+        day = self.start + timedelta(days=self.rnd.randint(first_day, last_day))
+        return datetime.combine(day, datetime.min.time())
+
+    def meeting_times(self, horizon_days: int) -> tuple[datetime, datetime]:
+        day = self.start + timedelta(days=self.rnd.randrange(horizon_days))
+        start_time = datetime.combine(day, datetime.min.time()) + timedelta(
+            hours=self.rnd.randint(8, 17)
+        )
+        return start_time, start_time + timedelta(minutes=self.rnd.choice([30, 60, 90]))
+
+    def add(
+        self,
+        status: Optional[TaskStatus] = None,
+        estimated_minutes: Optional[int] = -1,
+        due_date: Optional[datetime] = None,
+        parent_id: Optional[UUID] = None,
+        dependency_ids: Optional[list[UUID]] = None,
+        meeting: Optional[tuple[datetime, datetime]] = None,
+    ) -> Task:
+        rnd = self.rnd
+        index = len(self.tasks)
+        task = Task(
+            id=UUID(int=rnd.getrandbits(128)),
+            user_id="bench_user",
+            title=f"Task {index}",
+            status=status or rnd.choice(STATUSES),
+            importance=rnd.choice(list(Priority)),
+            urgency=rnd.choice(list(Priority)),
+            energy_level=rnd.choice(list(EnergyLevel)),
+            estimated_minutes=rnd.choice(ESTIMATES)
+            if estimated_minutes == -1
+            else estimated_minutes,
+            due_date=due_date,
+            parent_id=parent_id,
+            dependency_ids=dependency_ids or [],
+            created_by=CreatedBy.USER,
+            created_at=self.created + timedelta(seconds=index),
+            updated_at=self.created,
+            is_fixed_time=meeting is not None,
+            start_time=meeting[0] if meeting else None,
+            end_time=meeting[1] if meeting else None,
+        )
+        self.tasks.append(task)
+        return task
+
+
+def mixed(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """Random statuses with 10% subtasks, 20% dependencies, 40% due dates, 5% meetings."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    for _ in range(count):
+        tasks = factory.tasks
+        parent_id = rnd.choice(tasks).id if tasks and rnd.random() < 0.1 else None
+        dependency_ids = (
+            [rnd.choice(tasks).id for _ in range(rnd.randint(1, 2))]
+            if tasks and rnd.random() < 0.2
+            else []
+        )
+        meeting = factory.meeting_times(horizon_days) if rnd.random() < 0.05 else None
+        due_date = factory.due_date(-3, horizon_days) if rnd.random() < 0.4 else None
+        factory.add(
+            due_date=due_date, parent_id=parent_id, dependency_ids=dependency_ids, meeting=meeting
+        )
+    return factory.tasks
+
+
+def flat_backlog(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """Independent TODO tasks; a third have due dates within the horizon."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    for _ in range(count):
+        due_date = factory.due_date(0, horizon_days) if rnd.random() < 0.3 else None
+        factory.add(status=TaskStatus.TODO, due_date=due_date)
+    return factory.tasks
+
+
+def deep_tree(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """Parent/subtask trees: each new task is a subtask of a random task at depth < 8."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    open_parents: list[tuple[UUID, int]] = []
+    for _ in range(count):
+        parent_id, depth = None, 0
+        if open_parents and rnd.random() < 0.9:
+            parent_id, parent_depth = rnd.choice(open_parents)
+            depth = parent_depth + 1
+        due_date = factory.due_date(0, horizon_days) if rnd.random() < 0.3 else None
+        task = factory.add(status=TaskStatus.TODO, due_date=due_date, parent_id=parent_id)
+        if depth < 7:
+            open_parents.append((task.id, depth))
+    return factory.tasks
+
+
+def long_chains(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """Dependency chains of 50 tasks, each task depending on the previous one."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    previous: Optional[Task] = None
+    for index in range(count):
+        if index % 50 == 0:
+            previous = None
+        due_date = factory.due_date(0, horizon_days) if rnd.random() < 0.2 else None
+        previous = factory.add(
+            status=TaskStatus.TODO,
+            estimated_minutes=rnd.choice([30, 60, 120]),
+            due_date=due_date,
+            dependency_ids=[previous.id] if previous else None,
+        )
+    return factory.tasks
+
+
+def wide_dag(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """Layered DAG of 10 layers; tasks depend on 1-3 random tasks of the layer above."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    width = max(1, count // 10)
+    layer_above: list[UUID] = []
+    layer: list[UUID] = []
+    for index in range(count):
+        if index and index % width == 0:
+            layer_above, layer = layer, []
+        dependency_ids = (
+            rnd.sample(layer_above, min(len(layer_above), rnd.randint(1, 3)))
+            if layer_above
+            else None
+        )
+        due_date = factory.due_date(0, horizon_days) if rnd.random() < 0.2 else None
+        task = factory.add(status=TaskStatus.TODO, due_date=due_date, dependency_ids=dependency_ids)
+        layer.append(task.id)
+    return factory.tasks
+
+
+def meeting_heavy(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """Half fixed-time meetings spread over the horizon, half regular tasks."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    for index in range(count):
+        if index % 2 == 0:
+            factory.add(status=TaskStatus.TODO, meeting=factory.meeting_times(horizon_days))
+        else:
+            due_date = factory.due_date(0, horizon_days) if rnd.random() < 0.3 else None
+            factory.add(status=TaskStatus.TODO, due_date=due_date)
+    return factory.tasks
+
+
+def overdue_pileup(count: int, start: date, horizon_days: int, seed: int) -> list[Task]:
+    """80% of tasks overdue by up to 60 days, the rest due within the horizon."""
+    factory = _Factory(start, seed)
+    rnd = factory.rnd
+    for _ in range(count):
+        if rnd.random() < 0.8:
+            due_date = factory.due_date(-60, -1)
+        else:
+            due_date = factory.due_date(0, horizon_days)
+        factory.add(status=rnd.choice([TaskStatus.TODO, TaskStatus.IN_PROGRESS]), due_date=due_date)
+    return factory.tasks
+
+
+WORKLOADS: dict[str, Callable[[int, date, int, int], list[Task]]] = {
+    "mixed": mixed,
+    "flat_backlog": flat_backlog,
+    "deep_tree": deep_tree,
+    "long_chains": long_chains,
+    "wide_dag": wide_dag,
+    "meeting_heavy": meeting_heavy,
+    "overdue_pileup": overdue_pileup,
+}
@@ -9,20 +9,30 @@ from uuid import uuid4
 sys.path.insert(0, ".")
 
 from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
 from app.models.project import ProjectCreate
+from app.models.task import TaskBatchCreate
 
 
 async def create_mock_projects():
     """Create mock projects."""
     repo = SqliteProjectRepository()
+    task_repo = SqliteTaskRepository()
     user_id = "dev_user"
 
-    # Delete existing projects first
+    # Delete existing projects (and their tasks) first
     print("Deleting existing projects...")
     from app.infrastructure.local.database import get_session_factory
     from sqlalchemy import text
     session_factory = get_session_factory()
     async with session_factory() as session:
+        await session.execute(
+            text(
+                "DELETE FROM tasks WHERE user_id = :user_id AND project_id IN "
+                "(SELECT id FROM projects WHERE user_id = :user_id)"
+            ),
+            {"user_id": user_id},
+        )
         await session.execute(text("DELETE FROM projects WHERE user_id = :user_id"), {"user_id": user_id})
         await session.commit()
 
@@ -66,6 +76,20 @@ async def create_mock_projects():
     created1 = await repo.create(user_id, project1)
     print(f"✓ Created: {created1.name} (priority: {created1.priority})")
 
+    # Workflow tasks for project 1 (each step depends on the previous one)
+    workflow = ["テーマ選定", "競合記事リサーチ", "アウトライン作成", "執筆", "画像作成・最適化", "校正", "公開"]
+    workflow_tasks = [
+        TaskBatchCreate(
+            title=title,
+            project_id=created1.id,
+            estimated_minutes=30,
+            batch_dependency_indexes=[index - 1] if index > 0 else [],
+        )
+        for index, title in enumerate(workflow)
+    ]
+    created_tasks = await task_repo.create_many(user_id, workflow_tasks)
+    print(f"  ✓ Created {len(created_tasks)} workflow tasks")
+
     # Project 2: 確定申告準備
     project2 = ProjectCreate(
         name="確定申告準備",
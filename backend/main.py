@@ -23,9 +23,11 @@ async def lifespan(app: FastAPI):
 
     # Initialize database if needed
     if settings.ENVIRONMENT == "local":
-        from app.infrastructure.local.database import init_db
+        from app.infrastructure.local.database import get_engine, init_db
         from app.infrastructure.local.migrations import run_migrations
 
+        # Create the shared engine up front so every repository reuses its pool
+        get_engine()
         await init_db()
         await run_migrations()
 
@@ -33,6 +35,13 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("Shutting down Secretary Partner AI...")
+    from app.api.deps import get_compute_executor
+
+    get_compute_executor().shutdown()
+    if settings.ENVIRONMENT == "local":
+        from app.infrastructure.local.database import dispose_engine
+
+        await dispose_engine()
 
 
 def create_app() -> FastAPI:
@@ -55,10 +64,11 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Include routers
-    from app.api import chat, tasks, projects, captures, agent_tasks, memories, heartbeat, today
+    from app.api import chat, tasks, projects, captures, agent_tasks, memories, heartbeat, today, metrics
 
     app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
     app.include_router(tasks.router, prefix="/api/tasks", tags=["tasks"])
@@ -68,6 +78,7 @@ def create_app() -> FastAPI:
     app.include_router(memories.router, prefix="/api/memories", tags=["memories"])
     app.include_router(heartbeat.router, prefix="/api/heartbeat", tags=["heartbeat"])
     app.include_router(today.router, prefix="/api/today", tags=["today"])
+    app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
 
     # Mount storage for local development
     storage_path = settings.STORAGE_BASE_PATH
@@ -0,0 +1,61 @@
+"""
+Nightly precompute of today plans for all users.
+
+Builds every user's schedule and today view (allocations, Top 3) on worker
+processes and stores them in the today_plans table, which the /today
+endpoints serve until the user's data changes. Run shortly after midnight
+(cron, Cloud Scheduler):
+
+    python precompute_today_plans.py
+    python precompute_today_plans.py --date 2026-03-02 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import date
+
+from app.core.config import get_settings
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.infrastructure.local.database import dispose_engine, init_db
+from app.infrastructure.local.migrations import run_migrations
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.infrastructure.local.today_plan_repository import SqliteTodayPlanRepository
+from app.services.today_plan_service import TodayPlanService
+
+
+async def precompute(plan_date: date, workers: int) -> dict:
+    """Run the precompute job against the configured database."""
+    await init_db()
+    await run_migrations()
+    compute = ComputeExecutor("process", max_workers=workers)
+    try:
+        service = TodayPlanService(
+            SqliteTodayPlanRepository(),
+            SqliteTaskRepository(),
+            SqliteProjectRepository(),
+            compute,
+        )
+        return await service.precompute_all(plan_date)
+    finally:
+        compute.shutdown()
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--date", type=date.fromisoformat, default=None, help="Plan date (default: today)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    workers = args.workers or get_settings().TODAY_PLAN_WORKERS or os.cpu_count() or 1
+    summary = asyncio.run(precompute(args.date or date.today(), workers))
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
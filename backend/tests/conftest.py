@@ -71,3 +71,35 @@ def mock_user():
         display_name="Test User",
     )
 
+
+
+@pytest.fixture
+def agent_service_factory(session_factory):
+    """
+    Build agent services backed by the test database.
+
+    Args:
+        session_factory: Test session factory
+
+    Returns:
+        Callable that takes an LLM provider and returns an AgentService
+    """
+    from app.infrastructure.local.agent_task_repository import SqliteAgentTaskRepository
+    from app.infrastructure.local.capture_repository import SqliteCaptureRepository
+    from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
+    from app.infrastructure.local.memory_repository import SqliteMemoryRepository
+    from app.infrastructure.local.project_repository import SqliteProjectRepository
+    from app.infrastructure.local.task_repository import SqliteTaskRepository
+    from app.services.agent_service import AgentService
+
+    def _factory(provider):
+        return AgentService(
+            llm_provider=provider,
+            task_repo=SqliteTaskRepository(session_factory=session_factory),
+            project_repo=SqliteProjectRepository(session_factory=session_factory),
+            memory_repo=SqliteMemoryRepository(session_factory=session_factory),
+            agent_task_repo=SqliteAgentTaskRepository(session_factory=session_factory),
+            capture_repo=SqliteCaptureRepository(session_factory=session_factory),
+            chat_repo=SqliteChatSessionRepository(session_factory=session_factory),
+        )
+    return _factory
@@ -0,0 +1,148 @@
+"""
+Unit tests for the SQLite-backed ADK session service.
+"""
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai.types import Content, Part
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.infrastructure.local.adk_session_service import SqliteAdkSessionService
+from app.infrastructure.local.database import Base, create_engine_from_settings
+from app.infrastructure.local.fake_llm_provider import FakeLLMProvider
+from app.models.chat import ChatRequest
+from app.services import agent_service
+
+APP = "SecretaryPartnerAI"
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_engine_from_settings(f"sqlite+aiosqlite:///{tmp_path / 'adk.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _event(author: str, text: str, timestamp: float, **state_delta) -> Event:
+    return Event(
+        invocation_id="inv",
+        author=author,
+        content=Content(role="user" if author == "user" else "model", parts=[Part(text=text)]),
+        actions=EventActions(state_delta=state_delta),
+        timestamp=timestamp,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_shared_between_service_instances(session_factory):
+    """Test a session written by one worker's service is continued by another's."""
+    worker_a = SqliteAdkSessionService(session_factory)
+    worker_b = SqliteAdkSessionService(session_factory)
+
+    session = await worker_a.create_session(
+        app_name=APP, user_id="u1", session_id="s1", state={"topic": "plans", "app:tz": "JST"}
+    )
+    await worker_a.append_event(session, _event("user", "明日の予定は?", 1.0, **{"temp:x": 1}))
+    await worker_a.append_event(
+        session, _event("secretary", "10時に会議です", 2.0, **{"user:name": "Aki", "step": 2})
+    )
+    partial = _event("secretary", "10", 3.0)
+    partial.partial = True
+    await worker_a.append_event(session, partial)
+
+    loaded = await worker_b.get_session(app_name=APP, user_id="u1", session_id="s1")
+    assert [event.content.parts[0].text for event in loaded.events] == [
+        "明日の予定は?",
+        "10時に会議です",
+    ]
+    assert loaded.events == session.events
+    assert loaded.state == {"topic": "plans", "step": 2, "app:tz": "JST", "user:name": "Aki"}
+    assert loaded.last_update_time == 2.0
+
+    # Scoped state reaches the user's other sessions
+    other = await worker_b.create_session(app_name=APP, user_id="u1", session_id="s2")
+    assert other.state == {"app:tz": "JST", "user:name": "Aki"}
+
+    recent = await worker_b.get_session(
+        app_name=APP, user_id="u1", session_id="s1", config=GetSessionConfig(num_recent_events=1)
+    )
+    assert [event.content.parts[0].text for event in recent.events] == ["10時に会議です"]
+
+    # s1 was last updated at the (fixed) timestamp of its last event
+    listed = await worker_b.list_sessions(app_name=APP, user_id="u1")
+    assert [s.id for s in listed.sessions] == ["s2", "s1"]
+    assert all(not s.events for s in listed.sessions)
+
+    await worker_b.delete_session(app_name=APP, user_id="u1", session_id="s1")
+    assert await worker_a.get_session(app_name=APP, user_id="u1", session_id="s1") is None
+    assert await worker_a.get_session(app_name=APP, user_id="u2", session_id="s2") is None
+
+
+@pytest.mark.asyncio
+async def test_chat_continues_on_a_worker_without_the_runner(
+    session_factory, agent_service_factory, monkeypatch
+):
+    """Test a conversation continues from the database on a fresh runner."""
+    store = SqliteAdkSessionService(session_factory)
+    monkeypatch.setattr(get_settings(), "AGENT_SESSION_STORE", "sqlite")
+    monkeypatch.setattr(agent_service, "get_shared_session_service", lambda: store)
+    user_id = "multi-worker-user"
+    service = agent_service_factory(FakeLLMProvider())
+
+    first = await service.process_chat(user_id, ChatRequest(text="会議は15時から"))
+    # Another worker: no cached runner for the user
+    agent_service._runner_cache.pop(user_id)
+    await service.process_chat(user_id, ChatRequest(text="何時から?"), session_id=first.session_id)
+    agent_service._runner_cache.pop(user_id)
+
+    session = await store.get_session(app_name=APP, user_id=user_id, session_id=first.session_id)
+    assert [event.content.parts[0].text for event in session.events] == [
+        "会議は15時から",
+        "了解しました: 会議は15時から",
+        "何時から?",
+        "了解しました: 何時から?",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_state_deltas_replace_top_level_keys_like_dict_update(session_factory):
+    """Test None values are kept and nested dicts are replaced, as in memory."""
+    service = SqliteAdkSessionService(session_factory)
+    session = await service.create_session(
+        app_name=APP,
+        user_id="u1",
+        session_id="s1",
+        state={"x": {"b": 2}, "y": 1, "user:prefs": {"tz": "JST"}, "app:flags": {"a": True}},
+    )
+    await service.append_event(
+        session,
+        _event(
+            "secretary",
+            "更新しました",
+            1.0,
+            x={"a": 1},
+            y=None,
+            flag=False,
+            **{"user:prefs": {"lang": "ja"}, "app:flags": None},
+        ),
+    )
+
+    expected = {
+        "x": {"a": 1},
+        "y": None,
+        "flag": False,
+        "user:prefs": {"lang": "ja"},
+        "app:flags": None,
+    }
+    assert session.state == expected
+    loaded = await service.get_session(app_name=APP, user_id="u1", session_id="s1")
+    assert loaded.state == expected
+
+    with pytest.raises(ValueError):
+        await service.append_event(session, _event("secretary", "x", 2.0, **{'a"b': 1}))
+    assert len(session.events) == 1
@@ -0,0 +1,47 @@
+"""
+Unit tests for AgentTask repository.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.infrastructure.local.agent_task_repository import SqliteAgentTaskRepository
+from app.models.agent_task import AgentTaskCreate
+from app.models.enums import ActionType, AgentTaskStatus
+
+
+@pytest.mark.asyncio
+async def test_mark_failed_counts_retries(session_factory, test_user_id):
+    """Test mark_failed increments retries and fails on the third attempt."""
+    repo = SqliteAgentTaskRepository(session_factory=session_factory)
+    task = await repo.create(
+        test_user_id,
+        AgentTaskCreate(trigger_time=datetime.utcnow(), action_type=ActionType.ENCOURAGE),
+    )
+    assert task.status == AgentTaskStatus.PENDING
+    assert task.retry_count == 0
+
+    for attempt in range(1, 4):
+        failed = await repo.mark_failed(task.id, f"error {attempt}")
+        assert failed.retry_count == attempt
+        assert failed.last_error == f"error {attempt}"
+
+    assert failed.status == AgentTaskStatus.FAILED
+    assert not await repo.cancel(test_user_id, task.id)
+
+
+@pytest.mark.asyncio
+async def test_mark_completed_and_cancel(session_factory, test_user_id):
+    """Test completion sets executed_at and cancel only affects pending tasks."""
+    repo = SqliteAgentTaskRepository(session_factory=session_factory)
+    create = AgentTaskCreate(trigger_time=datetime.utcnow(), action_type=ActionType.ENCOURAGE)
+    done = await repo.create(test_user_id, create)
+    pending = await repo.create(test_user_id, create)
+
+    completed = await repo.mark_completed(done.id)
+    assert completed.status == AgentTaskStatus.COMPLETED
+    assert completed.executed_at is not None
+
+    assert await repo.cancel(test_user_id, pending.id)
+    assert (await repo.get(test_user_id, pending.id)).status == AgentTaskStatus.CANCELLED
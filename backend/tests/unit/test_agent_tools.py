@@ -21,7 +21,7 @@ from app.tools.task_tools import (
     DeleteTaskInput,
     SearchSimilarTasksInput,
 )
-from app.models.task import Task, TaskCreate
+from app.models.task import Task, TaskCreate, TaskFilters
 from app.models.enums import Priority, EnergyLevel, CreatedBy, TaskStatus
 from app.core.exceptions import NotFoundError
 
@@ -116,6 +116,20 @@ class MockTaskRepository:
         tasks.sort(key=lambda t: t.created_at, reverse=True)
         return tasks[offset:offset + limit]
 
+    async def iter_tasks(self, user_id: str, filters=None, batch_size: int = 500):
+        """Stream tasks in batches."""
+        filters = filters or TaskFilters()
+        tasks = await self.list(
+            user_id,
+            project_id=filters.project_id,
+            status=filters.status.value if filters.status else None,
+            parent_id=filters.parent_id,
+            include_done=filters.include_done,
+            limit=len(self.tasks),
+        )
+        for start in range(0, len(tasks), batch_size):
+            yield tasks[start:start + batch_size]
+
     async def find_similar(self, user_id: str, title: str, project_id=None, threshold: float = 0.8, limit: int = 5):
         """Find similar tasks within the same project."""
         from app.models.task import SimilarTask
@@ -0,0 +1,48 @@
+"""
+Unit tests for the scheduler benchmark workloads and regression check.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.services.scheduler_service import SchedulerService
+from benchmarks.bench_scheduler_suite import compare, run_case
+from benchmarks.workloads import WORKLOADS
+
+START = date(2026, 1, 5)
+
+
+@pytest.mark.parametrize("workload", sorted(WORKLOADS))
+def test_workloads_are_reproducible_and_schedulable(workload):
+    """Test each generator is seeded and its tasks run through the benchmarked calls."""
+    tasks = WORKLOADS[workload](60, START, 30, 7)
+    assert len(tasks) == 60
+    assert [task.model_dump() for task in tasks] == [
+        task.model_dump() for task in WORKLOADS[workload](60, START, 30, 7)
+    ]
+
+    results = run_case(SchedulerService(), workload, 60, 30, seed=7, repeat=1)
+    assert [result["operation"] for result in results] == [
+        "build_schedule",
+        "get_today_tasks",
+        "check_schedule_feasibility",
+    ]
+    assert all(result["peak_kib"] > 0 for result in results)
+
+
+def test_compare_flags_slowdowns_beyond_tolerance():
+    """Test regressions are reported on best-of-repeat timings above the noise floor."""
+    case = {"workload": "flat_backlog", "tasks": 1000, "days": 30}
+    baseline = [
+        {**case, "operation": "build_schedule", "min_ms": 40.0},
+        {**case, "operation": "get_today_tasks", "min_ms": 0.5},
+    ]
+    results = [
+        {**case, "operation": "build_schedule", "min_ms": 70.0},
+        {**case, "operation": "get_today_tasks", "min_ms": 2.0},
+    ]
+
+    assert compare(results, baseline, tolerance=2.0) == []
+    (regression,) = compare(results, baseline, tolerance=1.5)
+    assert regression.startswith("build_schedule flat_backlog 1000 tasks/30 days")
@@ -0,0 +1,60 @@
+"""
+Unit tests for Chat session repository.
+"""
+
+import pytest
+
+from app.core.exceptions import NotFoundError
+from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
+
+
+@pytest.mark.asyncio
+async def test_touch_session_upserts(session_factory, test_user_id):
+    """Test touch_session creates once, then only updates."""
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+
+    created = await repo.touch_session(test_user_id, "s1")
+    assert created.title == "New Chat"
+
+    titled = await repo.touch_session(test_user_id, "s1", title="Planning")
+    assert titled.title == "Planning"
+    assert titled.created_at == created.created_at
+    assert titled.updated_at >= created.updated_at
+
+    # An existing custom title is kept
+    kept = await repo.touch_session(test_user_id, "s1", title="Other")
+    assert kept.title == "Planning"
+    assert len(await repo.list_sessions(test_user_id)) == 1
+
+    # Another user's session ID is not taken over
+    with pytest.raises(NotFoundError):
+        await repo.touch_session("other_user", "s1", title="Hijack")
+
+
+@pytest.mark.asyncio
+async def test_add_message_creates_session(session_factory, test_user_id):
+    """Test add_message upserts the session and returns the stored message."""
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+
+    first = await repo.add_message(test_user_id, "s2", "user", "Hello", title="Greeting")
+    second = await repo.add_message(test_user_id, "s2", "assistant", "Hi!")
+
+    assert first.id != second.id
+    assert first.created_at is not None
+    [session] = await repo.list_sessions(test_user_id)
+    assert session.title == "Greeting"
+    messages = await repo.list_messages(test_user_id, "s2")
+    assert [message.content for message in messages] == ["Hello", "Hi!"]
+
+
+@pytest.mark.asyncio
+async def test_list_recent_messages_returns_the_tail_in_order(session_factory, test_user_id):
+    """Test list_recent_messages returns the latest messages, oldest first."""
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    for index in range(5):
+        await repo.add_message(test_user_id, "s3", "user", f"m{index}")
+    await repo.add_message("other_user", "s3-other", "user", "other")
+
+    messages = await repo.list_recent_messages(test_user_id, "s3", limit=3)
+    assert [message.content for message in messages] == ["m2", "m3", "m4"]
+    assert len(await repo.list_recent_messages(test_user_id, "s3", limit=10)) == 5
@@ -0,0 +1,47 @@
+"""
+Unit tests for token-level chat streaming with the fake provider.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.local.fake_llm_provider import FakeLLMProvider
+from app.models.chat import ChatRequest
+from app.services.agent_service import AgentService
+
+REPLY = "本日のタスクを整理しました。まず報告書を仕上げ、その後でレビューに取りかかりましょう。" * 3
+
+
+async def _chunks(service: AgentService, text: str) -> list[dict]:
+    return [
+        chunk
+        async for chunk in service.process_chat_stream(
+            user_id=f"stream-{uuid4()}", request=ChatRequest(text=text)
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_text_deltas_are_forwarded_as_they_are_generated(agent_service_factory):
+    """Test partial model output reaches the stream once, coalesced, before done."""
+    chunks = await _chunks(agent_service_factory(FakeLLMProvider([REPLY])), "今日の予定は?")
+
+    texts = [chunk["content"] for chunk in chunks if chunk["chunk_type"] == "text"]
+    assert len(texts) > 1
+    assert max(len(text) for text in texts) < len(REPLY)
+    assert "".join(texts) == REPLY
+    assert chunks[-1]["chunk_type"] == "done"
+    assert chunks[-1]["assistant_message"] == REPLY
+
+
+@pytest.mark.asyncio
+async def test_non_streaming_provider_sends_the_whole_reply(agent_service_factory):
+    """Test providers without streaming still send their text exactly once."""
+    provider = FakeLLMProvider()
+    provider.supports_streaming = lambda: False
+
+    chunks = await _chunks(agent_service_factory(provider), "hello")
+
+    assert [chunk["chunk_type"] for chunk in chunks] == ["text", "done"]
+    assert chunks[0]["content"] == chunks[1]["assistant_message"] == "了解しました: hello"
@@ -0,0 +1,79 @@
+"""
+Unit tests for the compute executor.
+"""
+
+import asyncio
+import threading
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.models.enums import CreatedBy, TaskStatus
+from app.models.task import Task
+from app.services.kpi_calculator import _compute_task_kpis
+from app.services.scheduler_service import SchedulerService
+
+
+def _tasks(count: int) -> list[Task]:
+    return [
+        Task(
+            id=uuid4(),
+            user_id="u1",
+            title=f"Task {i}",
+            status=TaskStatus.DONE if i % 3 == 0 else TaskStatus.TODO,
+            estimated_minutes=60,
+            created_by=CreatedBy.USER,
+            created_at=datetime(2026, 1, 1, 0, i),
+            updated_at=datetime(2026, 1, 1),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_runs_off_loop_with_bounded_concurrency():
+    """Test calls run on worker threads, at most max_workers at once, and queue."""
+    executor = ComputeExecutor("thread", max_workers=1)
+    release = threading.Event()
+    loop_thread = threading.current_thread().name
+
+    def blocking() -> str:
+        release.wait(5)
+        return threading.current_thread().name
+
+    calls = [asyncio.create_task(executor.run(blocking)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    stats = executor.stats()
+    assert (stats["running"], stats["queue_depth"]) == (1, 2)
+
+    release.set()
+    names = await asyncio.gather(*calls)
+    assert all(name.startswith("compute") and name != loop_thread for name in names)
+    stats = executor.stats()
+    assert (stats["running"], stats["queue_depth"], stats["max_queue_depth"]) == (0, 0, 2)
+    assert (stats["submitted"], stats["completed"], stats["failed"]) == (3, 3, 0)
+
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(lambda: 1 / 0)
+    assert executor.stats()["failed"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_executor_matches_inline_results():
+    """Test picklable scheduling and KPI calls give the same results in worker processes."""
+    tasks = _tasks(12)
+    service = SchedulerService()
+    start = date(2026, 3, 2)
+    process = ComputeExecutor("process", max_workers=1)
+    assert not process.shares_memory
+    try:
+        assert await process.run(_compute_task_kpis, tasks) == _compute_task_kpis(tasks)
+        assert await process.run(
+            service.build_schedule, tasks, start_date=start, max_days=5
+        ) == service.build_schedule(tasks, start_date=start, max_days=5)
+        assert process.stats()["completed"] == 2
+    finally:
+        process.shutdown()
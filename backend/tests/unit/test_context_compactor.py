@@ -0,0 +1,229 @@
+"""
+Unit tests for rolling conversation summarization.
+"""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+from google.adk.events import Event
+from google.adk.models import LlmRequest
+from google.genai.types import Content, FunctionCall, FunctionResponse, Part
+
+from app.core.config import get_settings
+from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
+from app.infrastructure.local.fake_llm_provider import FakeLLMProvider, FakeStreamingLlm
+from app.models.chat import ChatRequest
+from app.services import agent_service
+from app.services.context_compactor import (
+    SUMMARY_PREFIX,
+    ContextCompactor,
+    ContextStats,
+    estimate_tokens,
+    split_turns,
+    turn_start_times,
+)
+
+SESSION_ID = "long-session"
+
+
+def _turn(index: int) -> list[Content]:
+    """A user message, a tool round trip and the agent's reply (~270 tokens)."""
+    return [
+        Content(role="user", parts=[Part(text=f"質問{index}: " + "予定" * 80)]),
+        Content(
+            role="model",
+            parts=[Part(function_call=FunctionCall(name="list_tasks", args={"n": index}))],
+        ),
+        Content(
+            role="user",
+            parts=[
+                Part(function_response=FunctionResponse(name="list_tasks", response={"n": index}))
+            ],
+        ),
+        Content(role="model", parts=[Part(text=f"回答{index}: " + "了解" * 80)]),
+    ]
+
+
+def _history(first: int, last: int) -> list[Content]:
+    return [content for index in range(first, last + 1) for content in _turn(index)]
+
+
+def _context(history: list[Content], first_turn: int = 1) -> SimpleNamespace:
+    """Callback context whose session events hold history; turn N starts at time N."""
+    events = [
+        Event(author="user", content=content, timestamp=first_turn + i // 4 + i % 4 * 0.1)
+        for i, content in enumerate(history)
+    ]
+    session = SimpleNamespace(id=SESSION_ID, events=events)
+    return SimpleNamespace(_invocation_context=SimpleNamespace(session=session))
+
+
+class _RecordingSummarizer:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls: list[tuple[str, str]] = []
+
+    async def __call__(self, previous_summary: str, transcript: str) -> str:
+        self.calls.append((previous_summary, transcript))
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return f"要約{len(self.calls)}"
+
+
+def test_turns_include_tool_round_trips():
+    """Test tool results do not start a new turn."""
+    contents = _turn(1) + _turn(2)
+    assert [len(turn) for turn in split_turns(contents)] == [4, 4]
+    events = _context(contents)._invocation_context.session.events
+    assert turn_start_times(events) == [1.0, 2.0]
+    assert estimate_tokens(_turn(1)) > 200
+
+
+@pytest.mark.asyncio
+async def test_tokens_sent_stay_flat_as_the_session_grows(session_factory, test_user_id):
+    """Test older turns are folded into a stored summary and the last turns stay verbatim."""
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await repo.touch_session(test_user_id, SESSION_ID)
+    summarizer = _RecordingSummarizer()
+    stats = ContextStats()
+    compactor = ContextCompactor(
+        repo, summarizer, test_user_id, token_budget=2000, keep_turns=3, stats=stats
+    )
+
+    history: list[Content] = []
+    sent_tokens = []
+    for index in range(1, 41):
+        history += _turn(index)
+        request = LlmRequest(contents=list(history))
+        assert await compactor(_context(history), request) is None
+        sent_tokens.append(estimate_tokens(request.contents))
+
+    # Full history reaches ~11k tokens; what is sent stays under the budget
+    assert estimate_tokens(history) > 5 * 2000
+    assert max(sent_tokens) <= 2000
+    assert stats.max_sent_tokens == max(sent_tokens)
+    # Folding is batched: most turns reuse the stored summary
+    assert 2 <= len(summarizer.calls) <= 10
+    assert summarizer.calls[1][0] == "要約1"
+
+    stored = await repo.get_summary(test_user_id, SESSION_ID)
+    assert stored.summary == f"要約{len(summarizer.calls)}"
+    # Turns up to the stored start time are summarized
+    summarized_turns = int(stored.summarized_until)
+    assert summarized_turns >= 40 - 7
+
+    sent = request.contents
+    assert sent[0].parts[0].text == SUMMARY_PREFIX + stored.summary
+    assert sent[-12:] == history[-12:]
+    assert sent[0].parts[1:] == history[4 * summarized_turns].parts
+
+    # An older summary (from a stale worker) does not overwrite it
+    await repo.save_summary(test_user_id, SESSION_ID, "古い要約", 1.0)
+    assert (await repo.get_summary(test_user_id, SESSION_ID)).summary == stored.summary
+
+
+@pytest.mark.asyncio
+async def test_full_history_is_sent_when_summarizing_fails(session_factory, test_user_id):
+    """Test a summarizer failure falls back to the full history."""
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await repo.touch_session(test_user_id, SESSION_ID)
+    stats = ContextStats()
+    compactor = ContextCompactor(
+        repo,
+        _RecordingSummarizer(fail=True),
+        test_user_id,
+        token_budget=500,
+        keep_turns=2,
+        stats=stats,
+    )
+    history = _history(1, 5)
+    request = LlmRequest(contents=list(history))
+
+    await compactor(_context(history), request)
+
+    assert request.contents == history
+    assert stats.summary_failures == 1
+    assert await repo.get_summary(test_user_id, SESSION_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_summary_is_matched_to_rehydrated_turns_by_time(session_factory, test_user_id):
+    """Test a session holding only its latest turns keeps every turn the summary lacks."""
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await repo.touch_session(test_user_id, SESSION_ID)
+    summarizer = _RecordingSummarizer()
+    compactor = ContextCompactor(
+        repo, summarizer, test_user_id, token_budget=20_000, keep_turns=3, stats=ContextStats()
+    )
+    history = _history(76, 100)
+
+    # Summary of turns 1-20: turns 76-100 are all sent
+    await repo.save_summary(test_user_id, SESSION_ID, "1-20の要約", 20.0)
+    sent = await compactor.compact(SESSION_ID, history, [float(n) for n in range(76, 101)])
+    assert sent[0].parts[0].text == SUMMARY_PREFIX + "1-20の要約"
+    assert sent[0].parts[1:] == history[0].parts
+    assert sent[1:] == history[1:]
+
+    # Summary of turns 1-90: only turns 91-100 are sent, without summarizing again
+    await repo.save_summary(test_user_id, SESSION_ID, "1-90の要約", 90.0)
+    for _ in range(3):
+        sent = await compactor.compact(SESSION_ID, history, [float(n) for n in range(76, 101)])
+        assert sent[0].parts[0].text == SUMMARY_PREFIX + "1-90の要約"
+        assert sent[1:] == history[4 * 15 + 1 :]
+    assert summarizer.calls == []
+
+
+@pytest.mark.asyncio
+async def test_compaction_continues_after_session_rehydration(
+    session_factory, agent_service_factory, test_user_id, monkeypatch
+):
+    """Test a rehydrated session sends its summary plus every replayed turn."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "CHAT_CONTEXT_TOKEN_BUDGET", 400)
+    monkeypatch.setattr(settings, "CHAT_CONTEXT_KEEP_TURNS", 2)
+    monkeypatch.setattr(settings, "AGENT_REHYDRATE_MAX_MESSAGES", 6)
+    summarizer = _RecordingSummarizer()
+    monkeypatch.setattr(agent_service, "llm_summarizer", lambda *args, **kwargs: summarizer)
+    sent: list[list[Content]] = []
+    generate = FakeStreamingLlm.generate_content_async
+
+    def recording_generate(self, llm_request, stream=False):
+        sent.append(list(llm_request.contents))
+        return generate(self, llm_request, stream)
+
+    monkeypatch.setattr(FakeStreamingLlm, "generate_content_async", recording_generate)
+    service = agent_service_factory(FakeLLMProvider())
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+
+    session_id = None
+    for index in range(1, 9):
+        response = await service.process_chat(
+            test_user_id, ChatRequest(text=f"質問{index}: " + "予定" * 40), session_id=session_id
+        )
+        session_id = response.session_id
+    stored = await repo.get_summary(test_user_id, session_id)
+    calls = len(summarizer.calls)
+    assert stored is not None and calls >= 1
+
+    # Another worker: turns 6-8 are replayed from chat_messages
+    agent_service._runner_cache.pop(test_user_id)
+    await service.process_chat(
+        test_user_id, ChatRequest(text="質問9: " + "予定" * 40), session_id=session_id
+    )
+
+    user_texts = [
+        part.text for content in sent[-1] if content.role == "user" for part in content.parts
+    ]
+    # Replayed turns the summary covers are dropped, every later one is sent
+    last_summarized = max(
+        int(index)
+        for _, transcript in summarizer.calls
+        for index in re.findall(r"質問(\d+):", transcript)
+    )
+    assert 1 <= last_summarized <= 7
+    assert user_texts[0] == SUMMARY_PREFIX + stored.summary
+    assert [text.split(":")[0] for text in user_texts[1:]] == [
+        f"質問{index}" for index in range(max(6, last_summarized + 1), 10)
+    ]
+    assert len(summarizer.calls) == calls
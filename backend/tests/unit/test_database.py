@@ -0,0 +1,46 @@
+"""
+Unit tests for shared database engine configuration.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.infrastructure.local import database
+from app.infrastructure.local.database import create_engine_from_settings
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """New connections get WAL, busy timeout and cache pragmas."""
+    engine = create_engine_from_settings(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    try:
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+
+        assert journal_mode == "wal"
+        assert busy_timeout == 5000
+        assert synchronous == 1  # NORMAL
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_engine_is_shared(monkeypatch, tmp_path):
+    """get_engine/get_session_factory return process-wide singletons."""
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_session_factory", None)
+    monkeypatch.setattr(
+        database,
+        "create_engine_from_settings",
+        lambda: create_engine_from_settings(f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}"),
+    )
+
+    engine = database.get_engine()
+    assert database.get_engine() is engine
+    assert database.get_session_factory() is database.get_session_factory()
+
+    await database.dispose_engine()
+    assert database._engine is None
+    assert database._session_factory is None
@@ -0,0 +1,78 @@
+"""
+Unit tests for the versioned migration runner.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.infrastructure.local.database import Base, create_engine_from_settings
+from app.infrastructure.local.migrations import LATEST_VERSION, run_migrations
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_engine_from_settings(f"sqlite+aiosqlite:///{tmp_path / 'migrate.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def _index_names(conn, table: str) -> set[str]:
+    result = await conn.execute(text(f"PRAGMA index_list({table})"))
+    return {row[1] for row in result}
+
+
+@pytest.mark.asyncio
+async def test_migrates_legacy_schema_and_records_version(engine):
+    """Legacy tasks table gets meeting columns, indexes and a version row."""
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE tasks (id VARCHAR(36) PRIMARY KEY, user_id VARCHAR(255), "
+            "project_id VARCHAR(36), title VARCHAR(500), status VARCHAR(20), "
+            "created_at DATETIME)"
+        ))
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(
+                sync_conn,
+                tables=[t for name, t in Base.metadata.tables.items() if name != "tasks"],
+            )
+        )
+
+    applied = await run_migrations(engine=engine)
+    assert applied == LATEST_VERSION
+
+    async with engine.connect() as conn:
+        columns = {row[1] for row in await conn.execute(text("PRAGMA table_info(tasks)"))}
+        assert {"start_time", "end_time", "is_fixed_time", "meeting_notes"} <= columns
+        assert "ix_tasks_user_status_created" in await _index_names(conn, "tasks")
+        assert "ix_agent_tasks_user_status_trigger" in await _index_names(conn, "agent_tasks")
+        assert "ix_chat_messages_session_user_created" in await _index_names(conn, "chat_messages")
+        version = (await conn.execute(text("SELECT MAX(version) FROM schema_version"))).scalar()
+        assert version == LATEST_VERSION
+
+
+@pytest.mark.asyncio
+async def test_current_database_skips_all_work(engine):
+    """A second run is a no-op once the schema is current."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    assert await run_migrations(engine=engine) == LATEST_VERSION
+    assert await run_migrations(engine=engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_task_list_query_uses_composite_index(engine):
+    """Status-filtered task listing is served by the composite index."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await run_migrations(engine=engine)
+
+    async with engine.connect() as conn:
+        plan = await conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM tasks "
+            "WHERE user_id = 'u' AND status = 'TODO' ORDER BY created_at DESC"
+        ))
+        details = " ".join(str(row[-1]) for row in plan)
+
+    assert "ix_tasks_user_status_created" in details
+    assert "TEMP B-TREE" not in details
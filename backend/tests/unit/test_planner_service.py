@@ -0,0 +1,41 @@
+"""
+Unit tests for PlannerService subtask creation.
+"""
+
+import pytest
+
+from app.infrastructure.local.fake_llm_provider import FakeLLMProvider
+from app.infrastructure.local.memory_repository import SqliteMemoryRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.models.breakdown import BreakdownStep, TaskBreakdown
+from app.models.task import TaskCreate
+from app.services.planner_service import PlannerService
+
+
+@pytest.mark.asyncio
+async def test_subtasks_only_depend_on_earlier_steps(session_factory, test_user_id):
+    """Test a cyclic breakdown is stored without the backward dependency."""
+    task_repo = SqliteTaskRepository(session_factory=session_factory)
+    service = PlannerService(
+        llm_provider=FakeLLMProvider(),
+        task_repo=task_repo,
+        memory_repo=SqliteMemoryRepository(session_factory=session_factory),
+    )
+    parent = await task_repo.create(test_user_id, TaskCreate(title="資料作成"))
+    breakdown = TaskBreakdown(
+        original_task_id=parent.id,
+        original_task_title=parent.title,
+        steps=[
+            BreakdownStep(step_number=1, title="構成", dependency_step_numbers=[2]),
+            BreakdownStep(step_number=2, title="執筆", dependency_step_numbers=[1]),
+            BreakdownStep(step_number=3, title="見直し", dependency_step_numbers=[2, 3, 9]),
+        ],
+        total_estimated_minutes=90,
+    )
+
+    first, second, third = await service._create_subtasks(test_user_id, parent, breakdown)
+
+    subtasks = {task.id: task for task in await task_repo.get_subtasks(test_user_id, parent.id)}
+    assert subtasks[first].dependency_ids == []
+    assert subtasks[second].dependency_ids == [first]
+    assert subtasks[third].dependency_ids == [second]
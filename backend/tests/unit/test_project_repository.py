@@ -0,0 +1,63 @@
+"""
+Unit tests for Project repository.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.models.enums import TaskStatus
+from app.models.project import ProjectCreate
+from app.models.task import TaskCreate, TaskUpdate
+
+
+async def _seed(session_factory, user_id):
+    project_repo = SqliteProjectRepository(session_factory=session_factory)
+    task_repo = SqliteTaskRepository(session_factory=session_factory)
+
+    busy = await project_repo.create(user_id, ProjectCreate(name="Busy"))
+    empty = await project_repo.create(user_id, ProjectCreate(name="Empty"))
+
+    statuses = [TaskStatus.DONE, TaskStatus.IN_PROGRESS, TaskStatus.TODO, TaskStatus.DONE]
+    for i, task_status in enumerate(statuses):
+        task = await task_repo.create(user_id, TaskCreate(title=f"Task {i}", project_id=busy.id))
+        if task_status != TaskStatus.TODO:
+            await task_repo.update(user_id, task.id, TaskUpdate(status=task_status))
+
+    # Another user's task in the same project must not be counted
+    await task_repo.create("other_user", TaskCreate(title="Foreign", project_id=busy.id))
+
+    return project_repo, busy, empty
+
+
+@pytest.mark.asyncio
+async def test_list_with_task_count(session_factory, test_user_id):
+    """Counts are aggregated per project, including empty projects."""
+    project_repo, busy, empty = await _seed(session_factory, test_user_id)
+
+    projects = {p.id: p for p in await project_repo.list_with_task_count(test_user_id)}
+
+    assert set(projects) == {busy.id, empty.id}
+    assert projects[busy.id].total_tasks == 4
+    assert projects[busy.id].completed_tasks == 2
+    assert projects[busy.id].in_progress_tasks == 1
+    assert projects[empty.id].total_tasks == 0
+    assert projects[empty.id].completed_tasks == 0
+
+
+@pytest.mark.asyncio
+async def test_get_with_task_count(session_factory, test_user_id):
+    """Single-project variant returns the same counts."""
+    project_repo, busy, _ = await _seed(session_factory, test_user_id)
+
+    project = await project_repo.get_with_task_count(test_user_id, busy.id)
+
+    assert project is not None
+    assert project.name == "Busy"
+    assert project.total_tasks == 4
+    assert project.completed_tasks == 2
+    assert project.in_progress_tasks == 1
+    assert await project_repo.get_with_task_count(test_user_id, uuid4()) is None
+    assert await project_repo.get_with_task_count("other_user", busy.id) is None
@@ -0,0 +1,58 @@
+"""
+Unit tests for the agent runner cache and session rehydration.
+"""
+
+import pytest
+
+from app.infrastructure.local.fake_llm_provider import FakeLLMProvider
+from app.models.chat import ChatRequest
+from app.services import agent_service
+from app.services.runner_cache import LruTtlCache
+
+
+def test_entries_are_evicted_by_lru_size_and_idle_ttl():
+    """Test the cache keeps at most max_entries and drops idle entries."""
+    now = [0.0]
+    cache = LruTtlCache(max_entries=2, idle_ttl_seconds=60, size_of=len, clock=lambda: now[0])
+
+    cache.put("a", "aaaa")
+    cache.put("b", "bb")
+    assert cache.get("a") == "aaaa"  # b is now least recently used
+    cache.put("c", "c")
+    assert cache.get("b") is None
+    assert cache.stats()["estimated_bytes"] == 5
+
+    now[0] = 30
+    assert cache.get("c") == "c"
+    now[0] = 75  # a idle for 75s, c for 45s
+    assert cache.peek("a") is None
+    assert cache.peek("c") == "c"
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["expirations"]) == (1, 1, 1)
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_evicted_users_session_is_rehydrated_from_stored_messages(agent_service_factory):
+    """Test a session continues with its stored history after the runner was evicted."""
+    user_id = "rehydrate-user"
+    service = agent_service_factory(FakeLLMProvider())
+
+    first = await service.process_chat(user_id, ChatRequest(text="会議は15時から"))
+    session_id = first.session_id
+    agent_service._runner_cache.pop(user_id)
+
+    await service.process_chat(user_id, ChatRequest(text="何時から?"), session_id=session_id)
+
+    runner = agent_service._runner_cache.peek(user_id)
+    session = await runner.session_service.get_session(
+        app_name=service.APP_NAME, user_id=user_id, session_id=session_id
+    )
+    texts = [event.content.parts[0].text for event in session.events if event.content]
+    assert texts == [
+        "会議は15時から",
+        "了解しました: 会議は15時から",
+        "何時から?",
+        "了解しました: 何時から?",
+    ]
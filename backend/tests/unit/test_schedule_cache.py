@@ -0,0 +1,168 @@
+"""
+Unit tests for the built schedule cache.
+"""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.api.tasks import get_today_view
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.infrastructure.snapshot_cache import SnapshotCache
+from app.models.enums import CreatedBy, TaskStatus
+from app.models.schedule import ScheduleResponse
+from app.models.task import Task, TaskCreate
+from app.services.schedule_cache import ScheduleCache, ScheduleParams
+from app.services.scheduler_service import SchedulerService
+
+START = date(2026, 3, 2)
+
+
+def _builder(builds: list[ScheduleParams], params: ScheduleParams):
+    async def build() -> ScheduleResponse:
+        builds.append(params)
+        return ScheduleResponse(
+            start_date=params.start_date,
+            days=[],
+            tasks=[],
+            unscheduled_task_ids=[],
+            excluded_tasks=[],
+        )
+
+    return build
+
+
+@pytest.mark.asyncio
+async def test_schedule_cache_shares_builds_until_write():
+    """Test identical and today-only requests share one build per data version."""
+    snapshots = SnapshotCache()
+    cache = ScheduleCache(snapshots.version)
+    builds: list[ScheduleParams] = []
+    full = ScheduleParams.create(START, None, None, max_days=60)
+    today_only = ScheduleParams.create(START, None, None, max_days=30, until=START)
+    assert today_only.horizon_days == 1
+
+    first = await cache.get_or_build("u1", full, _builder(builds, full))
+    assert await cache.get_or_build("u1", full, _builder(builds, full)) is first
+    # A today view can read the first day of the full schedule
+    assert await cache.get_or_build("u1", today_only, _builder(builds, today_only), days_only=True) is first
+    # ...but a caller reading the whole response cannot
+    await cache.get_or_build("u1", today_only, _builder(builds, today_only))
+    # Other parameters and other users are separate entries
+    other_capacity = ScheduleParams.create(START, 6.0, None, max_days=60)
+    await cache.get_or_build("u1", other_capacity, _builder(builds, other_capacity))
+    await cache.get_or_build("u2", full, _builder(builds, full))
+    assert len(builds) == 4
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    snapshots.invalidate("u1")
+    await cache.get_or_build("u1", today_only, _builder(builds, today_only), days_only=True)
+    await cache.get_or_build("u2", full, _builder(builds, full))
+    assert builds[-1] == today_only
+    assert len(builds) == 5
+
+
+@pytest.mark.asyncio
+async def test_schedule_cache_evicts_lru_and_skips_racing_writes():
+    """Test the size bound and that a build overlapping a write is not stored."""
+    snapshots = SnapshotCache()
+    cache = ScheduleCache(snapshots.version, max_entries=2)
+    builds: list[ScheduleParams] = []
+    params = [ScheduleParams.create(START, float(hours), None, max_days=30) for hours in (4, 6, 8)]
+
+    for item in params:
+        await cache.get_or_build("u1", item, _builder(builds, item))
+    assert cache.stats()["entries"] == 2
+    assert cache.evictions == 1
+    await cache.get_or_build("u1", params[0], _builder(builds, params[0]))
+    assert len(builds) == 4
+
+    racing = ScheduleParams.create(START, 2.0, None, max_days=30)
+
+    async def build_during_write() -> ScheduleResponse:
+        snapshots.invalidate("u1")
+        return await _builder(builds, racing)()
+
+    await cache.get_or_build("u1", racing, build_during_write)
+    await cache.get_or_build("u1", racing, _builder(builds, racing))
+    assert builds[-2:] == [racing, racing]
+
+
+@pytest.mark.asyncio
+async def test_schedule_cache_keeps_runs_to_resume_from_after_write():
+    """Test a stored run stays available as the base of the next build."""
+    snapshots = SnapshotCache()
+    cache = ScheduleCache(snapshots.version)
+    service = SchedulerService()
+    params = ScheduleParams.create(START, None, None, max_days=30)
+    tasks = [
+        Task(
+            id=uuid4(),
+            user_id="u1",
+            title=f"Task {i}",
+            estimated_minutes=240,
+            created_by=CreatedBy.USER,
+            created_at=datetime(2026, 1, 1, 0, i),
+            updated_at=datetime(2026, 1, 1),
+        )
+        for i in range(6)
+    ]
+
+    async def build():
+        return service.build_schedule_run(
+            tasks,
+            start_date=START,
+            max_days=params.horizon_days,
+            previous=cache.previous_run("u1", params),
+        )
+
+    first = await cache.get_or_build("u1", params, build)
+    assert isinstance(first, ScheduleResponse)
+    assert cache.previous_run("u1", params).response is first
+
+    snapshots.invalidate("u1")
+    tasks[-1] = tasks[-1].model_copy(update={"status": TaskStatus.DONE})
+    second = await cache.get_or_build("u1", params, build)
+    assert second == service.build_schedule(tasks, start_date=START, max_days=30)
+    assert cache.previous_run("u1", params).resumed_day == 2
+
+
+class _CountingTaskRepository(SqliteTaskRepository):
+    def __init__(self, session_factory):
+        super().__init__(session_factory)
+        self.scans = 0
+
+    def iter_tasks(self, *args, **kwargs):
+        self.scans += 1
+        return super().iter_tasks(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_today_view_loads_tasks_once_per_request(session_factory, test_user_id):
+    """Test a cache miss builds the schedule and the view from one task scan."""
+    repo = _CountingTaskRepository(session_factory)
+    project_repo = SqliteProjectRepository(session_factory)
+    for i in range(3):
+        await repo.create(test_user_id, TaskCreate(title=f"Task {i}", estimated_minutes=120))
+    cache = ScheduleCache(SnapshotCache().version)
+    service = SchedulerService()
+    params = ScheduleParams.create(START, None, None, max_days=30, until=START)
+
+    async def today_view():
+        return await get_today_view(
+            cache, service, repo, project_repo, test_user_id, params, ComputeExecutor("inline")
+        )
+
+    built = await today_view()
+    assert (repo.scans, cache.misses) == (1, 1)
+    cached = await today_view()
+    assert (repo.scans, cache.hits) == (2, 1)
+
+    tasks = await repo.list(test_user_id, include_done=True)
+    expected = service.get_today_tasks(
+        service.build_schedule(tasks, start_date=START, max_days=1), tasks, today=START
+    )
+    assert built == cached == expected
@@ -2,6 +2,7 @@
 Unit tests for SchedulerService.
 """
 
+import random
 from datetime import datetime, timedelta, date
 from uuid import uuid4
 
@@ -9,7 +10,8 @@ import pytest
 
 from app.models.task import Task
 from app.models.enums import TaskStatus, Priority, EnergyLevel, CreatedBy
-from app.services.scheduler_service import SchedulerService
+from app.services.scheduler_service import SchedulerService, _ReadyQueue
+from app.services.task_utils import MeetingIndex, SubtaskIndex, get_effective_estimated_minutes, is_parent_task
 
 
 def make_task(
@@ -104,5 +106,199 @@ def test_energy_balance_prefers_low_when_high_is_over_ratio():
     scores = {task_high.id: 100.0, task_low.id: 10.0}
     energy_minutes = {EnergyLevel.HIGH: 60, EnergyLevel.LOW: 0}
 
-    picked = service._pick_next_task([task_high.id, task_low.id], scores, task_map, energy_minutes)
-    assert picked == task_low.id
+    queue = _ReadyQueue(task_map, scores.__getitem__)
+    queue.add(task_high.id)
+    queue.add(task_low.id)
+
+    assert queue.peek(None) == task_high.id
+    assert queue.peek(service._preferred_energy(energy_minutes)) == task_low.id
+
+
+def test_subtask_index_drives_parent_exclusion_and_estimates():
+    service = SchedulerService()
+    parent = make_task("Parent", estimated_minutes=300)
+    child_a = make_task("Child A", estimated_minutes=20).model_copy(update={"parent_id": parent.id})
+    child_b = make_task("Child B", estimated_minutes=None).model_copy(update={"parent_id": parent.id})
+    tasks = [parent, child_a, child_b]
+
+    index = SubtaskIndex(tasks)
+    assert is_parent_task(parent, index) is is_parent_task(parent, tasks) is True
+    assert is_parent_task(child_a, index) is False
+    assert get_effective_estimated_minutes(parent, index) == 20
+    assert get_effective_estimated_minutes(parent, tasks) == 20
+    assert get_effective_estimated_minutes(child_a, index) == 20
+
+    schedule = service.build_schedule(tasks, start_date=date.today(), subtask_index=index)
+
+    assert [item.task_id for item in schedule.excluded_tasks] == [parent.id]
+    assert {item.task_id for item in schedule.tasks} == {child_a.id, child_b.id}
+
+
+def test_ready_queue_rekeys_dated_tasks_per_day():
+    today = date.today()
+    undated = make_task("Undated")
+    dated = make_task("Dated", due_date=datetime.combine(today + timedelta(days=3), datetime.min.time()))
+    task_map = {undated.id: undated, dated.id: dated}
+
+    def score_on(day: date):
+        base = {undated.id: 20.0, dated.id: 10.0}
+        return lambda task_id: base[task_id] + SchedulerService._calculate_due_bonus(task_map[task_id], day)
+
+    queue = _ReadyQueue(task_map, score_on(today - timedelta(days=30)))
+    queue.add(undated.id)
+    queue.add(dated.id)
+    # No due bonus yet far from the due date
+    assert queue.peek() == undated.id
+    assert queue.due_by(today) == []
+
+    queue.reprioritize(score_on(today))
+    assert queue.peek() == dated.id
+    assert queue.due_by(today + timedelta(days=3)) == [dated.id]
+
+    queue.discard(dated.id)
+    assert queue.peek() == undated.id
+    assert queue.due_by(today + timedelta(days=3)) == []
+    assert len(queue) == 1
+
+
+def make_meeting(title: str, start: datetime, minutes: int) -> Task:
+    return make_task(title).model_copy(
+        update={"is_fixed_time": True, "start_time": start, "end_time": start + timedelta(minutes=minutes)}
+    )
+
+
+def test_meeting_index_day_and_range_queries():
+    day = date(2026, 3, 2)
+
+    def at(offset: int, hour: int, minute: int = 0) -> datetime:
+        return datetime(day.year, day.month, day.day, hour, minute) + timedelta(days=offset)
+
+    late = make_meeting("Late", at(0, 15), 60)
+    early = make_meeting("Early", at(0, 9), 60)
+    overlapping = make_meeting("Overlapping", at(0, 9, 30), 60)
+    next_week = make_meeting("Next week", at(7, 10), 30)
+    index = MeetingIndex([late, make_task("Not a meeting"), early, overlapping, next_week])
+
+    meetings, busy = index.for_day(day)
+    assert [m.title for m in meetings] == ["Early", "Overlapping", "Late"]
+    assert busy == 90 + 60
+    assert index.for_day(day + timedelta(days=1)) == ([], 0)
+    assert [m.title for m in index.between(day, day + timedelta(days=7))] == ["Early", "Overlapping", "Late"]
+    assert index.busy_minutes_between(day, day + timedelta(days=8)) == {day: 150, day + timedelta(days=7): 30}
+
+
+def test_until_matches_prefix_of_full_schedule_and_skips_empty_days():
+    service = SchedulerService()
+    start = date(2026, 3, 6)  # Friday
+    due = datetime.combine(start + timedelta(days=4), datetime.min.time())
+    tasks = [make_task(f"Task {i}", estimated_minutes=120, due_date=due if i % 3 == 0 else None) for i in range(12)]
+    weekly = [0, 8, 8, 8, 8, 8, 0]  # No capacity on weekends
+
+    full = service.build_schedule(tasks, start_date=start, capacity_by_weekday=weekly, max_days=30)
+    today_only = service.build_schedule(
+        tasks, start_date=start, capacity_by_weekday=weekly, max_days=30, until=start
+    )
+
+    assert today_only.days == full.days[:1]
+    assert {item.reason for item in today_only.unscheduled_task_ids} == {"max_days_exceeded"}
+    weekend = full.days[1:3]
+    assert [day.date.weekday() for day in weekend] == [5, 6]
+    assert all(day.allocated_minutes == 0 and day.capacity_minutes == 0 for day in weekend)
+    assert full.days[3].allocated_minutes > 0
+
+
+def _random_tasks(rnd: random.Random, start: date, count: int) -> list[Task]:
+    tasks: list[Task] = []
+    for i in range(count):
+        task = make_task(
+            f"Task {i}",
+            status=rnd.choice([TaskStatus.TODO] * 4 + [TaskStatus.IN_PROGRESS, TaskStatus.DONE]),
+            importance=rnd.choice(list(Priority)),
+            energy_level=rnd.choice(list(EnergyLevel)),
+            estimated_minutes=rnd.choice([None, 15, 60, 120, 240]),
+            due_date=(
+                datetime.combine(start + timedelta(days=rnd.randint(-2, 30)), datetime.min.time())
+                if rnd.random() < 0.4
+                else None
+            ),
+            dependency_ids=[rnd.choice(tasks).id] if tasks and rnd.random() < 0.2 else [],
+        ).model_copy(update={"created_at": datetime(2026, 1, 1) + timedelta(minutes=i)})
+        if rnd.random() < 0.05:
+            meeting_start = datetime.combine(start + timedelta(days=rnd.randint(0, 20)), datetime.min.time())
+            task = make_meeting(task.title, meeting_start + timedelta(hours=rnd.randint(8, 17)), 60)
+        tasks.append(task)
+    return tasks
+
+
+def _random_edit(rnd: random.Random, tasks: list[Task], start: date) -> list[Task]:
+    tasks = list(tasks)
+    index = rnd.randrange(len(tasks))
+    task = tasks[index]
+    day = datetime.combine(start + timedelta(days=rnd.randint(0, 20)), datetime.min.time())
+    kind = rnd.choice(["done", "estimate", "due", "importance", "dependency", "delete", "new", "meeting"])
+    if kind == "delete":
+        del tasks[index]
+        return tasks
+    if kind == "new":
+        tasks.append(make_task("New", estimated_minutes=rnd.choice([30, 90]), dependency_ids=[task.id]))
+        return tasks
+    update = {
+        "done": {"status": TaskStatus.DONE},
+        "estimate": {"estimated_minutes": rnd.choice([None, 15, 90, 480])},
+        "due": {"due_date": day},
+        "importance": {"importance": rnd.choice(list(Priority)), "energy_level": rnd.choice(list(EnergyLevel))},
+        "dependency": {"dependency_ids": task.dependency_ids + [rnd.choice(tasks).id]},
+        "meeting": {
+            "is_fixed_time": True,
+            "start_time": day + timedelta(hours=10),
+            "end_time": day + timedelta(hours=12),
+        },
+    }[kind]
+    tasks[index] = task.model_copy(update=update)
+    return tasks
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize(
+    "horizon", [{"max_days": 10}, {"max_days": 40}, {"max_days": 3}, {"max_days": 1}, {"until": 0}]
+)
+def test_incremental_schedule_run_matches_full_rebuild(seed, horizon):
+    service = SchedulerService()
+    rnd = random.Random(seed)
+    start = date(2026, 3, 2)
+    options = {"start_date": start, "capacity_by_weekday": [0, 4, 4, 4, 4, 4, 0], **horizon}
+    if "until" in horizon:
+        options["until"] = start + timedelta(days=horizon["until"])
+    tasks = _random_tasks(rnd, start, 60)
+
+    run = service.build_schedule_run(tasks, **options)
+    assert run.response == service.build_schedule(tasks, **options)
+    assert run.resumed_day is None
+
+    resumed = []
+    for _ in range(40):
+        tasks = _random_edit(rnd, tasks, start)
+        run = service.build_schedule_run(tasks, previous=run, **options)
+        assert run.response == service.build_schedule(tasks, **options)
+        resumed.append(run.resumed_day)
+    # Most edits don't touch the first day
+    assert sum(1 for day in resumed if day) > len(resumed) // 2
+
+
+@pytest.mark.parametrize("horizon", [{"max_days": 1}, {"until": date(2026, 3, 2)}])
+def test_resumed_run_ending_at_horizon_keeps_max_days_reason(horizon):
+    service = SchedulerService()
+    options = {"start_date": date(2026, 3, 2), **horizon}
+    first = make_task("First", estimated_minutes=60)
+    second = make_task("Second", estimated_minutes=60, dependency_ids=[first.id])
+    first = first.model_copy(update={"dependency_ids": [second.id]})
+    tasks = [first, second, make_task("Free", estimated_minutes=60)]
+
+    # The cycle empties the pools on the last day: the run ends at the horizon
+    run = service.build_schedule_run(tasks, **options)
+    tasks[0] = first.model_copy(update={"estimated_minutes": 90})
+    run = service.build_schedule_run(tasks, previous=run, **options)
+
+    assert run.resumed_day == 1
+    assert run.response == service.build_schedule(tasks, **options)
+    assert {item.reason for item in run.response.unscheduled_task_ids} == {"max_days_exceeded"}
@@ -0,0 +1,77 @@
+"""
+Unit tests for the vectorized scoring kernel.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.models.enums import CreatedBy, EnergyLevel, Priority, TaskStatus
+from app.models.task import Task
+from app.services.scheduler_service import SchedulerService
+from app.services.scoring import TOP3_DUE_CURVE, TaskScoreArrays
+from app.services.top3_service import Top3Service
+
+
+def _random_tasks(seed: int, count: int) -> tuple[list[Task], dict]:
+    rnd = random.Random(seed)
+    today = date.today()
+    projects = [uuid4() for _ in range(3)]
+    return [
+        Task(
+            id=uuid4(),
+            user_id="test_user",
+            title=f"Task {i}",
+            status=rnd.choice(list(TaskStatus)),
+            importance=rnd.choice(list(Priority)),
+            urgency=rnd.choice(list(Priority)),
+            energy_level=rnd.choice(list(EnergyLevel)),
+            project_id=rnd.choice(projects + [None]),
+            due_date=(
+                datetime.combine(today + timedelta(days=rnd.randint(-5, 40)), datetime.min.time())
+                + timedelta(hours=rnd.randint(0, 23))
+                if rnd.random() < 0.6
+                else None
+            ),
+            created_by=CreatedBy.USER,
+            created_at=datetime(2026, 1, 1) + timedelta(minutes=rnd.randint(0, 5)),
+            updated_at=datetime(2026, 1, 1),
+        )
+        for i in range(count)
+    ], {project: rnd.randint(1, 10) for project in projects[:2]}
+
+
+def test_scheduler_scores_match_scalar_scoring():
+    service = SchedulerService()
+    tasks, priorities = _random_tasks(1, 200)
+    arrays = TaskScoreArrays(tasks, priorities)
+
+    base = arrays.scheduler_base_scores(service.project_priority_weight)
+    assert base.tolist() == [service._calculate_base_score(task, priorities) for task in tasks]
+
+    days = [date.today() + timedelta(days=offset) for offset in range(-3, 30)]
+    bonuses = arrays.due_bonus(days, SchedulerService.DUE_BONUS_CURVE)
+    assert bonuses.shape == (len(days), len(tasks))
+    for day, row in zip(days, bonuses):
+        assert row.tolist() == [service._calculate_due_bonus(task, day) for task in tasks]
+
+    # Ranking matches the (score desc, due date, created_at) sort
+    scores = base + bonuses[3]
+    expected = sorted(
+        range(len(tasks)),
+        key=lambda i: (-scores[i], tasks[i].due_date or datetime.max, tasks[i].created_at),
+    )
+    assert arrays.rank(scores).tolist() == expected
+
+
+def test_top3_scores_match_scalar_scoring():
+    service = Top3Service(task_repo=AsyncMock())
+    tasks, _ = _random_tasks(2, 200)
+
+    scores = TaskScoreArrays(tasks).top3_scores(date.today())
+
+    assert scores.tolist() == [service._calculate_base_score(task) for task in tasks]
+    assert [TOP3_DUE_CURVE.bonus(days) for days in (-9, -1, 0, 1, 2, 7, 8, 14, 15, 99)] == [
+        30, 30, 25, 20, 10, 10, 5, 5, 0, 0
+    ]
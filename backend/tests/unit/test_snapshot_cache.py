@@ -0,0 +1,160 @@
+"""
+Unit tests for the per-user snapshot cache.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.local.database import Base, create_engine_from_settings
+from app.infrastructure.local.migrations import run_migrations
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.infrastructure.local.today_plan_repository import SqliteTodayPlanRepository
+from app.infrastructure.snapshot_cache import (
+    CachedProjectRepository,
+    CachedTaskRepository,
+    SnapshotCache,
+)
+from app.models.project import ProjectCreate
+from app.models.task import TaskCreate, TaskFilters, TaskUpdate
+
+
+async def _all_tasks(repo, user_id, filters=None):
+    return [task async for batch in repo.iter_tasks(user_id, filters) for task in batch]
+
+
+@pytest.mark.asyncio
+async def test_task_snapshot_hits_until_write(session_factory, test_user_id):
+    """Test repeated scans are cached and writes invalidate exactly."""
+    cache = SnapshotCache()
+    repo = CachedTaskRepository(SqliteTaskRepository(session_factory=session_factory), cache)
+    task = await repo.create(test_user_id, TaskCreate(title="First"))
+
+    assert len(await _all_tasks(repo, test_user_id)) == 1
+    assert len(await _all_tasks(repo, test_user_id)) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Another user's write does not invalidate this user's snapshot
+    await repo.create("other_user", TaskCreate(title="Foreign"))
+    await _all_tasks(repo, test_user_id)
+    assert cache.hits == 2
+
+    await repo.update(test_user_id, task.id, TaskUpdate(title="Renamed"))
+    [reloaded] = await _all_tasks(repo, test_user_id)
+    assert reloaded.title == "Renamed"
+    assert cache.misses == 2
+
+    # Filtered scans bypass the snapshot
+    await _all_tasks(repo, test_user_id, TaskFilters(include_done=False))
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_task_writes_invalidate_project_snapshots(session_factory, test_user_id):
+    """Test project task counts are reloaded after a task write."""
+    cache = SnapshotCache()
+    task_repo = CachedTaskRepository(SqliteTaskRepository(session_factory=session_factory), cache)
+    project_repo = CachedProjectRepository(
+        SqliteProjectRepository(session_factory=session_factory), cache
+    )
+    project = await project_repo.create(test_user_id, ProjectCreate(name="Project"))
+
+    [before] = await project_repo.list_with_task_count(test_user_id)
+    assert before.total_tasks == 0
+
+    await task_repo.create(test_user_id, TaskCreate(title="Task", project_id=project.id))
+    [after] = await project_repo.list_with_task_count(test_user_id)
+    assert after.total_tasks == 1
+
+
+@pytest.mark.asyncio
+async def test_stored_data_version_invalidates_writes_from_other_processes():
+    """Test a write outside this cache (another worker, a script) drops the snapshots."""
+    stored = {"user": 0}
+
+    async def data_version(user_id):
+        return stored[user_id]
+
+    cache = SnapshotCache(data_version=data_version)
+    loads = []
+
+    async def loader():
+        loads.append(stored["user"])
+        return f"v{stored['user']}"
+
+    assert await cache.get_or_load("user", "key", loader) == "v0"
+    assert await cache.get_or_load("user", "key", loader) == "v0"
+    version = await cache.version("user")
+
+    stored["user"] += 1
+    assert await cache.version("user") != version
+    assert await cache.get_or_load("user", "key", loader) == "v1"
+    assert loads == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_writes_from_another_worker_invalidate_through_triggers(tmp_path):
+    """Test the data version triggers expose a write made without this cache."""
+    engine = create_engine_from_settings(f"sqlite+aiosqlite:///{tmp_path / 'workers.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Migration 4 installs the data version triggers
+    await run_migrations(engine=engine)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    cache = SnapshotCache(data_version=SqliteTodayPlanRepository(factory).get_data_version)
+    cached = CachedTaskRepository(SqliteTaskRepository(factory), cache)
+    other_worker = SqliteTaskRepository(factory)
+
+    await cached.create("u1", TaskCreate(title="First"))
+    assert len(await _all_tasks(cached, "u1")) == 1
+    await other_worker.create("u1", TaskCreate(title="Second"))
+    assert len(await _all_tasks(cached, "u1")) == 2
+    assert (cache.hits, cache.misses) == (0, 2)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_loaded_during_write_is_not_cached():
+    """Test a load racing with a write is returned but not stored."""
+    cache = SnapshotCache()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return "stale"
+
+    load = asyncio.create_task(cache.get_or_load("user", "key", slow_loader))
+    await started.wait()
+    cache.invalidate("user")
+    release.set()
+    assert await load == "stale"
+
+    async def fresh_loader():
+        return "fresh"
+
+    assert await cache.get_or_load("user", "key", fresh_loader) == "fresh"
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_evicts_least_recently_used_user():
+    """Test the cache keeps at most max_users users."""
+    cache = SnapshotCache(max_users=2)
+
+    async def loader():
+        return "value"
+
+    await cache.get_or_load("a", "key", loader)
+    await cache.get_or_load("b", "key", loader)
+    await cache.get_or_load("a", "key", loader)
+    await cache.get_or_load("c", "key", loader)
+
+    assert cache.stats()["users"] == 2
+    assert cache.evictions == 1
+    await cache.get_or_load("b", "key", loader)
+    assert cache.misses == 4
@@ -0,0 +1,63 @@
+"""
+Unit tests for chat stream text coalescing.
+"""
+
+import pytest
+
+from app.services.stream_coalescer import coalesce_text_chunks
+
+
+async def _stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(chunks, **kwargs):
+    return [chunk async for chunk in coalesce_text_chunks(_stream(chunks), **kwargs)]
+
+
+def _text(content):
+    return {"chunk_type": "text", "content": content}
+
+
+@pytest.mark.asyncio
+async def test_text_is_merged_by_size_and_flushed_before_other_chunks():
+    """Test runs of text are sent per flush_chars and never reordered around tools."""
+    tool = {"chunk_type": "tool_start", "tool_name": "create_task", "tool_args": {}}
+    done = {"chunk_type": "done", "assistant_message": "abcdefghij"}
+
+    result = await _collect(
+        [*map(_text, "abcde"), tool, *map(_text, "fghij"), done],
+        flush_ms=0,
+        flush_chars=3,
+    )
+
+    assert result == [_text("abc"), _text("de"), tool, _text("fgh"), _text("ij"), done]
+
+
+@pytest.mark.asyncio
+async def test_text_is_flushed_after_the_time_window():
+    """Test buffered text is sent once its oldest part waited flush_ms."""
+    now = [0.0]
+
+    async def ticking():
+        for char in "abcdef":
+            yield _text(char)
+            now[0] += 0.015
+
+    result = [
+        chunk
+        async for chunk in coalesce_text_chunks(
+            ticking(), flush_ms=40, flush_chars=64, clock=lambda: now[0]
+        )
+    ]
+
+    assert result == [_text("abcd"), _text("ef")]
+
+
+@pytest.mark.asyncio
+async def test_single_char_limit_passes_chunks_through():
+    """Test flush_chars=1 disables coalescing."""
+    chunks = [_text("ab"), _text(""), _text("c")]
+
+    assert await _collect(chunks, flush_chars=1) == chunks
@@ -8,7 +8,7 @@ from uuid import uuid4
 
 from app.infrastructure.local.task_repository import SqliteTaskRepository
 from app.infrastructure.local.database import get_session_factory
-from app.models.task import TaskCreate
+from app.models.task import TASK_FIELDS, TaskCreate, TaskSummary
 from app.models.enums import Priority, EnergyLevel, CreatedBy, TaskStatus
 
 
@@ -173,3 +173,202 @@ async def test_find_similar_tasks(session_factory, test_user_id):
     assert len(similar) >= 1
     assert similar[0].similarity_score >= 0.8
 
+
+
+@pytest.mark.asyncio
+async def test_create_many_resolves_batch_dependencies(session_factory, test_user_id):
+    """Test bulk create resolves sibling dependencies inside the batch."""
+    from app.models.task import TaskBatchCreate
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+
+    created = await repo.create_many(
+        test_user_id,
+        [
+            TaskBatchCreate(title="Step 1"),
+            TaskBatchCreate(title="Step 2", batch_dependency_indexes=[0]),
+            TaskBatchCreate(title="Step 3", batch_dependency_indexes=[0, 1]),
+        ],
+    )
+
+    assert [task.title for task in created] == ["Step 1", "Step 2", "Step 3"]
+    assert created[1].dependency_ids == [created[0].id]
+    assert created[2].dependency_ids == [created[0].id, created[1].id]
+    assert all(task.status == TaskStatus.TODO for task in created)
+
+    stored = await repo.get(test_user_id, created[2].id)
+    assert stored.dependency_ids == [created[0].id, created[1].id]
+
+    # Newest-first listing keeps batch order (reversed)
+    listed = await repo.list(test_user_id)
+    assert [task.title for task in listed] == ["Step 3", "Step 2", "Step 1"]
+
+
+@pytest.mark.asyncio
+async def test_create_many_rejects_invalid_batch_index(session_factory, test_user_id):
+    """Test bulk create validates batch dependency indexes."""
+    from app.core.exceptions import ValidationError
+    from app.models.task import TaskBatchCreate
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+
+    with pytest.raises(ValidationError):
+        await repo.create_many(
+            test_user_id,
+            [TaskBatchCreate(title="Only", batch_dependency_indexes=[3])],
+        )
+    assert await repo.count(test_user_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_many_and_delete_many(session_factory, test_user_id):
+    """Test bulk update cascades status and bulk delete removes tasks."""
+    from app.core.exceptions import NotFoundError
+    from app.models.task import TaskUpdate
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+
+    parent = await repo.create(test_user_id, TaskCreate(title="Parent"))
+    child = await repo.create(test_user_id, TaskCreate(title="Child", parent_id=parent.id))
+    other = await repo.create(test_user_id, TaskCreate(title="Other"))
+
+    updated = await repo.update_many(
+        test_user_id,
+        {
+            parent.id: TaskUpdate(status=TaskStatus.DONE),
+            other.id: TaskUpdate(title="Renamed"),
+        },
+    )
+
+    assert [task.id for task in updated] == [parent.id, other.id]
+    assert updated[0].status == TaskStatus.DONE
+    assert updated[1].title == "Renamed"
+    assert (await repo.get(test_user_id, child.id)).status == TaskStatus.DONE
+
+    with pytest.raises(NotFoundError):
+        await repo.update_many(
+            test_user_id,
+            {other.id: TaskUpdate(title="Again"), uuid4(): TaskUpdate(title="Missing")},
+        )
+    assert (await repo.get(test_user_id, other.id)).title == "Renamed"
+
+    deleted = await repo.delete_many(test_user_id, [parent.id, child.id, uuid4()])
+    assert deleted == 2
+    assert await repo.count(test_user_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_keyset_pagination(session_factory, test_user_id):
+    """Test cursor pagination walks every task exactly once."""
+    from app.core.exceptions import ValidationError
+    from app.core.pagination import next_cursor
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    await repo.create_many(test_user_id, [TaskCreate(title=f"Task {i}") for i in range(7)])
+
+    seen = []
+    after = None
+    while True:
+        page = await repo.list(test_user_id, limit=3, after=after)
+        seen.extend(task.id for task in page)
+        after = next_cursor(page, 3)
+        if after is None:
+            break
+
+    all_tasks = await repo.list(test_user_id, limit=100)
+    assert seen == [task.id for task in all_tasks]
+    assert len(set(seen)) == 7
+
+    with pytest.raises(ValidationError):
+        await repo.list(test_user_id, after="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_iter_tasks_streams_all_batches(session_factory, test_user_id):
+    """Test streaming scan yields every task in bounded batches."""
+    from app.models.task import TaskFilters, TaskUpdate
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    created = await repo.create_many(
+        test_user_id, [TaskCreate(title=f"Task {i}") for i in range(5)]
+    )
+    await repo.update(test_user_id, created[0].id, TaskUpdate(status=TaskStatus.DONE))
+
+    batches = [batch async for batch in repo.iter_tasks(test_user_id, batch_size=2)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [task.title for batch in batches for task in batch] == [
+        "Task 4", "Task 3", "Task 2", "Task 1", "Task 0",
+    ]
+
+    open_tasks = [
+        task
+        async for batch in repo.iter_tasks(test_user_id, TaskFilters(include_done=False))
+        for task in batch
+    ]
+    assert len(open_tasks) == 4
+
+
+@pytest.mark.asyncio
+async def test_list_with_field_projection(session_factory, test_user_id):
+    """Test projected list loads only requested fields."""
+    from app.core.exceptions import ValidationError
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    created = await repo.create(
+        test_user_id,
+        TaskCreate(title="Lean", description="Long description", meeting_notes="Notes"),
+    )
+
+    [task] = await repo.list_summaries(test_user_id, ["title", "status"])
+    assert isinstance(task, TaskSummary)
+    assert task.id == created.id
+    assert task.title == "Lean"
+    assert task.status == TaskStatus.TODO
+    assert task.model_fields_set == {"id", "created_at", "title", "status"}
+    # Heavy text columns and required Task fields are not loaded
+    assert task.description is None
+    assert task.meeting_notes is None
+    assert task.user_id is None
+
+    [full] = await repo.list(test_user_id)
+    assert full == created
+    assert full.model_fields_set == set(TASK_FIELDS)
+    assert full.user_id == test_user_id
+
+    with pytest.raises(ValidationError):
+        await repo.list_summaries(test_user_id, ["title", "bogus"])
+
+
+@pytest.mark.asyncio
+async def test_status_cascade_reaches_whole_subtree(session_factory, test_user_id):
+    """Test status changes propagate to grandchildren and report row counts."""
+    from app.models.task import TaskUpdate
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    root = await repo.create(test_user_id, TaskCreate(title="Root"))
+    child = await repo.create(test_user_id, TaskCreate(title="Child", parent_id=root.id))
+    grandchild = await repo.create(
+        test_user_id, TaskCreate(title="Grandchild", parent_id=child.id)
+    )
+    sibling = await repo.create(test_user_id, TaskCreate(title="Sibling"))
+
+    await repo.update(test_user_id, root.id, TaskUpdate(status=TaskStatus.DONE))
+    assert (await repo.get(test_user_id, grandchild.id)).status == TaskStatus.DONE
+    assert (await repo.get(test_user_id, sibling.id)).status == TaskStatus.TODO
+
+    affected = await repo.cascade_status(test_user_id, root.id, TaskStatus.IN_PROGRESS)
+    assert affected == 2
+    assert (await repo.get(test_user_id, root.id)).status == TaskStatus.DONE
+    assert (await repo.get(test_user_id, child.id)).status == TaskStatus.IN_PROGRESS
+    assert (await repo.get(test_user_id, grandchild.id)).status == TaskStatus.IN_PROGRESS
+
+    # Explicit status in a batch update shields that subtree from the cascade
+    await repo.update_many(
+        test_user_id,
+        {
+            root.id: TaskUpdate(status=TaskStatus.DONE),
+            child.id: TaskUpdate(status=TaskStatus.WAITING),
+        },
+    )
+    assert (await repo.get(test_user_id, child.id)).status == TaskStatus.WAITING
+    assert (await repo.get(test_user_id, grandchild.id)).status == TaskStatus.WAITING
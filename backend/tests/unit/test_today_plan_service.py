@@ -0,0 +1,90 @@
+"""
+Unit tests for precomputed today plans.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.compute_executor import ComputeExecutor
+from app.infrastructure.local.database import Base, create_engine_from_settings
+from app.infrastructure.local.migrations import run_migrations
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.infrastructure.local.today_plan_repository import SqliteTodayPlanRepository
+from app.models.enums import Priority
+from app.models.project import ProjectCreate
+from app.models.task import TaskCreate, TaskUpdate
+from app.services.scheduler_service import SchedulerService
+from app.services.today_plan_service import TodayPlanService
+
+PLAN_DATE = date(2026, 3, 2)
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_engine_from_settings(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Migration 4 installs the data version triggers
+    await run_migrations(engine=engine)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_precomputed_plans_are_served_until_the_users_data_changes(session_factory):
+    """Test plans match an on-demand build and go stale on that user's writes only."""
+    tasks = SqliteTaskRepository(session_factory)
+    projects = SqliteProjectRepository(session_factory)
+    plans = SqliteTodayPlanRepository(session_factory)
+    service = TodayPlanService(plans, tasks, projects, ComputeExecutor("inline"))
+
+    project = await projects.create("u1", ProjectCreate(name="Launch", priority=9))
+    created = []
+    for user_id in ("u1", "u2"):
+        for i in range(4):
+            created.append(
+                await tasks.create(
+                    user_id,
+                    TaskCreate(
+                        title=f"{user_id} task {i}",
+                        project_id=project.id if user_id == "u1" and i % 2 else None,
+                        importance=Priority.HIGH if i == 3 else Priority.MEDIUM,
+                        estimated_minutes=90,
+                        due_date=datetime.combine(PLAN_DATE, datetime.min.time())
+                        + timedelta(days=i),
+                    ),
+                )
+            )
+
+    summary = await service.precompute_all(PLAN_DATE)
+    assert (summary["users"], summary["computed"], summary["failed"]) == (2, 2, 0)
+
+    # Same result as the on-demand path of /api/tasks/today
+    scheduler = SchedulerService()
+    u1_tasks = await tasks.list("u1", include_done=True)
+    priorities = {project.id: project.priority}
+    expected = scheduler.get_today_tasks(
+        scheduler.build_schedule(
+            u1_tasks, project_priorities=priorities, start_date=PLAN_DATE, max_days=1
+        ),
+        u1_tasks,
+        project_priorities=priorities,
+        today=PLAN_DATE,
+    )
+    assert await plans.get_current("u1", PLAN_DATE) == expected
+    assert await plans.get_current("u1", PLAN_DATE + timedelta(days=1)) is None
+
+    await tasks.update("u1", created[0].id, TaskUpdate(estimated_minutes=30))
+    assert await plans.get_current("u1", PLAN_DATE) is None
+    assert await plans.get_current("u2", PLAN_DATE) is not None
+
+    # A plan computed before the write cannot replace a newer one
+    fresh = await service.precompute_user("u1", PLAN_DATE)
+    await plans.save("u1", PLAN_DATE, 0, expected)
+    assert await plans.get_current("u1", PLAN_DATE) == fresh
+
+    assert await plans.delete_before(PLAN_DATE + timedelta(days=1)) == 2
@@ -6,6 +6,7 @@ export interface StreamChunk {
   tool_name?: string;
   tool_args?: Record<string, any>;
   tool_result?: string;
+  /** Text chunks carry a run of characters, not a single character */
   content?: string;
   assistant_message?: string;
   session_id?: string;
@@ -181,7 +181,7 @@ export function useChat() {
               break;
 
             case 'text':
-              // Append text character by character
+              // Append text (coalesced server-side into runs of up to ~64 chars)
               setMessages((prev) =>
                 prev.map((msg) =>
                   msg.id === assistantMessageId